@@ -1,15 +1,11 @@
 """API package for job-search-ai-assistant."""
 
-from collections.abc import Awaitable
-from typing import Callable
-
-from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
 
-from .config import logger, setup_logging
-from .routes import health_router
+from .config import setup_logging
+from .middleware import ErrorHandlingMiddleware, StreamingGZipMiddleware
+from .routes import health_router, metrics_router
 
 
 def create_app() -> FastAPI:
@@ -21,10 +17,15 @@ def create_app() -> FastAPI:
     # Setup logging
     setup_logging()
 
+    # Imported here because they depend on the collectors, which import this package
+    from .lifespan import lifespan
+    from .routes.search import router as search_router
+
     app = FastAPI(
         title="Job Search AI Assistant",
         description="AI-powered job search aggregator across multiple platforms",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     # Add CORS middleware
@@ -36,36 +37,23 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Add Gzip compression
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
-
-    # Error handling middleware
-    @app.middleware("http")
-    async def error_handling_middleware(
-        request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        """Global error handling middleware.
+    # Add Gzip compression, flushing streamed responses chunk by chunk
+    app.add_middleware(StreamingGZipMiddleware, minimum_size=1000)
 
-        Args:
-            request: The incoming request
-            call_next: The next middleware/route handler
-
-        Returns:
-            Response: The API response
-        """
-        try:
-            return await call_next(request)
-        except Exception as e:
-            logger.error(f"Unhandled error: {e}", exc_info=True)
-            return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+    # Error handling middleware, outermost so it also catches errors of the other middleware
+    app.add_middleware(ErrorHandlingMiddleware)
 
     # Create API router
     api_router = APIRouter(prefix="/api/v1")
 
     # Register routers
     api_router.include_router(health_router)
+    api_router.include_router(search_router)
 
     # Register API v1 router
     app.include_router(api_router)
 
+    # Metrics at the root, where Prometheus scrapes them by default
+    app.include_router(metrics_router)
+
     return app
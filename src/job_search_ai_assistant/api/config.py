@@ -1,6 +1,7 @@
 """API configuration module."""
 
 import logging
+import os
 from logging.config import dictConfig
 
 # Logging configuration
@@ -34,3 +35,17 @@ def setup_logging() -> None:
 
 
 logger = logging.getLogger("job_search_ai")
+
+# Database postings found by searches are stored in, e.g. sqlite:///data/jobs.db. If unset,
+# results are not persisted and stored-postings search is unavailable.
+DATABASE_URL = os.getenv("JOB_SEARCH_DATABASE_URL")
+
+# Seconds a search may take; platforms still running by then are left out of the response
+SEARCH_TIMEOUT = float(os.getenv("JOB_SEARCH_TIMEOUT", "60"))
+
+# Seconds between measurements of the event loop lag reported on the metrics endpoint
+LAG_INTERVAL = float(os.getenv("JOB_SEARCH_LAG_INTERVAL", "0.5"))
+
+# Worker processes parsing result pages off the event loop, started with the application. If 0,
+# pages are parsed on the event loop.
+PARSE_WORKERS = int(os.getenv("JOB_SEARCH_PARSE_WORKERS", "0"))
@@ -1,3 +1,36 @@
 """Database operations module."""
 
-# __all__ = []  # Will be populated as we add CRUD operations
+from urllib.parse import urlparse
+
+from .base import JobQuery, JobStore, StoredJob, canonical_job_url, normalize_posted_date
+from .sqlite import SQLiteJobStore, build_match_query
+
+__all__ = [
+    "JobQuery",
+    "JobStore",
+    "SQLiteJobStore",
+    "StoredJob",
+    "build_match_query",
+    "canonical_job_url",
+    "create_job_store",
+    "normalize_posted_date",
+]
+
+
+def create_job_store(database_url: str) -> JobStore:
+    """Create the job store of a database URL.
+
+    Args:
+        database_url: Database URL, e.g. ``sqlite:///data/jobs.db``.
+
+    Returns:
+        JobStore: Store of the database, not yet opened.
+
+    Raises:
+        ValueError: If the database backend is not supported.
+    """
+    parts = urlparse(database_url)
+    if parts.scheme == "sqlite":
+        # sqlite:///relative.db and sqlite:////absolute/path.db as in SQLAlchemy
+        return SQLiteJobStore(parts.path[1:] if parts.path.startswith("/") else parts.path)
+    raise ValueError(f"Unsupported database URL: {database_url}")
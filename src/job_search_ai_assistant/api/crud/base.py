@@ -0,0 +1,257 @@
+"""Storage interface for scraped job postings."""
+
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from types import TracebackType
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from pydantic import BaseModel, Field
+
+from ...collectors.crawl4ai.models import JobPosting, Posting
+
+# Query parameters that track where a click came from rather than identify a posting
+TRACKING_PARAMS = frozenset({"refid", "trackingid", "trk", "position", "pagenum", "ref", "source", "from"})
+
+# Month names in English and in the Ukrainian genitive, as dates are written on the platforms;
+# a name matches by any prefix of at least three letters
+MONTHS = (
+    ("january", "січня"),
+    ("february", "лютого"),
+    ("march", "березня"),
+    ("april", "квітня"),
+    ("may", "травня"),
+    ("june", "червня"),
+    ("july", "липня"),
+    ("august", "серпня"),
+    ("september", "вересня"),
+    ("october", "жовтня"),
+    ("november", "листопада"),
+    ("december", "грудня"),
+)
+
+# Days per unit of a relative date such as "3 days ago" or "2 тижні тому", by unit prefix
+RELATIVE_UNITS = (
+    ("min", 0),
+    ("hour", 0),
+    ("day", 1),
+    ("week", 7),
+    ("month", 30),
+    ("хв", 0),
+    ("год", 0),
+    ("дн", 1),
+    ("день", 1),
+    ("тиж", 7),
+    ("міс", 30),
+)
+
+_ISO_DATE = re.compile(r"\b(\d{4})-(\d{1,2})-(\d{1,2})")
+_NUMERIC_DATE = re.compile(r"\b(\d{1,2})[./](\d{1,2})[./](\d{4})\b")
+_DAY_MONTH = re.compile(r"\b(\d{1,2})\s+([^\W\d_]+)\.?(?:\s+(\d{4}))?")
+_MONTH_DAY = re.compile(r"\b([^\W\d_]+)\.?\s+(\d{1,2})(?:,?\s+(\d{4}))?")
+_RELATIVE = re.compile(r"\b(\d+)\+?\s*([^\W\d_]+).*\b(?:ago|тому)\b")
+
+
+def canonical_job_url(url: str) -> str:
+    """Normalize a posting URL so the same posting found twice maps to one record.
+
+    Args:
+        url: Posting URL.
+
+    Returns:
+        str: URL with lower-case scheme and host, no tracking parameters, sorted query, no fragment
+        and no trailing slash.
+    """
+    parts = urlparse(url)
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    )
+    return urlunparse(
+        parts._replace(
+            scheme=parts.scheme.lower(),
+            netloc=parts.netloc.lower(),
+            path=parts.path.rstrip("/") or "/",
+            query=urlencode(query),
+            fragment="",
+        )
+    )
+
+
+def normalize_posted_date(text: Optional[str], today: date) -> Optional[str]:
+    """Turn the posted date shown on a platform into an ISO date, so stored dates compare in order.
+
+    Args:
+        text: Posted date as extracted: an ISO date or timestamp, a day.month.year date, a date with
+            an English or Ukrainian month name, or a relative date such as "today", "вчора" or
+            "3 days ago".
+        today: Date relative dates count back from. A date without a year is taken as the latest
+            such date not after it.
+
+    Returns:
+        Optional[str]: ISO date, or None if the text holds no recognizable date.
+    """
+    if not text:
+        return None
+    text = text.strip().casefold()
+    for parse in (_numeric_date, _named_month_date, _relative_date):
+        parsed = parse(text, today)
+        if parsed is not None:
+            return parsed.isoformat()
+    return None
+
+
+def _make_date(year: Optional[str], month: int, day: str, today: date) -> Optional[date]:
+    """Build a date, taking a missing year as the latest one that does not put the date after ``today``."""
+    try:
+        if year is not None:
+            return date(int(year), month, int(day))
+        parsed = date(today.year, month, int(day))
+        return parsed if parsed <= today else parsed.replace(year=today.year - 1)
+    except ValueError:
+        return None
+
+
+def _numeric_date(text: str, today: date) -> Optional[date]:
+    """Parse an ISO or a day.month.year date."""
+    if match := _ISO_DATE.search(text):
+        year, month, day = match.groups()
+        return _make_date(year, int(month), day, today)
+    if match := _NUMERIC_DATE.search(text):
+        day, month, year = match.groups()
+        return _make_date(year, int(month), day, today)
+    return None
+
+
+def _month(name: str) -> Optional[int]:
+    """Return the number of a month by a name or an abbreviation of it, or None."""
+    if len(name) < 3:
+        return None
+    for number, names in enumerate(MONTHS, start=1):
+        if any(full.startswith(name) for full in names):
+            return number
+    return None
+
+
+def _named_month_date(text: str, today: date) -> Optional[date]:
+    """Parse a date with a month name, day first as in "15 січня 2024" or month first as in "Jan 15, 2024"."""
+    for match in _DAY_MONTH.finditer(text):
+        day, name, year = match.groups()
+        if month := _month(name):
+            return _make_date(year, month, day, today)
+    for match in _MONTH_DAY.finditer(text):
+        name, day, year = match.groups()
+        if month := _month(name):
+            return _make_date(year, month, day, today)
+    return None
+
+
+def _relative_date(text: str, today: date) -> Optional[date]:
+    """Parse a date relative to today."""
+    if text.startswith(("today", "just now", "сьогодні")):
+        return today
+    if text.startswith(("yesterday", "вчора", "учора")):
+        return today - timedelta(days=1)
+    if match := _RELATIVE.search(text):
+        count, unit = match.groups()
+        for prefix, days in RELATIVE_UNITS:
+            if unit.startswith(prefix):
+                return today - timedelta(days=int(count) * days)
+    return None
+
+
+class StoredJob(JobPosting):
+    """Job posting with the times it was first and last seen."""
+
+    first_seen: datetime = Field(..., description="When the posting was first stored")
+    last_seen: datetime = Field(..., description="When the posting was last found by a search")
+
+
+class JobQuery(BaseModel):
+    """Filters of a stored job lookup."""
+
+    platform: Optional[str] = Field(None, description="Source platform name")
+    location: Optional[str] = Field(None, description="Text the location must contain")
+    posted_since: Optional[date] = Field(None, description="Earliest posted date")
+    seen_since: Optional[datetime] = Field(None, description="Earliest time the posting was last seen")
+    limit: int = Field(100, ge=1, le=1000, description="Maximum number of postings returned")
+    offset: int = Field(0, ge=0, description="Number of postings skipped")
+
+
+class JobStore(ABC):
+    """Persistent store of job postings keyed by canonical URL."""
+
+    @abstractmethod
+    async def open(self) -> None:
+        """Open connections and create the schema if needed."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close all connections."""
+
+    @abstractmethod
+    async def upsert(self, postings: Sequence[Posting]) -> int:
+        """Insert new postings and refresh known ones in one batch.
+
+        Args:
+            postings: Postings found by a search.
+
+        Returns:
+            int: Number of postings written.
+        """
+
+    @abstractmethod
+    async def get(self, url: str) -> Optional[StoredJob]:
+        """Look up a posting by URL.
+
+        Args:
+            url: Posting URL, canonicalized before the lookup.
+
+        Returns:
+            Optional[StoredJob]: Stored posting, or None if unknown.
+        """
+
+    @abstractmethod
+    async def find(self, query: JobQuery) -> list[StoredJob]:
+        """Find stored postings, most recently seen first.
+
+        Args:
+            query: Lookup filters.
+
+        Returns:
+            list[StoredJob]: Matching postings.
+        """
+
+    @abstractmethod
+    async def search(self, text: str, query: JobQuery) -> list[StoredJob]:
+        """Find stored postings containing all words of a text, best matches first.
+
+        Args:
+            text: Search text. Every word must start a word of the title, company, description or
+                requirements, in any case.
+            query: Lookup filters applied along with the text.
+
+        Returns:
+            list[StoredJob]: Matching postings, most relevant first.
+        """
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Return the number of stored postings."""
+
+    async def __aenter__(self) -> "JobStore":
+        """Open the store when used as an async context manager."""
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Close the store when leaving the async context manager."""
+        await self.close()
@@ -0,0 +1,367 @@
+"""SQLite implementation of the job store."""
+
+import asyncio
+import json
+import re
+import sqlite3
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import aiosqlite
+from pydantic import HttpUrl
+
+from ...collectors.crawl4ai.models import Posting
+from ...collectors.salary import SalaryPeriod
+from .base import JobQuery, JobStore, StoredJob, canonical_job_url, normalize_posted_date
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    url TEXT PRIMARY KEY,
+    platform TEXT,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT NOT NULL,
+    -- SQLite folds the case of ASCII letters only, so the location is stored case-folded for filters
+    location_folded TEXT NOT NULL,
+    salary TEXT,
+    salary_min REAL,
+    salary_max REAL,
+    salary_currency TEXT,
+    salary_period TEXT,
+    description TEXT NOT NULL,
+    requirements TEXT NOT NULL,
+    apply_url TEXT,
+    posted_date TEXT,
+    posted_on TEXT,  -- posted_date as an ISO date, so it compares in date order
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_platform ON jobs (platform, last_seen);
+CREATE INDEX IF NOT EXISTS jobs_posted_on ON jobs (posted_on);
+CREATE INDEX IF NOT EXISTS jobs_location ON jobs (location_folded);
+CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen);
+"""
+
+# Full-text index over the searchable columns, reading their text from the jobs table. unicode61
+# folds the case of Cyrillic as well as Latin letters; diacritics are kept so "й" and "ї" are not
+# folded into other letters. Porter stems English words and leaves others as they are, so
+# Ukrainian inflections are left to prefix queries, for which two- and three-letter prefix
+# indexes are kept. "+" and "#" are part of tokens so "c++" and "c#" are searchable.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5 (
+    title, company, description, requirements,
+    content = 'jobs', content_rowid = 'rowid',
+    tokenize = "porter unicode61 remove_diacritics 0 tokenchars '+#'",
+    prefix = '2 3'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, company, description, requirements)
+    VALUES (new.rowid, new.title, new.company, new.description, new.requirements);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description, requirements)
+    VALUES ('delete', old.rowid, old.title, old.company, old.description, old.requirements);
+END;
+-- Re-found postings mostly only move last_seen; re-index only when the searchable text changed
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE ON jobs
+WHEN old.title IS NOT new.title OR old.company IS NOT new.company
+    OR old.description IS NOT new.description OR old.requirements IS NOT new.requirements
+BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description, requirements)
+    VALUES ('delete', old.rowid, old.title, old.company, old.description, old.requirements);
+    INSERT INTO jobs_fts (rowid, title, company, description, requirements)
+    VALUES (new.rowid, new.title, new.company, new.description, new.requirements);
+END;
+"""
+
+# BM25 weights of title, company, description and requirements
+_FTS_WEIGHTS = (10.0, 5.0, 1.0, 3.0)
+
+# Words of a search text, split as the index tokenizer splits them
+_SEARCH_TERM = re.compile(r"[\w+#]+")
+
+# Columns written from a posting, in insert order
+_POSTING_COLUMNS = (
+    "url",
+    "platform",
+    "title",
+    "company",
+    "location",
+    "location_folded",
+    "salary",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "salary_period",
+    "description",
+    "requirements",
+    "apply_url",
+    "posted_date",
+    "posted_on",
+)
+
+# Re-finding a posting refreshes everything but the time it was first seen
+_UPSERT = f"""
+INSERT INTO jobs ({", ".join(_POSTING_COLUMNS)}, first_seen, last_seen)
+VALUES ({", ".join("?" for _ in _POSTING_COLUMNS)}, ?, ?)
+ON CONFLICT (url) DO UPDATE SET
+{", ".join(f"{column} = excluded.{column}" for column in _POSTING_COLUMNS[1:])},
+last_seen = excluded.last_seen
+"""  # noqa: S608 - column names are constants
+
+
+class SQLiteJobStore(JobStore):
+    """Job store on a SQLite database in WAL mode.
+
+    Reads run on a pool of connections so lookups proceed while a batch is written; writes go
+    through a single connection, since SQLite allows one writer at a time.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        pool_size: int = 4,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the store. Connections are opened by ``open``.
+
+        Args:
+            path: Database file. Every connection opens it, so it must not be ``":memory:"``.
+            pool_size: Number of read connections.
+            clock: Wall clock in seconds, used for first and last seen times.
+        """
+        self.path = Path(path)
+        self.pool_size = pool_size
+        self._clock = clock
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._connections: list[aiosqlite.Connection] = []
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a connection with the pragmas every connection needs."""
+        conn = await aiosqlite.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        await conn.execute("PRAGMA busy_timeout=5000")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        self._connections.append(conn)
+        return conn
+
+    async def open(self) -> None:
+        """Open the writer and the read pool, creating the database and schema if needed."""
+        if self._writer is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        writer = await self._connect()
+        await writer.execute("PRAGMA journal_mode=WAL")
+        await writer.executescript(_SCHEMA + _FTS_SCHEMA)
+        await writer.commit()
+        for _ in range(self.pool_size):
+            self._readers.put_nowait(await self._connect())
+        self._writer = writer
+
+    async def close(self) -> None:
+        """Close all connections."""
+        for conn in self._connections:
+            await conn.close()
+        self._connections.clear()
+        self._readers = asyncio.Queue()
+        self._writer = None
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read connection from the pool."""
+        if self._writer is None:
+            raise RuntimeError("SQLiteJobStore is not open")
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
+    async def upsert(self, postings: Sequence[Posting]) -> int:
+        """Insert new postings and refresh known ones in one transaction.
+
+        Args:
+            postings: Postings found by a search.
+
+        Returns:
+            int: Number of postings written.
+        """
+        if self._writer is None:
+            raise RuntimeError("SQLiteJobStore is not open")
+        now = self._clock()
+        # A batch may hold the same posting twice under different tracking parameters
+        rows: dict[str, tuple[Any, ...]] = {}
+        today = datetime.fromtimestamp(now, timezone.utc).date()
+        for posting in postings:
+            row = _to_row(posting, today)
+            rows[row[0]] = (*row, now, now)
+        async with self._write_lock:
+            await self._writer.executemany(_UPSERT, rows.values())
+            await self._writer.commit()
+        return len(rows)
+
+    async def get(self, url: str) -> Optional[StoredJob]:
+        """Look up a posting by URL.
+
+        Args:
+            url: Posting URL, canonicalized before the lookup.
+
+        Returns:
+            Optional[StoredJob]: Stored posting, or None if unknown.
+        """
+        async with (
+            self._reader() as conn,
+            conn.execute("SELECT * FROM jobs WHERE url = ?", (canonical_job_url(url),)) as cursor,
+        ):
+            row = await cursor.fetchone()
+        return None if row is None else _from_row(row)
+
+    async def find(self, query: JobQuery) -> list[StoredJob]:
+        """Find stored postings, most recently seen first.
+
+        Args:
+            query: Lookup filters.
+
+        Returns:
+            list[StoredJob]: Matching postings.
+        """
+        conditions, params = _conditions(query)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"SELECT * FROM jobs {where} ORDER BY last_seen DESC, url LIMIT ? OFFSET ?"  # noqa: S608
+        async with self._reader() as conn, conn.execute(sql, (*params, query.limit, query.offset)) as cursor:
+            rows = await cursor.fetchall()
+        return [_from_row(row) for row in rows]
+
+    async def search(self, text: str, query: JobQuery) -> list[StoredJob]:
+        """Find stored postings containing all words of a text, best matches first.
+
+        Args:
+            text: Search text. Every word must start a word of the title, company, description or
+                requirements, in any case.
+            query: Lookup filters applied along with the text.
+
+        Returns:
+            list[StoredJob]: Matching postings ranked by BM25, title matches weighing most.
+        """
+        match = build_match_query(text)
+        if not match:
+            return []
+        conditions, params = _conditions(query, table="jobs")
+        where = " AND ".join(["jobs_fts MATCH ?", *conditions])
+        weights = ", ".join(str(weight) for weight in _FTS_WEIGHTS)
+        sql = f"""
+        SELECT jobs.* FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid
+        WHERE {where}
+        ORDER BY bm25(jobs_fts, {weights}), jobs.last_seen DESC
+        LIMIT ? OFFSET ?
+        """  # noqa: S608 - conditions and weights are constants
+        async with self._reader() as conn, conn.execute(sql, (match, *params, query.limit, query.offset)) as cursor:
+            rows = await cursor.fetchall()
+        return [_from_row(row) for row in rows]
+
+    async def count(self) -> int:
+        """Return the number of stored postings."""
+        async with self._reader() as conn, conn.execute("SELECT COUNT(*) FROM jobs") as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else 0
+
+
+def build_match_query(text: str) -> str:
+    """Build an FTS5 query matching postings that contain every word of a text as a prefix.
+
+    Words are quoted, so FTS5 operators and punctuation in the text are taken literally.
+
+    Args:
+        text: Search text.
+
+    Returns:
+        str: FTS5 query, empty if the text has no words.
+    """
+    return " AND ".join(f'"{term}"*' for term in _SEARCH_TERM.findall(text))
+
+
+def _conditions(query: JobQuery, table: str = "") -> tuple[list[str], list[Any]]:
+    """Build the WHERE conditions and parameters of the lookup filters.
+
+    Args:
+        query: Lookup filters.
+        table: Table name to qualify the columns with, if joined.
+
+    Returns:
+        tuple[list[str], list[Any]]: Conditions to join with AND, and their parameters.
+    """
+    prefix = f"{table}." if table else ""
+    conditions = []
+    params: list[Any] = []
+    if query.platform:
+        conditions.append(f"{prefix}platform = ?")
+        params.append(query.platform)
+    if query.location:
+        conditions.append(f"{prefix}location_folded LIKE ? ESCAPE '\\'")
+        params.append(f"%{_escape_like(query.location.casefold())}%")
+    if query.posted_since:
+        conditions.append(f"{prefix}posted_on >= ?")
+        params.append(query.posted_since.isoformat())
+    if query.seen_since:
+        conditions.append(f"{prefix}last_seen >= ?")
+        params.append(query.seen_since.timestamp())
+    return conditions, params
+
+
+def _escape_like(text: str) -> str:
+    """Escape the LIKE wildcards of a text, so it matches literally with ``ESCAPE '\\'``.
+
+    Args:
+        text: Text to search for.
+
+    Returns:
+        str: Text with ``%``, ``_`` and the escape character itself escaped.
+    """
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _to_row(posting: Posting, today: date) -> tuple[Any, ...]:
+    """Convert a posting to the values of ``_POSTING_COLUMNS``, relative posted dates counting back from ``today``."""
+    return (
+        canonical_job_url(str(posting.url)),
+        posting.platform,
+        posting.title,
+        posting.company,
+        posting.location,
+        posting.location.casefold(),
+        posting.salary,
+        posting.salary_min,
+        posting.salary_max,
+        posting.salary_currency,
+        posting.salary_period.value if posting.salary_period else None,
+        posting.description,
+        json.dumps(posting.requirements, ensure_ascii=False),
+        str(posting.apply_url) if posting.apply_url else None,
+        posting.posted_date,
+        normalize_posted_date(posting.posted_date, today),
+    )
+
+
+def _from_row(row: sqlite3.Row) -> StoredJob:
+    """Convert a database row to a stored posting.
+
+    Rows were written from validated postings, so the posting is built without validating it
+    again; only the values stored as text are converted back to their types.
+    """
+    data = dict(row)
+    del data["location_folded"], data["posted_on"]
+    data["url"] = HttpUrl(data["url"])
+    if data["apply_url"] is not None:
+        data["apply_url"] = HttpUrl(data["apply_url"])
+    if data["salary_period"] is not None:
+        data["salary_period"] = SalaryPeriod(data["salary_period"])
+    data["requirements"] = json.loads(data["requirements"])
+    data["first_seen"] = datetime.fromtimestamp(data["first_seen"], timezone.utc)
+    data["last_seen"] = datetime.fromtimestamp(data["last_seen"], timezone.utc)
+    return StoredJob.model_construct(**data)
@@ -0,0 +1,49 @@
+"""Application lifespan: resources shared by all requests."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI
+
+from ..collectors.crawl4ai.client import JobScraperClient
+from ..collectors.crawl4ai.parsing import ParserPool
+from ..collectors.orchestrator import SearchOrchestrator
+from . import config
+from .crud import JobStore, create_job_store
+from .metrics import REGISTRY, monitor_event_loop_lag
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the scraper client, job store and search orchestrator, and close them on shutdown.
+
+    Browsers are launched by the first scrape rather than here, so the application starts without
+    waiting for them. Parser workers, if configured, are started here so no page waits for them.
+    The metrics of the client and orchestrator are registered for the metrics endpoint, along with
+    the lag of the event loop.
+
+    Args:
+        app: FastAPI application; the orchestrator is set as ``app.state.orchestrator``.
+    """
+    async with AsyncExitStack() as stack:
+        client = JobScraperClient(parser_pool=ParserPool(config.PARSE_WORKERS) if config.PARSE_WORKERS else None)
+        stack.push_async_callback(client.close)
+        if client.parser_pool is not None:
+            await client.parser_pool.start()
+        store: Optional[JobStore] = None
+        if config.DATABASE_URL:
+            store = await stack.enter_async_context(create_job_store(config.DATABASE_URL))
+        orchestrator = app.state.orchestrator = SearchOrchestrator(client, store=store)
+        # Compiled together on the first scrape, not here, so startup does not import crawl4ai
+        client.strategies.register(adapter.get_extraction_config() for adapter in orchestrator.adapters.values())
+
+        REGISTRY.add_collector(client.metrics)
+        stack.callback(REGISTRY.remove_collector, client.metrics)
+        REGISTRY.register(orchestrator.latency)
+        stack.callback(REGISTRY.unregister, orchestrator.latency)
+
+        lag_monitor = asyncio.create_task(monitor_event_loop_lag(config.LAG_INTERVAL))
+        stack.callback(lag_monitor.cancel)
+        yield
@@ -0,0 +1,312 @@
+"""In-process metrics of the search service, exposed in the Prometheus text format."""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Callable, ClassVar, Optional
+
+# Upper bounds in seconds of platform search latency buckets
+LATENCY_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Upper bounds in seconds of crawl stage and request latency buckets
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Upper bounds in seconds of event loop lag buckets
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# A sample: name suffix, label values and value
+Sample = tuple[str, tuple[tuple[str, str], ...], float]
+
+
+class Histogram:
+    """Counts of observed values per bucket, each bucket holding values up to its upper bound."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            buckets: Upper bounds of the buckets. Larger values are counted in an overflow bucket.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Count a value in its bucket.
+
+        Args:
+            value: Observed value.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def format(self) -> str:
+        """Format the bucket counts for a log line, e.g. ``<=0.5:0 <=1:3 ... >60:0``."""
+        labels = [f"<={bound:g}" for bound in self.buckets] + [f">{self.buckets[-1]:g}"]
+        return " ".join(f"{label}:{count}" for label, count in zip(labels, self.counts))
+
+
+class Metric(ABC):
+    """Named metric with one series per combination of label values."""
+
+    type: ClassVar[str]
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name.
+            documentation: Help text.
+            labelnames: Names of the labels identifying a series, in the order values are passed.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _labels(self, values: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        """Pair label values with the label names."""
+        return tuple(zip(self.labelnames, values))
+
+    @abstractmethod
+    def samples(self) -> Iterator[Sample]:
+        """Yield the current samples of every series."""
+
+
+class Counter(Metric):
+    """Monotonically increasing count per series."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize the counter with no series."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Increase the series of the label values.
+
+        Args:
+            labels: Label values, in the order of ``labelnames``.
+            amount: Amount to add.
+        """
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Return the count of the series of the label values."""
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield the count of every series."""
+        for labels, value in self._values.items():
+            yield "_total", self._labels(labels), value
+
+
+class Gauge(Metric):
+    """Value per series that can go up and down."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize the gauge with no series."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        """Set the series of the label values.
+
+        Args:
+            value: New value.
+            labels: Label values, in the order of ``labelnames``.
+        """
+        self._values[labels] = value
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield the value of every series."""
+        for labels, value in self._values.items():
+            yield "", self._labels(labels), value
+
+
+class HistogramFamily(Metric):
+    """Histogram per series."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = STAGE_BUCKETS,
+    ) -> None:
+        """Initialize the family with no series.
+
+        Args:
+            name: Metric name.
+            documentation: Help text.
+            labelnames: Names of the labels identifying a series.
+            buckets: Upper bounds of the buckets of every series.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._children: dict[tuple[str, ...], Histogram] = {}
+
+    def labels(self, *labels: str) -> Histogram:
+        """Return the histogram of the label values, creating it if needed.
+
+        Hot paths may keep the returned histogram to skip the lookup.
+        """
+        child = self._children.get(labels)
+        if child is None:
+            child = self._children[labels] = Histogram(self.buckets)
+        return child
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Count a value in the histogram of the label values.
+
+        Args:
+            value: Observed value.
+            labels: Label values, in the order of ``labelnames``.
+        """
+        self.labels(*labels).observe(value)
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield the cumulative bucket counts, sum and count of every series."""
+        for labels, child in self._children.items():
+            pairs = self._labels(labels)
+            cumulative = 0
+            for bound, count in zip((*child.buckets, float("inf")), child.counts):
+                cumulative += count
+                yield "_bucket", (*pairs, ("le", _format_value(bound))), cumulative
+            yield "_sum", pairs, child.sum
+            yield "_count", pairs, child.count
+
+
+class MetricsRegistry:
+    """Metrics rendered together on the metrics endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], Iterable[Metric]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric.
+
+        Args:
+            metric: Metric to render.
+
+        Returns:
+            Metric: The metric, for use as a module-level constant.
+
+        Raises:
+            ValueError: If a metric of the same name is registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, metric: Metric) -> None:
+        """Remove a metric."""
+        if self._metrics.get(metric.name) is metric:
+            del self._metrics[metric.name]
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        counter = Counter(name, documentation, labelnames)
+        self.register(counter)
+        return counter
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        gauge = Gauge(name, documentation, labelnames)
+        self.register(gauge)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = STAGE_BUCKETS,
+    ) -> HistogramFamily:
+        """Create and register a histogram family."""
+        histogram = HistogramFamily(name, documentation, labelnames, buckets)
+        self.register(histogram)
+        return histogram
+
+    def add_collector(self, collector: Callable[[], Iterable[Metric]]) -> None:
+        """Add a function building metrics when they are rendered, e.g. from the state of a pool.
+
+        Args:
+            collector: Function returning the metrics to render.
+        """
+        self._collectors.append(collector)
+
+    def remove_collector(self, collector: Callable[[], Iterable[Metric]]) -> None:
+        """Remove a collector added by ``add_collector``."""
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def collect(self) -> list[Metric]:
+        """Return the registered metrics and those built by the collectors."""
+        metrics = list(self._metrics.values())
+        for collector in self._collectors:
+            metrics.extend(collector())
+        return metrics
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in self.collect():
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation, help_text=True)}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for suffix, labels, value in metric.samples():
+                label_text = ",".join(f'{name}="{_escape(label)}"' for name, label in labels)
+                series = f"{metric.name}{suffix}{{{label_text}}}" if label_text else f"{metric.name}{suffix}"
+                lines.append(f"{series} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(text: str, help_text: bool = False) -> str:
+    """Escape a label value or help text."""
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+    return text if help_text else text.replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value or bucket bound."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+REGISTRY = MetricsRegistry()
+
+EVENT_LOOP_LAG = REGISTRY.histogram(
+    "jobsearch_event_loop_lag_seconds",
+    "Delay of a timer on the event loop past its due time",
+    buckets=LAG_BUCKETS,
+)
+
+
+async def monitor_event_loop_lag(interval: float = 0.5, histogram: Optional[HistogramFamily] = None) -> None:
+    """Measure how late the event loop wakes a timer, until cancelled.
+
+    A timer firing late means callbacks ran for that long without yielding, e.g. parsing HTML.
+
+    Args:
+        interval: Seconds between measurements.
+        histogram: Histogram receiving the lag. If None, ``EVENT_LOOP_LAG`` is used.
+    """
+    lag = (histogram or EVENT_LOOP_LAG).labels()
+    while True:
+        due = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lag.observe(max(time.perf_counter() - due, 0.0))
@@ -0,0 +1,142 @@
+"""ASGI middleware of the API."""
+
+import zlib
+from typing import Optional, cast
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import logger
+
+
+class ErrorHandlingMiddleware:
+    """Global error handler: logs unhandled exceptions and answers with a 500 JSON body.
+
+    A plain ASGI middleware rather than ``@app.middleware("http")``, whose ``BaseHTTPMiddleware``
+    runs every request in an extra task and copies response bodies through a memory stream.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Application to wrap.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request, replacing an unhandled exception with a 500 response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as e:
+            logger.error(f"Unhandled error: {e}", exc_info=True)
+            if response_started:
+                # Part of the response is already out; the server has to abort the connection
+                raise
+            response = JSONResponse(status_code=500, content={"detail": "Internal server error"})
+            await response(scope, receive, send)
+
+
+class _GZipSend:
+    """Send channel of one response that gzips the body, flushing the compressor after every chunk."""
+
+    def __init__(self, send: Send, minimum_size: int, compresslevel: int) -> None:
+        self.send = send
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        # Response start, held back until the first body chunk shows whether to compress
+        self.start: Optional[Message] = None
+        self.compressor: Optional[zlib._Compress] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        """Send a message, compressing body chunks."""
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            # Server-sent events are left uncompressed, as in Starlette's middleware
+            self.passthrough = "content-encoding" in headers or headers.get("content-type", "").startswith(
+                "text/event-stream"
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+        body, more_body = message.get("body", b""), message.get("more_body", False)
+        if self.start is not None:
+            body = await self._send_start(body, more_body)
+        elif self.compressor is not None:
+            body = self._compress(body, more_body)
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _send_start(self, body: bytes, more_body: bool) -> bytes:
+        """Send the held response start, with gzip headers unless the whole body is below the minimum size.
+
+        Returns:
+            bytes: First body chunk to send, compressed if the response is.
+        """
+        start, self.start = cast(Message, self.start), None
+        if more_body or len(body) >= self.minimum_size:
+            self.compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            body = self._compress(body, more_body)
+            headers = MutableHeaders(raw=list(start["headers"]))
+            headers["Content-Encoding"] = "gzip"
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(body))
+            start = {**start, "headers": headers.raw}
+        await self.send(start)
+        return body
+
+    def _compress(self, body: bytes, more_body: bool) -> bytes:
+        """Compress a body chunk, ending with a sync flush if more chunks follow.
+
+        A sync flush ends the deflate block, so everything sent so far can be decoded.
+        """
+        compressor = cast("zlib._Compress", self.compressor)
+        return compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH)
+
+
+class StreamingGZipMiddleware:
+    """Gzip middleware that does not hold back chunks of streamed responses.
+
+    Starlette's middleware leaves streamed chunks in the compressor until it has enough data for a
+    block, so a client reading NDJSON would only see postings once kilobytes had piled up. This one
+    works on the send channel alone, without depending on Starlette's responder internals.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 9) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: Application to wrap.
+            minimum_size: Smallest body in bytes compressed when sent in one chunk.
+            compresslevel: Gzip compression level from 1 to 9.
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Compress the response if the client accepts gzip."""
+        if scope["type"] != "http" or b"gzip" not in dict(scope["headers"]).get(b"accept-encoding", b""):
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _GZipSend(send, self.minimum_size, self.compresslevel))
@@ -1,5 +1,6 @@
 """API route handlers."""
 
 from .health import router as health_router
+from .metrics import router as metrics_router
 
-__all__ = ["health_router"]
+__all__ = ["health_router", "metrics_router"]
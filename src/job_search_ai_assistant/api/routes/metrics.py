@@ -0,0 +1,19 @@
+"""Metrics endpoint scraped by Prometheus."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..metrics import CONTENT_TYPE, REGISTRY
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Render the service metrics in the Prometheus text format.
+
+    Returns:
+        PlainTextResponse: Crawl stage latencies, page and posting counts, LLM fallbacks, scraping
+        errors, browser pool utilization, cache hit rates and event loop lag.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,163 @@
+"""Job search endpoints."""
+
+from collections.abc import AsyncIterator
+from typing import Annotated, Optional, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from ...collectors.orchestrator import SearchOrchestrator, to_job_listing
+from .. import config
+from ..crud import JobQuery
+from ..schemas.search import JobListing, SearchRequest, SearchResponse, SearchSummary
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def get_orchestrator(request: Request) -> SearchOrchestrator:
+    """Return the search orchestrator created by the application lifespan."""
+    return request.app.state.orchestrator
+
+
+Orchestrator = Annotated[SearchOrchestrator, Depends(get_orchestrator)]
+
+
+def json_response(response: SearchResponse) -> Response:
+    """Serialize a search response as it is.
+
+    FastAPI would dump a returned model and validate the result against ``response_model`` again,
+    every listing included; the listings were built from validated postings, so that is skipped.
+    ``response_model`` is still declared on the routes for the OpenAPI schema.
+    """
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@router.post("/", response_model=SearchResponse)
+async def search_jobs(search: SearchRequest, orchestrator: Orchestrator) -> Response:
+    """Search the requested platforms for jobs.
+
+    Platforms are searched concurrently; those that fail or do not finish within the search
+    timeout are left out of the results.
+
+    Args:
+        search: Search request.
+        orchestrator: Search orchestrator.
+
+    Returns:
+        Response: ``SearchResponse`` with the job listings found on all platforms.
+
+    Raises:
+        HTTPException: 400 if an unknown platform is requested.
+    """
+    try:
+        orchestrator.resolve_platforms(search.platforms)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return json_response(await orchestrator.search(search, timeout=config.SEARCH_TIMEOUT))
+
+
+@router.get("/", response_model=SearchResponse)
+async def search_stored_jobs(  # noqa: PLR0913
+    orchestrator: Orchestrator,
+    q: Annotated[str, Query(min_length=1, description="Words every posting must contain, as prefixes")],
+    platform: Annotated[Optional[str], Query(description="Platform to search, all if omitted")] = None,
+    location: Annotated[Optional[str], Query(description="Text the location must contain")] = None,
+    limit: Annotated[int, Query(ge=1, le=1000, description="Maximum number of jobs returned")] = 50,
+    offset: Annotated[int, Query(ge=0, description="Number of jobs skipped")] = 0,
+) -> Response:
+    """Search postings stored by earlier searches, best matches first, without crawling.
+
+    Args:
+        orchestrator: Search orchestrator.
+        q: Search text.
+        platform: Platform key to restrict the search to.
+        location: Location filter.
+        limit: Maximum number of jobs returned.
+        offset: Number of jobs skipped.
+
+    Returns:
+        Response: ``SearchResponse`` with the stored job listings ranked by relevance.
+
+    Raises:
+        HTTPException: 400 if the platform is unknown, 503 if no job store is configured.
+    """
+    if orchestrator.store is None:
+        raise HTTPException(status_code=503, detail="No job store is configured")
+    query = JobQuery(location=location, limit=limit, offset=offset)
+    platforms = list(orchestrator.adapters)
+    if platform is not None:
+        adapter = orchestrator.adapters.get(platform.lower())
+        if adapter is None:
+            raise HTTPException(status_code=400, detail=f"Unknown platform: {platform}")
+        query.platform = adapter.config.name
+        platforms = [platform.lower()]
+    stored = await orchestrator.store.search(q, query)
+    jobs = [to_job_listing(job, orchestrator.platform_key(job.platform)) for job in stored]
+    return json_response(SearchResponse(jobs=jobs, total_count=len(jobs), query=q, platforms=platforms))
+
+
+def format_event(event: Union[JobListing, SearchSummary], sse: bool) -> str:
+    """Encode a streamed search event as an NDJSON line or a server-sent event.
+
+    Args:
+        event: Job listing, or the summary ending the stream.
+        sse: Whether to encode as a server-sent event.
+
+    Returns:
+        str: ``{"event": "job", "data": {...}}`` line, or ``event: job`` and ``data:`` SSE fields;
+        the event name is ``summary`` for the summary.
+    """
+    name = "summary" if isinstance(event, SearchSummary) else "job"
+    data = event.model_dump_json()
+    if sse:
+        return f"event: {name}\ndata: {data}\n\n"
+    return f'{{"event": "{name}", "data": {data}}}\n'
+
+
+async def _encode(events: AsyncIterator[Union[JobListing, SearchSummary]], sse: bool) -> AsyncIterator[str]:
+    """Encode the events of a streamed search."""
+    async for event in events:
+        yield format_event(event, sse)
+
+
+@router.post(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}, SSE_MEDIA_TYPE: {}}}},
+)
+async def stream_search_jobs(
+    search: SearchRequest,
+    orchestrator: Orchestrator,
+    accept: Annotated[str, Header()] = NDJSON_MEDIA_TYPE,
+) -> StreamingResponse:
+    """Search the requested platforms, streaming job listings as each page is extracted.
+
+    Listings are sent as NDJSON, or as server-sent events if the client accepts
+    ``text/event-stream``. The stream ends with a summary event holding the total count and the
+    outcome and timing of every platform.
+
+    Args:
+        search: Search request.
+        orchestrator: Search orchestrator.
+        accept: Accept header choosing the encoding.
+
+    Returns:
+        StreamingResponse: Stream of ``job`` events followed by one ``summary`` event.
+
+    Raises:
+        HTTPException: 400 if an unknown platform is requested.
+    """
+    try:
+        orchestrator.resolve_platforms(search.platforms)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    sse = SSE_MEDIA_TYPE in accept
+    return StreamingResponse(
+        _encode(orchestrator.stream(search, timeout=config.SEARCH_TIMEOUT), sse),
+        media_type=SSE_MEDIA_TYPE if sse else NDJSON_MEDIA_TYPE,
+        # Ask proxies not to buffer the stream either
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
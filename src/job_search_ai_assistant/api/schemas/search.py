@@ -19,7 +19,7 @@ class SearchFilters(BaseModel):
     # Core search fields
     keywords: Optional[list[str]] = Field(None, description="List of search keywords (e.g., ['python', 'fastapi'])")
     location: Optional[str] = Field(None, description="Job location filter")
-    salary_range: Optional[SalaryRange] = Field(None, description="Target salary range")
+    salary_range: Optional[SalaryRange] = Field(None, description="Target annual salary range")
     remote: Optional[bool] = Field(None, description="Remote work filter")
     experience_level: Optional[str] = Field(
         None, description="Experience level filter", examples=["entry", "mid", "senior", "lead"]
@@ -27,8 +27,8 @@ class SearchFilters(BaseModel):
     job_type: Optional[str] = Field(
         None, description="Job type filter", examples=["full-time", "part-time", "contract", "internship"]
     )
-    salary_min: Optional[float] = Field(None, description="Minimum salary filter")
-    salary_max: Optional[float] = Field(None, description="Maximum salary filter")
+    salary_min: Optional[float] = Field(None, description="Minimum monthly salary filter")
+    salary_max: Optional[float] = Field(None, description="Maximum monthly salary filter")
 
     class Config:
         """Pydantic model configuration."""
@@ -136,3 +136,34 @@ class SearchResponse(BaseModel):
                 "platforms": ["linkedin", "dou"],
             }
         }
+
+
+class PlatformStatus(BaseModel):
+    """Outcome of one platform in a streamed search."""
+
+    platform: str = Field(..., description="Platform key")
+    count: int = Field(..., ge=0, description="Number of jobs found on the platform")
+    error: Optional[str] = Field(None, description="Error description if the platform failed or timed out")
+    elapsed: float = Field(..., ge=0, description="Time spent on the platform in seconds")
+
+
+class SearchSummary(BaseModel):
+    """Final event of a streamed search, sent after all job listings."""
+
+    total_count: int = Field(..., ge=0, description="Total number of jobs streamed")
+    query: str = Field(..., description="Original search query")
+    platforms: list[PlatformStatus] = Field(..., description="Outcome of each searched platform")
+
+    class Config:
+        """Pydantic model configuration."""
+
+        json_schema_extra: ClassVar[dict[str, Any]] = {
+            "example": {
+                "total_count": 1,
+                "query": "backend developer",
+                "platforms": [
+                    {"platform": "linkedin", "count": 1, "error": None, "elapsed": 4.2},
+                    {"platform": "dou", "count": 0, "error": "Timed out after 60s", "elapsed": 60.0},
+                ],
+            }
+        }
@@ -0,0 +1,206 @@
+"""Per-platform circuit breakers that fail fast while a platform is down."""
+
+import time
+from collections.abc import AsyncIterator
+from enum import Enum
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel, Field
+
+from ...api.config import logger
+from .exceptions import CircuitOpenError, ScrapingError
+
+# Failures that say the platform itself is unhealthy, as opposed to e.g. invalid input or this
+# process running out of browsers (POOL_EXHAUSTED)
+TRIPPING_ERRORS = frozenset({"NETWORK_ERROR", "EXTRACTION_ERROR"})
+
+
+class CircuitBreakerConfig(BaseModel):
+    """Configuration for platform circuit breakers."""
+
+    failure_threshold: int = Field(3, ge=1, description="Consecutive failures that open the circuit")
+    cooldown: float = Field(60.0, gt=0, description="Seconds the circuit stays open before a probe is allowed")
+
+
+class BreakerState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"  # Requests pass through
+    OPEN = "open"  # Requests fail fast
+    HALF_OPEN = "half_open"  # A single probe request is let through
+
+
+class CircuitBreaker:
+    """Circuit breaker of a single platform."""
+
+    def __init__(
+        self,
+        name: str,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed circuit breaker.
+
+        Args:
+            name: Platform name.
+            config: Breaker configuration. If None, uses default settings.
+            clock: Monotonic time source in seconds.
+        """
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state, moving from open to half-open once the cooldown has passed."""
+        if self._opened_at is None:
+            return BreakerState.CLOSED
+        if self._clock() - self._opened_at < self.config.cooldown:
+            return BreakerState.OPEN
+        return BreakerState.HALF_OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed, 0 if requests may pass now."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.config.cooldown - self._clock())
+
+    def allows_request(self) -> bool:
+        """Whether a request would currently be let through, without reserving it."""
+        state = self.state
+        return state is BreakerState.CLOSED or (state is BreakerState.HALF_OPEN and not self._probing)
+
+    def before_request(self) -> None:
+        """Admit a request, reserving the probe slot when half-open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is already in flight.
+        """
+        state = self.state
+        if state is BreakerState.CLOSED:
+            return
+        if state is BreakerState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        raise CircuitOpenError(
+            message=f"{self.name} is unavailable, retry in {self.retry_after:.0f}s",
+            details={"platform": self.name, "state": state.value, "retry_after": self.retry_after},
+        )
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self._opened_at is not None:
+            logger.info(f"Circuit of {self.name} closed")
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self, error: BaseException) -> None:
+        """Count a failed request, opening the circuit when the platform looks down.
+
+        Args:
+            error: Exception raised by the request.
+        """
+        probing, self._probing = self._probing, False
+        if not (isinstance(error, ScrapingError) and error.error_type in TRIPPING_ERRORS):
+            return
+        self._failures += 1
+        if probing or (self._opened_at is None and self._failures >= self.config.failure_threshold):
+            logger.warning(f"Circuit of {self.name} opened after {self._failures} failures: {error}")
+            self._opened_at = self._clock()
+
+    def release(self) -> None:
+        """Give back a probe slot of a request that ended without an outcome, e.g. when cancelled."""
+        self._probing = False
+
+    async def guard(self, pages: Callable[[], AsyncIterator[Any]]) -> AsyncIterator[Any]:
+        """Run a crawl through the breaker.
+
+        Args:
+            pages: Callable returning the async iterator of crawled pages.
+
+        Yields:
+            Pages of the crawl.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        self.before_request()
+        completed = False
+        try:
+            async for page in pages():
+                yield page
+            completed = True
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        finally:
+            if completed:
+                self.record_success()
+            else:
+                self.release()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the breaker state to dictionary format.
+
+        Returns:
+            Dictionary containing the state, consecutive failures and seconds until the next probe.
+        """
+        return {
+            "state": self.state.value,
+            "failures": self._failures,
+            "retry_after": self.retry_after,
+        }
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers keyed by platform name."""
+
+    def __init__(
+        self,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            config: Configuration of every breaker. If None, uses default settings.
+            clock: Monotonic time source in seconds.
+        """
+        self.config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, platform: str) -> CircuitBreaker:
+        """Return the breaker of a platform, creating it on first use.
+
+        Args:
+            platform: Platform name.
+
+        Returns:
+            CircuitBreaker: Breaker of the platform.
+        """
+        breaker = self._breakers.get(platform)
+        if breaker is None:
+            breaker = self._breakers[platform] = CircuitBreaker(platform, self.config, self._clock)
+        return breaker
+
+    def is_open(self, platform: str) -> bool:
+        """Whether requests to a platform are currently rejected.
+
+        Args:
+            platform: Platform name.
+
+        Returns:
+            bool: True if the platform's circuit would reject a request now.
+        """
+        breaker = self._breakers.get(platform)
+        return breaker is not None and not breaker.allows_request()
+
+    def states(self) -> dict[str, dict[str, Any]]:
+        """Return the state of every breaker keyed by platform name."""
+        return {name: breaker.to_dict() for name, breaker in self._breakers.items()}
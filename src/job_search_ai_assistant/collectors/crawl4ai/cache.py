@@ -0,0 +1,300 @@
+"""In-memory TTL cache for crawl results."""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable
+from enum import Enum
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from pydantic import BaseModel, Field
+
+from ...api.config import logger
+from ..platforms.base import PlatformConfig
+
+Pages = list[list[dict[str, Any]]]
+
+
+class CachePolicy(BaseModel):
+    """How long crawl results of a search may be reused."""
+
+    ttl: float = Field(0.0, ge=0, description="Seconds a result is served as fresh; 0 disables caching")
+    stale_ttl: float = Field(0.0, ge=0, description="Seconds after expiry a result is served while it is refreshed")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results may be cached at all."""
+        return self.ttl > 0
+
+    @classmethod
+    def from_platform(cls, config: PlatformConfig) -> "CachePolicy":
+        """Build the cache policy declared by a platform configuration.
+
+        Args:
+            config: Platform configuration.
+
+        Returns:
+            CachePolicy: Cache policy of the platform.
+        """
+        return cls(ttl=config.cache_ttl or 0.0, stale_ttl=config.cache_stale_ttl or 0.0)
+
+
+class CacheState(str, Enum):
+    """Freshness of a cache lookup."""
+
+    FRESH = "fresh"
+    STALE = "stale"
+    MISS = "miss"
+
+
+class CacheStats:
+    """Hit and miss counters of a cache."""
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        """Convert the counters to dictionary format.
+
+        Returns:
+            Dictionary containing all counters and the hit rate.
+        """
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "refreshes": self.refreshes,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class _Entry:
+    """Cached pages with their expiry times."""
+
+    __slots__ = ("fresh_until", "pages", "size", "stale_until")
+
+    def __init__(self, pages: Pages, fresh_until: float, stale_until: float) -> None:
+        self.pages = pages
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+        self.size = sum(len(page) for page in pages)
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a search URL so equivalent searches share a cache key.
+
+    Args:
+        url: Search URL.
+
+    Returns:
+        str: URL with lower-case scheme and host, sorted query and no fragment.
+    """
+    parts = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunparse(
+        parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower(), query=query, fragment="")
+    )
+
+
+def config_hash(*configs: Any) -> str:
+    """Hash extraction related configuration into a short stable digest.
+
+    Args:
+        configs: JSON-serializable configuration values.
+
+    Returns:
+        str: Hex digest of the configuration.
+    """
+    payload = json.dumps(configs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class CrawlCache:
+    """LRU cache of crawled result pages with per-entry TTL and stale-while-revalidate."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_items: int = 50_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached searches.
+            max_items: Maximum number of cached postings across all searches.
+            clock: Monotonic time source in seconds.
+        """
+        self.max_entries = max_entries
+        self.max_items = max_items
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str, str], _Entry] = OrderedDict()
+        self._items = 0
+        self._refreshing: dict[tuple[str, str, str], asyncio.Task[None]] = {}
+
+    @staticmethod
+    def key(platform: str, url: str, *configs: Any) -> tuple[str, str, str]:
+        """Build the cache key of a search.
+
+        Args:
+            platform: Platform name.
+            url: Search URL.
+            configs: Extraction related configuration (extraction config, pagination, strategy).
+
+        Returns:
+            tuple[str, str, str]: Platform, canonical URL and configuration hash.
+        """
+        return platform, canonical_url(url), config_hash(*configs)
+
+    def __len__(self) -> int:
+        """Return the number of cached searches."""
+        return len(self._entries)
+
+    def get(self, key: tuple[str, str, str]) -> tuple[Optional[Pages], CacheState]:
+        """Look up cached pages and update the counters.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            tuple[Optional[Pages], CacheState]: Cached pages (None on a miss) and their freshness.
+        """
+        entry = self._entries.get(key)
+        now = self._clock()
+        if entry is None or now >= entry.stale_until:
+            if entry is not None:
+                self._remove(key)
+            self.stats.misses += 1
+            return None, CacheState.MISS
+
+        self._entries.move_to_end(key)
+        if now < entry.fresh_until:
+            self.stats.hits += 1
+            return entry.pages, CacheState.FRESH
+        self.stats.stale_hits += 1
+        return entry.pages, CacheState.STALE
+
+    def set(self, key: tuple[str, str, str], pages: Pages, policy: CachePolicy) -> None:
+        """Store crawled pages, evicting least recently used entries when over capacity.
+
+        Args:
+            key: Cache key.
+            pages: Extracted items per page.
+            policy: Cache policy of the search.
+        """
+        if not policy.enabled:
+            return
+        if key in self._entries:
+            self._remove(key)
+        now = self._clock()
+        entry = _Entry(pages, now + policy.ttl, now + policy.ttl + policy.stale_ttl)
+        self._entries[key] = entry
+        self._items += entry.size
+        while len(self._entries) > self.max_entries or (self._items > self.max_items and len(self._entries) > 1):
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def refresh(
+        self,
+        key: tuple[str, str, str],
+        policy: CachePolicy,
+        crawl: Callable[[], Awaitable[Optional[Pages]]],
+    ) -> None:
+        """Refresh a stale entry in the background, at most once at a time per key.
+
+        Args:
+            key: Cache key.
+            policy: Cache policy of the search.
+            crawl: Coroutine function crawling fresh pages, returning None if the crawl lost pages
+                and the stale entry should be kept.
+        """
+        if key in self._refreshing:
+            return
+
+        async def _refresh() -> None:
+            try:
+                pages = await crawl()
+                if pages is None:
+                    logger.warning(f"Background refresh of {key[1]} lost pages, keeping the stale entry")
+                    return
+                self.set(key, pages, policy)
+                self.stats.refreshes += 1
+            except Exception as e:
+                logger.warning(f"Background refresh of {key[1]} failed: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(_refresh())
+
+    async def iter_pages(
+        self,
+        key: tuple[str, str, str],
+        policy: CachePolicy,
+        crawl: Callable[[], AsyncIterator[list[dict[str, Any]]]],
+        complete: Callable[[], bool] = lambda: True,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield cached pages or crawl them, storing complete crawls.
+
+        Fresh entries are replayed; stale entries are replayed while a background refresh runs.
+        On a miss the pages are yielded as they are crawled and cached once the crawl completes.
+
+        Args:
+            key: Cache key.
+            policy: Cache policy of the search.
+            crawl: Callable returning an async iterator of crawled pages.
+            complete: Called once a crawl has ended, whether it got every page. Crawls that lost
+                pages, e.g. a later page failing, are not cached.
+
+        Yields:
+            list[dict[str, Any]]: Extracted items per page.
+        """
+        if not policy.enabled:
+            async for items in crawl():
+                yield items
+            return
+
+        cached, state = self.get(key)
+        if cached is not None:
+            if state is CacheState.STALE:
+
+                async def _crawl_all() -> Optional[Pages]:
+                    pages = [items async for items in crawl()]
+                    return pages if complete() else None
+
+                self.refresh(key, policy, _crawl_all)
+            for items in cached:
+                yield items
+            return
+
+        pages: Pages = []
+        async for items in crawl():
+            pages.append(items)
+            yield items
+        if complete():
+            self.set(key, pages, policy)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self._items = 0
+
+    def _remove(self, key: tuple[str, str, str]) -> None:
+        """Remove an entry and release its size."""
+        entry = self._entries.pop(key)
+        self._items -= entry.size
@@ -1,98 +1,226 @@
 """AsyncWebCrawler setup and configuration for job scraping."""
 
-from typing import Optional
-
-from crawl4ai import (
-    AsyncWebCrawler,
-    BrowserConfig,
-    CacheMode,
-    CrawlerRunConfig,
-    LLMConfig,
-)
-from crawl4ai.extraction_strategy import (
-    ExtractionStrategy,
-    LLMExtractionStrategy,
-)
-
+import time
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from functools import cached_property
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Optional
+
+from ...api.metrics import Gauge, Metric
 from ...api.schemas.search import SearchFilters
-from .exceptions import ScrapingError
-from .extractors import JobExtractionStrategy
-from .models import JobPosting
+from ..platforms.base import PaginationStyle
+from .breaker import BreakerState, CircuitBreakerConfig, CircuitBreakerRegistry
+from .cache import CachePolicy, CrawlCache
+from .exceptions import RateLimitError, ScrapingError
+from .llm_cache import LLMCache
+from .models import PostingRecord
+from .pagination import PaginationConfig, iter_numbered_pages, iter_session_pages, new_session_id
+from .parsing import ParserPool, filter_postings, select_postings
+from .pool import BrowserPool, BrowserPoolConfig
+from .ratelimit import RateLimiter, RateLimitPolicy, check_blocked
+from .static import StaticFetcher
+from .strategies import StrategyRegistry
+from .streaming import buffered
+from .telemetry import LLM_FALLBACKS, PAGES_FETCHED, SCRAPING_ERRORS, count_pages, observe_stage
+
+if TYPE_CHECKING:
+    # crawl4ai pulls in playwright and the LLM clients; it is imported on first use so the API
+    # starts without paying for it. See ``StrategyRegistry`` and ``JobScraperClient._new_crawler``.
+    from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+    from crawl4ai.extraction_strategy import ExtractionStrategy
+
+    from .extractors import FrozenStrategy, JobLLMExtractionStrategy
+
+# Extraction schema of scrapes without a platform extraction config
+DEFAULT_EXTRACTION_CONFIG: dict[str, Any] = {
+    "name": "Job Listings",
+    "baseSelector": "div.job-posting",
+    "fields": [
+        {"name": "title", "selector": "h2.job-title", "type": "text"},
+        {"name": "company", "selector": "div.company-name", "type": "text"},
+        {"name": "location", "selector": "div.job-location", "type": "text"},
+        {"name": "salary", "selector": "div.salary", "type": "text", "optional": True},
+        {"name": "description", "selector": "div.job-description", "type": "text"},
+        {"name": "requirements", "selector": "ul.requirements li", "type": "text_array"},
+        {"name": "url", "selector": "a.job-link", "type": "attribute", "attribute": "href"},
+    ],
+}
 
 
 class JobScraperClient:
     """Crawl4AI-based job scraping client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
-        browser_config: Optional[BrowserConfig] = None,
+        browser_config: Optional["BrowserConfig"] = None,
         use_llm: bool = False,
+        pool_config: Optional[BrowserPoolConfig] = None,
+        cache: Optional[CrawlCache] = None,
+        breaker_config: Optional[CircuitBreakerConfig] = None,
+        llm_cache: Optional[LLMCache] = None,
+        native_extraction: bool = True,
+        parser_pool: Optional[ParserPool] = None,
     ) -> None:
         """Initialize the job scraper client.
 
         Args:
             browser_config: Custom browser configuration. If None, uses default settings.
             use_llm: Whether to use LLM-based extraction as fallback.
+            pool_config: Browser pool configuration. If None, uses default settings.
+            cache: Crawl result cache. If None, a default in-memory cache is created.
+            breaker_config: Circuit breaker configuration. If None, uses default settings.
+            llm_cache: Cache of LLM extraction results. If None and ``use_llm`` is set, results are
+                cached in the default on-disk database.
+            native_extraction: Whether rendered pages are extracted on lxml (``LxmlExtractionStrategy``)
+                rather than with crawl4ai's BeautifulSoup-based ``JobExtractionStrategy``.
+            parser_pool: Workers extracting, validating and filtering pages off the event loop.
+                If None, pages are parsed on the event loop. The client closes the pool.
         """
-        self.browser_config = browser_config or BrowserConfig(
-            headless=True,
-            viewport_width=1920,
-            viewport_height=1080,
-        )
+        # Built on first use, like everything else depending on crawl4ai
+        self._browser_config = browser_config
 
-        # CSS-based extraction strategy (primary)
-        self.css_strategy = JobExtractionStrategy(
-            {
-                "name": "Job Listings",
-                "baseSelector": "div.job-posting",  # Default selector, updated per platform
-                "fields": [
-                    {"name": "title", "selector": "h2.job-title", "type": "text"},
-                    {"name": "company", "selector": "div.company-name", "type": "text"},
-                    {"name": "location", "selector": "div.job-location", "type": "text"},
-                    {"name": "salary", "selector": "div.salary", "type": "text", "optional": True},
-                    {"name": "description", "selector": "div.job-description", "type": "text"},
-                    {"name": "requirements", "selector": "ul.requirements li", "type": "text_array"},
-                    {"name": "url", "selector": "a.job-link", "type": "attribute", "attribute": "href"},
-                ],
-            }
-        )
+        # Long-lived browsers shared by all scrapes of this client
+        self.pool = BrowserPool(self._new_crawler, pool_config)
 
-        # Optional LLM-based extraction strategy (fallback)
-        self.llm_strategy = None
-        if use_llm:
-            self.llm_strategy = LLMExtractionStrategy(
-                llm_config=LLMConfig(provider="openai/gpt-4"),
-                schema=JobPosting.model_json_schema(),
-                extraction_type="schema",
-                instruction="""
-                Extract detailed job posting information including:
-                - Job title and company name
-                - Location and salary details if available
-                - Complete job description
-                - List of requirements and qualifications
-                - Job posting URL
-                """,
-            )
+        # HTTP client for platforms whose listings are rendered server-side
+        self.static_fetcher = StaticFetcher()
 
-    def update_css_selectors(self, platform_selectors: dict[str, str]) -> None:
-        """Update CSS selectors for a specific platform.
+        # Crawl results reused across identical searches, see CachePolicy
+        self.cache = cache or CrawlCache()
 
-        Args:
-            platform_selectors: Platform-specific CSS selectors.
+        # Request rate per site, shared by all scrapes of this client
+        self.rate_limiter = RateLimiter()
+
+        # Platforms that keep failing are skipped until a probe succeeds
+        self.breakers = CircuitBreakerRegistry(breaker_config)
+
+        # Extraction strategies compiled once per platform and shared by concurrent scrapes
+        self.strategies = StrategyRegistry([DEFAULT_EXTRACTION_CONFIG], native=native_extraction)
+
+        # Rendered and fetched pages are shipped to these workers as HTML instead of parsed here
+        self.parser_pool = parser_pool
+
+        self.use_llm = use_llm
+        self.llm_cache = (llm_cache or LLMCache()) if use_llm else None
+
+    @property
+    def browser_config(self) -> "BrowserConfig":
+        """Browser configuration of the pooled crawlers."""
+        if self._browser_config is None:
+            from crawl4ai import BrowserConfig
+
+            self._browser_config = BrowserConfig(headless=True, viewport_width=1920, viewport_height=1080)
+        return self._browser_config
+
+    @property
+    def css_strategy(self) -> "FrozenStrategy":
+        """CSS-based extraction strategy (primary), shared by scrapes without a platform config."""
+        return self.strategies.get(DEFAULT_EXTRACTION_CONFIG)
+
+    @cached_property
+    def llm_strategy(self) -> Optional["JobLLMExtractionStrategy"]:
+        """Optional LLM-based extraction strategy (fallback), run outside the crawler so it does not block the loop."""
+        if not self.use_llm:
+            return None
+        from crawl4ai import LLMConfig
+
+        from .extractors import JobLLMExtractionStrategy
+
+        return JobLLMExtractionStrategy(llm_config=LLMConfig(provider="openai/gpt-4"), cache=self.llm_cache)
+
+    def _new_crawler(self) -> "AsyncWebCrawler":
+        """Create a crawler for the browser pool, importing crawl4ai on the first launch."""
+        from crawl4ai import AsyncWebCrawler
+
+        return AsyncWebCrawler(config=self.browser_config)
+
+    async def start(self) -> None:
+        """Launch the browser pool and parser workers so the first scrape does not pay their startup cost."""
+        await self.pool.start()
+        if self.parser_pool is not None:
+            await self.parser_pool.start()
+
+    async def close(self) -> None:
+        """Shut down all browsers and HTTP connections owned by the client."""
+        await self.pool.close()
+        await self.static_fetcher.close()
+        if self.parser_pool is not None:
+            await self.parser_pool.close()
+        if self.llm_cache is not None:
+            self.llm_cache.close()
+
+    def metrics(self) -> list[Metric]:
+        """Build gauges of the browser pool, caches and circuit breakers, for ``MetricsRegistry.add_collector``.
+
+        Returns:
+            list[Metric]: Pool utilization, cache hit rates and the state of every platform's circuit
+            at the time of the call.
         """
-        if isinstance(self.css_strategy, JobExtractionStrategy):
-            self.css_strategy.configure_for_platform(platform_selectors)
+        pool = Gauge("jobsearch_browser_pool", "Browsers of the pool by state", ("state",))
+        pool.set(self.pool.in_use, "in_use")
+        pool.set(self.pool.idle, "idle")
+        pool.set(self.pool.config.size, "capacity")
+        unmeasured = Gauge(
+            "jobsearch_browser_pool_unmeasured", "Browsers whose memory cannot be measured for recycling"
+        )
+        unmeasured.set(self.pool.unmeasured)
+        lookups = Gauge("jobsearch_cache_lookups", "Cache lookups since startup by result", ("cache", "result"))
+        hit_rate = Gauge("jobsearch_cache_hit_ratio", "Share of cache lookups answered from the cache", ("cache",))
+        caches = {"crawl": self.cache.stats}
+        if self.llm_cache is not None:
+            caches["llm"] = self.llm_cache.stats
+        for name, stats in caches.items():
+            lookups.set(stats.hits, name, "hit")
+            lookups.set(stats.stale_hits, name, "stale_hit")
+            lookups.set(stats.misses, name, "miss")
+            hit_rate.set(stats.hit_rate, name)
+        circuit = Gauge(
+            "jobsearch_circuit_state",
+            "Circuit breaker state per platform, 1 for the current one",
+            ("platform", "state"),
+        )
+        failures = Gauge(
+            "jobsearch_circuit_failures", "Consecutive failures counted by a platform's breaker", ("platform",)
+        )
+        for platform, breaker in self.breakers.states().items():
+            for state in BreakerState:
+                circuit.set(float(breaker["state"] == state.value), platform, state.value)
+            failures.set(breaker["failures"], platform)
+        return [pool, unmeasured, lookups, hit_rate, circuit, failures]
+
+    async def __aenter__(self) -> "JobScraperClient":
+        """Start the client when used as an async context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Close the client when leaving the async context manager."""
+        await self.close()
+
+    def _get_extraction_strategy(
+        self,
+        extraction_config: Optional[dict[str, Any]] = None,
+    ) -> "ExtractionStrategy":
+        """Get the CSS extraction strategy run by the crawler.
 
-    def _get_extraction_strategy(self, llm_fallback: bool = True) -> ExtractionStrategy:
-        """Get the appropriate extraction strategy.
+        The LLM strategy is not handed to the crawler, which would run it synchronously;
+        ``_extract`` applies it to the rendered HTML instead.
 
         Args:
-            llm_fallback: Whether to try LLM extraction if CSS extraction fails.
+            extraction_config: Platform extraction config to use instead of the default CSS strategy.
 
         Returns:
-            The selected extraction strategy.
+            The compiled strategy of the config, shared with every other scrape using it.
         """
-        return self.llm_strategy if llm_fallback and self.llm_strategy else self.css_strategy
+        if extraction_config is not None:
+            return self.strategies.get(extraction_config)
+        return self.css_strategy
 
     async def scrape_jobs(  # noqa: PLR0913
         self,
@@ -102,7 +230,12 @@ class JobScraperClient:
         wait_for: Optional[str] = None,
         wait_timeout: Optional[int] = None,
         llm_fallback: bool = True,
-    ) -> list[JobPosting]:
+        extraction_config: Optional[dict[str, Any]] = None,
+        pagination: Optional[PaginationConfig] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        static_html: bool = False,
+        rate_limit: Optional[RateLimitPolicy] = None,
+    ) -> list[PostingRecord]:
         """Execute job scraping with fallback strategies.
 
         Args:
@@ -112,17 +245,104 @@ class JobScraperClient:
             wait_for: CSS selector to wait for before extraction.
             wait_timeout: Timeout in milliseconds to wait for selector.
             llm_fallback: Whether to try LLM extraction if CSS extraction fails.
+            extraction_config: Platform extraction config (see ``PlatformAdapter.get_extraction_config``).
+                If None, the client's shared CSS strategy is used.
+            pagination: Pagination settings (see ``PaginationConfig.from_platform``).
+                If None, only the first page is scraped.
+            cache_policy: How long crawl results may be reused (see ``CachePolicy.from_platform``).
+                If None, results are not cached.
+            static_html: Whether to fetch pages over plain HTTP and extract them with
+                ``extraction_config`` before falling back to the browser.
+            rate_limit: Request rate allowed against the site (see ``RateLimitPolicy.from_platform``).
+                If None, requests are not rate limited.
 
         Returns:
             List of extracted job postings.
 
         Raises:
+            CircuitOpenError: If the platform's circuit breaker is open and no cached result exists.
+            RateLimitError: If the site throttled the first page or the rate limit queue is too long.
             ScrapingError: If scraping fails with both strategies.
+
+        Note:
+            The browser pool is started on first use if ``start()`` has not been called;
+            call ``close()`` to release the browsers.
         """
-        # Build config based on provided parameters
+        return [
+            job
+            async for job in self.stream_jobs(
+                url,
+                platform,
+                criteria,
+                wait_for=wait_for,
+                wait_timeout=wait_timeout,
+                llm_fallback=llm_fallback,
+                extraction_config=extraction_config,
+                pagination=pagination,
+                cache_policy=cache_policy,
+                static_html=static_html,
+                rate_limit=rate_limit,
+            )
+        ]
+
+    async def stream_jobs(  # noqa: PLR0913
+        self,
+        url: str,
+        platform: str,
+        criteria: SearchFilters,
+        wait_for: Optional[str] = None,
+        wait_timeout: Optional[int] = None,
+        llm_fallback: bool = True,
+        extraction_config: Optional[dict[str, Any]] = None,
+        pagination: Optional[PaginationConfig] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        static_html: bool = False,
+        rate_limit: Optional[RateLimitPolicy] = None,
+        buffer_pages: int = 2,
+    ) -> AsyncIterator[PostingRecord]:
+        """Yield job postings as soon as the page they were found on has been extracted.
+
+        Pages are crawled in the background at most ``buffer_pages`` pages ahead of the consumer,
+        so a slow consumer pauses the crawl instead of letting results pile up in memory.
+        Stopping the iteration early cancels the remaining crawl.
+
+        Args:
+            url: The URL to scrape.
+            platform: Platform name for metadata.
+            criteria: Search criteria for filtering.
+            wait_for: CSS selector to wait for before extraction.
+            wait_timeout: Timeout in milliseconds to wait for selector.
+            llm_fallback: Whether to try LLM extraction if CSS extraction fails.
+            extraction_config: Platform extraction config (see ``PlatformAdapter.get_extraction_config``).
+                If None, the client's shared CSS strategy is used.
+            pagination: Pagination settings (see ``PaginationConfig.from_platform``).
+                If None, only the first page is scraped.
+            cache_policy: How long crawl results may be reused (see ``CachePolicy.from_platform``).
+                If None, results are not cached.
+            static_html: Whether to fetch pages over plain HTTP and extract them with
+                ``extraction_config`` before falling back to the browser.
+            rate_limit: Request rate allowed against the site (see ``RateLimitPolicy.from_platform``).
+                If None, requests are not rate limited.
+            buffer_pages: Maximum number of extracted pages waiting for the consumer.
+
+        Yields:
+            PostingRecord: Validated postings matching ``criteria``.
+
+        Raises:
+            CircuitOpenError: If the platform's circuit breaker is open and no cached result exists.
+            RateLimitError: If the site throttled the first page or the rate limit queue is too long.
+            ScrapingError: If scraping fails with both strategies.
+        """
+        from crawl4ai import CacheMode, CrawlerRunConfig
+
+        # Build config based on provided parameters. With a parser pool, the crawler only renders
+        # pages and their HTML is extracted by the workers.
+        pooled_config = None
+        if self.parser_pool is not None:
+            pooled_config = extraction_config if extraction_config is not None else DEFAULT_EXTRACTION_CONFIG
         config_args = {
-            "extraction_strategy": self._get_extraction_strategy(llm_fallback),
-            "cache_mode": CacheMode.BYPASS,  # Always fetch fresh data
+            "extraction_strategy": None if pooled_config else self._get_extraction_strategy(extraction_config),
+            "cache_mode": CacheMode.BYPASS,  # Freshness is handled by self.cache
         }
 
         if wait_for is not None:
@@ -130,39 +350,324 @@ class JobScraperClient:
 
         config = CrawlerRunConfig(**config_args)
 
-        async with AsyncWebCrawler(config=self.browser_config) as crawler:
-            result = await crawler.arun(url=url, config=config)
-            result_dict = await result.__anext__()  # Get first result from AsyncGenerator
-
-            if not result_dict.get("success") and llm_fallback and self.llm_strategy:
-                # Try LLM extraction as fallback
-                config.extraction_strategy = self.llm_strategy
-                result = await crawler.arun(url=url, config=config)
-                result_dict = await result.__anext__()
-
-            if not result_dict.get("success"):
-                raise ScrapingError(
-                    message=f"Failed to scrape {platform}: {result_dict.get('error', 'Unknown error')}",
-                    error_type="EXTRACTION_ERROR",
-                    details={
-                        "platform": platform,
-                        "url": url,
-                        "error": result_dict.get("error", "Unknown error"),
-                    },
+        cache_key = self.cache.key(
+            platform,
+            url,
+            extraction_config,
+            pagination.model_dump(mode="json") if pagination else None,
+            bool(llm_fallback and self.llm_strategy),
+        )
+        # Later pages lost by the crawl; a crawl that lost pages is not cached as the search's result
+        page_errors: list[Exception] = []
+        pages = self.cache.iter_pages(
+            cache_key,
+            cache_policy or CachePolicy(),
+            lambda: self.breakers.get(platform).guard(
+                lambda: count_pages(
+                    platform,
+                    self._iter_pages(
+                        url,
+                        platform,
+                        config,
+                        llm_fallback,
+                        pagination,
+                        static_extraction_config=extraction_config if static_html else None,
+                        rate_limit=rate_limit,
+                        pooled_config=pooled_config,
+                        page_errors=page_errors,
+                    ),
+                )
+            ),
+            complete=lambda: not page_errors,
+        )
+
+        try:
+            async for items in buffered(pages, buffer_pages):
+                # Validate and filter each page as soon as it arrives
+                if self.parser_pool is not None:
+                    matches = await self.parser_pool.select(items, platform, criteria)
+                else:
+                    matches = select_postings(items, platform, criteria)
+                for job in matches:
+                    yield job
+        except ScrapingError as e:
+            SCRAPING_ERRORS.inc(platform, e.error_type)
+            raise
+
+    async def _iter_pages(  # noqa: PLR0913
+        self,
+        url: str,
+        platform: str,
+        config: "CrawlerRunConfig",
+        llm_fallback: bool,
+        pagination: Optional[PaginationConfig],
+        static_extraction_config: Optional[dict[str, Any]] = None,
+        rate_limit: Optional[RateLimitPolicy] = None,
+        pooled_config: Optional[dict[str, Any]] = None,
+        page_errors: Optional[list[Exception]] = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the raw extracted items of every result page.
+
+        Args:
+            url: URL of the first results page.
+            platform: Platform name for error details.
+            config: Crawler run configuration of the first page.
+            llm_fallback: Whether to try LLM extraction if CSS extraction fails.
+            pagination: Pagination settings. If None, only the first page is scraped.
+            static_extraction_config: Extraction config for fetching pages without a browser.
+                If the first page yields no listings this way, the browser is used instead.
+            rate_limit: Request rate allowed against the site. If None, requests are not rate limited.
+            pooled_config: Extraction config applied to rendered pages by the parser pool, as ``config``
+                has no extraction strategy. If None, the crawler extracts the pages.
+            page_errors: List the failures of pages after the first are appended to. If None,
+                they are only logged.
+
+        Yields:
+            list[dict[str, Any]]: Extracted items per page, without postings seen on earlier pages.
+        """
+        use_static = static_extraction_config is not None
+        first_page = True
+
+        async def fetch_page(page_url: str) -> list[dict[str, Any]]:
+            nonlocal use_static, first_page
+            is_first, first_page = first_page, False
+            if use_static:
+                if not is_first:
+                    return await self._fetch_static(page_url, platform, static_extraction_config, rate_limit)
+                items = await self._try_static(page_url, platform, static_extraction_config, rate_limit)
+                if items:
+                    return items
+                # Nothing found without a browser: render this and all further pages
+                use_static = False
+            queued = time.perf_counter()
+            return await self.rate_limiter.run(
+                page_url,
+                rate_limit,
+                lambda: self._render(page_url, config, platform, llm_fallback, queued, pooled_config),
+            )
+
+        if pagination is None or pagination.max_pages <= 1:
+            yield await fetch_page(url)
+            return
+
+        if pagination.style is PaginationStyle.NUMBERED:
+            async for items in iter_numbered_pages(fetch_page, url, pagination, page_errors):
+                yield items
+            return
+
+        async for items in self._iter_session_pages(
+            url, platform, config, llm_fallback, pagination, rate_limit, pooled_config, page_errors
+        ):
+            yield items
+
+    async def _try_static(
+        self,
+        url: str,
+        platform: str,
+        extraction_config: dict[str, Any],
+        rate_limit: Optional[RateLimitPolicy],
+    ) -> list[dict[str, Any]]:
+        """Fetch the first page without a browser, finding no items if that fails for any reason but throttling.
+
+        Args:
+            url: Page URL.
+            platform: Platform name for metrics.
+            extraction_config: Extraction config of the platform.
+            rate_limit: Request rate allowed against the site. If None, requests are not rate limited.
+
+        Returns:
+            list[dict[str, Any]]: Extracted items, empty if the fetch failed.
+
+        Raises:
+            RateLimitError: If the site throttled the request; rendering the page would only hit it again.
+        """
+        try:
+            return await self._fetch_static(url, platform, extraction_config, rate_limit)
+        except RateLimitError:
+            raise
+        except ScrapingError:
+            return []
+
+    async def _fetch_static(
+        self,
+        url: str,
+        platform: str,
+        extraction_config: dict[str, Any],
+        rate_limit: Optional[RateLimitPolicy],
+    ) -> list[dict[str, Any]]:
+        """Fetch a page without a browser once the rate limit allows it and return its extracted items.
+
+        Args:
+            url: Page URL.
+            platform: Platform name for metrics.
+            extraction_config: Extraction config of the platform.
+            rate_limit: Request rate allowed against the site. If None, requests are not rate limited.
+
+        Returns:
+            list[dict[str, Any]]: Extracted items.
+        """
+        queued = time.perf_counter()
+
+        async def fetch() -> list[dict[str, Any]]:
+            observe_stage(platform, "wait", queued)
+            PAGES_FETCHED.inc(platform, "static")
+            if self.parser_pool is None:
+                return await self.static_fetcher.fetch_items(url, extraction_config, platform=platform)
+            started = time.perf_counter()
+            html = await self.static_fetcher.fetch(url)
+            observe_stage(platform, "navigate", started)
+            return await self.parser_pool.extract(html, extraction_config, base_url=url, platform=platform)
+
+        return await self.rate_limiter.run(url, rate_limit, fetch)
+
+    async def _iter_session_pages(  # noqa: PLR0913
+        self,
+        url: str,
+        platform: str,
+        config: "CrawlerRunConfig",
+        llm_fallback: bool,
+        pagination: PaginationConfig,
+        rate_limit: Optional[RateLimitPolicy],
+        pooled_config: Optional[dict[str, Any]] = None,
+        page_errors: Optional[list[Exception]] = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the items of pages loaded into one browser session by "more" buttons or scrolling.
+
+        Args:
+            url: URL of the first results page.
+            platform: Platform name for error details.
+            config: Crawler run configuration of the first page.
+            llm_fallback: Whether to try LLM extraction if CSS extraction fails.
+            pagination: Pagination settings.
+            rate_limit: Request rate allowed against the site. If None, requests are not rate limited.
+            pooled_config: Extraction config applied by the parser pool. If None, the crawler extracts the pages.
+            page_errors: List the failures of loads after the first are appended to. If None, they are only logged.
+
+        Yields:
+            list[dict[str, Any]]: Items appended by each load.
+        """
+        queued = time.perf_counter()
+        async with self.pool.acquire() as crawler:
+            observe_stage(platform, "wait", queued)
+            session_id = new_session_id()
+
+            async def fetch_more(js_code: Optional[str], js_only: bool) -> list[dict[str, Any]]:
+                page_config = config.clone(
+                    session_id=session_id,
+                    js_code=js_code,
+                    js_only=js_only,
+                    delay_before_return_html=pagination.page_wait if js_only else config.delay_before_return_html,
                 )
+                return await self.rate_limiter.run(
+                    url,
+                    rate_limit,
+                    lambda: self._extract(crawler, url, page_config, platform, llm_fallback, pooled_config),
+                )
+
+            try:
+                async for items in iter_session_pages(fetch_more, pagination, page_errors):
+                    yield items
+            finally:
+                with suppress(Exception):
+                    await crawler.crawler_strategy.kill_session(session_id)
+
+    async def _render(  # noqa: PLR0913
+        self,
+        url: str,
+        config: "CrawlerRunConfig",
+        platform: str,
+        llm_fallback: bool,
+        queued: Optional[float] = None,
+        pooled_config: Optional[dict[str, Any]] = None,
+    ) -> list[dict[str, Any]]:
+        """Crawl a single page with a pooled browser and return its extracted items.
+
+        Args:
+            url: The URL to scrape.
+            config: Crawler run configuration.
+            platform: Platform name for error details.
+            llm_fallback: Whether to try LLM extraction if CSS extraction fails.
+            queued: ``time.perf_counter()`` when the page was queued behind the rate limit,
+                the start of the recorded wait for a browser. If None, the call time is used.
+            pooled_config: Extraction config applied by the parser pool. If None, the crawler extracts the page.
+
+        Returns:
+            list[dict[str, Any]]: Extracted items.
+        """
+        queued = time.perf_counter() if queued is None else queued
+        async with self.pool.acquire() as crawler:
+            observe_stage(platform, "wait", queued)
+            return await self._extract(crawler, url, config, platform, llm_fallback, pooled_config)
+
+    async def _extract(  # noqa: PLR0913
+        self,
+        crawler: "AsyncWebCrawler",
+        url: str,
+        config: "CrawlerRunConfig",
+        platform: str,
+        llm_fallback: bool,
+        pooled_config: Optional[dict[str, Any]] = None,
+    ) -> list[dict[str, Any]]:
+        """Crawl a single page and return its extracted items.
+
+        Args:
+            crawler: Started crawler to use.
+            url: The URL to scrape.
+            config: Crawler run configuration.
+            platform: Platform name for error details.
+            llm_fallback: Whether to try LLM extraction if CSS extraction fails.
+            pooled_config: Extraction config applied by the parser pool to the rendered HTML.
+                If None, the crawler extracts the page.
+
+        Returns:
+            list[dict[str, Any]]: Extracted items.
 
-            extracted_content = result_dict.get("content", [])
-            jobs = [JobPosting.model_validate({**job, "platform": platform}) for job in extracted_content]
+        Raises:
+            RateLimitError: If the site throttled the request or answered with a captcha page.
+            ScrapingError: If extraction fails with both strategies.
+        """
+        # crawl4ai navigates, waits for ``wait_for`` and runs the CSS extraction (if any) in one call
+        started = time.perf_counter()
+        PAGES_FETCHED.inc(platform, "browser")
+        result = await crawler.arun(url=url, config=config)
+        result_dict = await result.__anext__()  # Get first result from AsyncGenerator
+        started = observe_stage(platform, "navigate", started)
+        check_blocked(url, result_dict.get("status_code"), result_dict.get("html"), result_dict.get("response_headers"))
+
+        if not result_dict.get("success") and llm_fallback and self.llm_strategy:
+            # Render the page again without CSS extraction and let the LLM extract the listings
+            result = await crawler.arun(url=url, config=config.clone(extraction_strategy=None))
+            result_dict = await result.__anext__()
+            started = observe_stage(platform, "navigate", started)
+            if result_dict.get("success"):
+                LLM_FALLBACKS.inc(platform)
+                schema = pooled_config or getattr(config.extraction_strategy, "schema", None) or {}
+                items = await self.llm_strategy.aextract(url, result_dict.get("html", ""), schema.get("baseSelector"))
+                observe_stage(platform, "extract", started)
+                return items
+
+        if not result_dict.get("success"):
+            raise ScrapingError(
+                message=f"Failed to scrape {platform}: {result_dict.get('error', 'Unknown error')}",
+                error_type="EXTRACTION_ERROR",
+                details={
+                    "platform": platform,
+                    "url": url,
+                    "error": result_dict.get("error", "Unknown error"),
+                },
+            )
 
-            # Filter jobs based on search criteria
-            filtered_jobs = self._filter_jobs(jobs, criteria)
-            return filtered_jobs
+        if pooled_config is not None:
+            return await self.parser_pool.extract(
+                result_dict.get("html", ""), pooled_config, base_url=url, platform=platform
+            )
+        return result_dict.get("content", [])
 
     def _filter_jobs(
         self,
-        jobs: list[JobPosting],
+        jobs: list[PostingRecord],
         criteria: SearchFilters,
-    ) -> list[JobPosting]:
+    ) -> list[PostingRecord]:
         """Filter jobs based on search criteria.
 
         Args:
@@ -172,32 +677,4 @@ class JobScraperClient:
         Returns:
             Filtered list of job postings.
         """
-        filtered = jobs
-
-        # Apply filters based on search criteria
-        if criteria.keywords:
-            filtered = [
-                job
-                for job in filtered
-                if any(
-                    keyword.lower() in job.title.lower() or keyword.lower() in job.description.lower()
-                    for keyword in criteria.keywords
-                )
-            ]
-
-        if criteria.location:
-            filtered = [job for job in filtered if criteria.location.lower() in job.location.lower()]
-
-        if criteria.salary_range:
-            # TODO: Implement salary range filtering
-            # This requires parsing salary strings into comparable values
-            pass
-
-        if criteria.remote:
-            filtered = [
-                job
-                for job in filtered
-                if any(term.lower() in job.description.lower() for term in ["remote", "віддалено", "дистанційно"])
-            ]
-
-        return filtered
+        return filter_postings(jobs, criteria)
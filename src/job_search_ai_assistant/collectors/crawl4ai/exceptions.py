@@ -90,6 +90,40 @@ class RateLimitError(ScrapingError):
         )
 
 
+class CircuitOpenError(ScrapingError):
+    """Error when a platform is skipped because its circuit breaker is open."""
+
+    def __init__(self, message: str, details: dict | None = None) -> None:
+        """Initialize circuit open error.
+
+        Args:
+            message: Error description
+            details: Additional error context
+        """
+        super().__init__(
+            message=message,
+            error_type="CIRCUIT_OPEN",
+            details=details,
+        )
+
+
+class PoolExhaustedError(ScrapingError):
+    """Error when no browser of the local pool becomes free in time."""
+
+    def __init__(self, message: str, details: dict | None = None) -> None:
+        """Initialize pool exhausted error.
+
+        Args:
+            message: Error description
+            details: Additional error context
+        """
+        super().__init__(
+            message=message,
+            error_type="POOL_EXHAUSTED",
+            details=details,
+        )
+
+
 class ValidationError(ScrapingError):
     """Error during data validation."""
 
@@ -1,7 +1,14 @@
 """Custom extraction strategies for job scraping."""
 
+import asyncio
+import json
+import random
+from collections.abc import Iterator
+from types import MappingProxyType
 from typing import Any
+from urllib.parse import urlparse
 
+import soupsieve
 from crawl4ai import LLMConfig
 from crawl4ai.extraction_strategy import (
     ExtractionStrategy,
@@ -10,12 +17,91 @@ from crawl4ai.extraction_strategy import (
 from crawl4ai.extraction_strategy import (
     LLMExtractionStrategy as BaseLLMExtractionStrategy,
 )
+from crawl4ai.prompts import PROMPT_EXTRACT_SCHEMA_WITH_INSTRUCTION
+from crawl4ai.utils import (
+    escape_json_string,
+    extract_xml_data,
+    merge_chunks,
+    sanitize_html,
+    split_and_parse_json_objects,
+)
 
+from .llm_cache import LLMCache
 from .models import JobPosting
+from .static import ListingExtractor, split_listings
+
+
+def _freeze(value: Any) -> Any:
+    """Turn nested dicts and lists of a schema into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Turn a frozen schema back into dicts and lists."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _schema_selectors(schema: dict[str, Any]) -> Iterator[str]:
+    """Yield every CSS selector of a schema, including those of nested fields."""
+    if schema.get("baseSelector"):
+        yield schema["baseSelector"]
+    for field in (*schema.get("baseFields", ()), *schema.get("fields", ())):
+        if field.get("selector"):
+            yield field["selector"]
+        if field.get("fields"):
+            yield from _schema_selectors({"fields": field["fields"]})
+
+
+class FrozenStrategy:
+    """Immutability of compiled extraction strategies, which concurrent scrapes share."""
+
+    schema: Any
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute while the strategy is initialized.
+
+        Raises:
+            AttributeError: Once the strategy is initialized.
+        """
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} is immutable; create a new strategy instead")
+        object.__setattr__(self, name, value)
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """Copy of the extraction config as plain dicts and lists."""
+        return _thaw(self.schema)
+
+    def with_selectors(self, platform_selectors: dict[str, Any]) -> "FrozenStrategy":
+        """Create a strategy with the base selector or fields of a platform.
 
+        Args:
+            platform_selectors: Platform-specific ``baseSelector`` and ``fields``.
+
+        Returns:
+            FrozenStrategy: New strategy of the same class; this one is left unchanged.
+        """
+        config = {
+            **self.config,
+            **{key: platform_selectors[key] for key in ("baseSelector", "fields") if key in platform_selectors},
+        }
+        return type(self)(config)
 
-class JobExtractionStrategy(JsonCssExtractionStrategy):
-    """Custom extraction strategy for job listings using CSS selectors."""
+
+class JobExtractionStrategy(FrozenStrategy, JsonCssExtractionStrategy):
+    """Custom extraction strategy for job listings using CSS selectors.
+
+    The schema is frozen and its selectors are compiled once, so a strategy is immutable and shared
+    by concurrent scrapes, including extraction running in crawl4ai's worker threads.
+    """
 
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the extraction strategy.
@@ -23,36 +109,85 @@ class JobExtractionStrategy(JsonCssExtractionStrategy):
         Args:
             config: Base configuration including selectors and fields.
         """
-        super().__init__(config)
-        self._base_config = config.copy()
+        super().__init__(_freeze(config))
+        self.selectors = MappingProxyType(
+            {selector: soupsieve.compile(selector) for selector in _schema_selectors(config)}
+        )
+        self._frozen = True
 
-    def configure_for_platform(self, platform_selectors: dict[str, str]) -> None:
-        """Configure the strategy for a specific platform.
+    def _select(self, element: Any, selector: str) -> Any:
+        """Select the elements matching a selector, compiled ahead of time if it is in the schema."""
+        return element.select(self.selectors.get(selector) or selector)
+
+    def _get_base_elements(self, parsed_html: Any, selector: str) -> Any:
+        """Select the listing elements of a page."""
+        return self._select(parsed_html, selector)
+
+    def _get_elements(self, element: Any, selector: str) -> Any:
+        """Select the elements of a field within a listing."""
+        return self._select(element, selector)
+
+
+class LxmlExtractionStrategy(FrozenStrategy, ExtractionStrategy):
+    """Extraction strategy running the config of ``JobExtractionStrategy`` on lxml instead of BeautifulSoup.
+
+    Selectors are compiled to XPath once and each listing is visited once, see ``ListingExtractor``.
+    Text is whitespace-normalized and links are resolved against the page URL, as on the static path.
+    """
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialize the extraction strategy.
 
         Args:
-            platform_selectors: Platform-specific CSS selectors.
+            config: Extraction config with ``baseSelector`` and ``fields``.
         """
-        updated_config = self._base_config.copy()
-        if "baseSelector" in platform_selectors:
-            updated_config["baseSelector"] = platform_selectors["baseSelector"]
-        if "fields" in platform_selectors:
-            updated_config["fields"] = platform_selectors["fields"]
+        super().__init__(input_format="html")
+        self.schema = _freeze(config)
+        self.extractor = ListingExtractor(config)
+        self._frozen = True
+
+    def extract(self, url: str, html: str, *q: Any, **kwargs: Any) -> list[dict[str, Any]]:
+        """Extract the listings of a page.
+
+        Args:
+            url: Page URL, used to resolve relative links.
+            html: Page HTML.
 
-        # Re-initialize with updated config by calling parent class constructor
-        super().__init__(updated_config)
+        Returns:
+            list[dict[str, Any]]: One dictionary per listing.
+        """
+        return self.extractor.extract(html, base_url=url)
+
+    def run(self, url: str, sections: list[str], *q: Any, **kwargs: Any) -> list[dict[str, Any]]:
+        """Extract every section in the calling thread.
+
+        The parent hands each section to a new thread pool, which costs more than lxml takes to
+        extract a page; crawl4ai passes HTML as a single section anyway.
+        """
+        return [item for section in sections for item in self.extract(url, section)]
 
 
 class JobLLMExtractionStrategy(BaseLLMExtractionStrategy):
     """Custom LLM-based extraction strategy for job listings."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         llm_config: LLMConfig | None = None,
+        max_concurrency: int = 4,
+        batch_token_budget: int = 6000,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        cache: LLMCache | None = None,
     ) -> None:
         """Initialize the LLM extraction strategy.
 
         Args:
             llm_config: Optional custom LLM configuration
+            max_concurrency: Maximum number of LLM requests in flight for this strategy
+            batch_token_budget: Estimated prompt tokens of listing HTML packed into one request
+            max_retries: Attempts per request before giving up
+            retry_backoff: Delay in seconds before the first retry, doubled on every further retry
+            cache: Cache of extracted items per listing; None sends every chunk to the LLM
         """
         default_config = LLMConfig(
             provider="openai/gpt-4",
@@ -92,6 +227,278 @@ Do not make assumptions or add information not present in the HTML.""",
             input_format="html",
             extra_args={"temperature": 0.1},  # Low temperature for factual extraction
         )
+        self.max_concurrency = max_concurrency
+        self.batch_token_budget = batch_token_budget
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.cache = cache
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute.
+
+        The parent checks attribute names against the signature of ``self.__init__``, which
+        is this class' narrower signature, so every attribute set by the parent would fail.
+        """
+        object.__setattr__(self, name, value)
+
+    @property
+    def _request_limit(self) -> asyncio.Semaphore:
+        """Semaphore bounding the LLM requests in flight, created on first use."""
+        limit = getattr(self, "_limit", None)
+        if limit is None:
+            limit = self._limit = asyncio.Semaphore(self.max_concurrency)
+        return limit
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Return the jittered delay before retry number ``attempt + 1``."""
+        return self.retry_backoff * (2**attempt) * random.uniform(0.5, 1.0)  # noqa: S311
+
+    def estimate_tokens(self, text: str) -> int:
+        """Estimate the number of prompt tokens of a text.
+
+        Args:
+            text: Text sent to the LLM.
+
+        Returns:
+            int: Estimated token count.
+        """
+        return int(len(text.split()) * self.word_token_rate) + 1
+
+    def pack_chunks(self, chunks: list[str]) -> list[list[str]]:
+        """Pack chunks into batches that each fit the token budget of one request.
+
+        Chunks keep their order; a chunk larger than the budget forms a batch of its own.
+
+        Args:
+            chunks: HTML chunks, e.g. one per listing.
+
+        Returns:
+            list[list[str]]: Batches of chunks.
+        """
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        tokens = 0
+        for chunk in chunks:
+            chunk_tokens = self.estimate_tokens(chunk)
+            if batch and tokens + chunk_tokens > self.batch_token_budget:
+                batches.append(batch)
+                batch, tokens = [], 0
+            batch.append(chunk)
+            tokens += chunk_tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def build_prompt(self, url: str, chunks: list[str]) -> str:
+        """Build the extraction prompt for a batch of chunks.
+
+        Args:
+            url: URL of the page the chunks come from
+            chunks: HTML chunks of the batch
+
+        Returns:
+            str: Prompt asking for one JSON object per job posting.
+        """
+        html = "\n\n".join(chunks)
+        variables = {
+            "URL": url,
+            "HTML": escape_json_string(sanitize_html(html)),
+            "REQUEST": self.instruction or "",
+            "SCHEMA": json.dumps(self.schema, indent=2),
+        }
+        prompt = PROMPT_EXTRACT_SCHEMA_WITH_INSTRUCTION
+        for name, value in variables.items():
+            prompt = prompt.replace("{" + name + "}", value)
+        return prompt
+
+    @staticmethod
+    def parse_blocks(content: str) -> list[dict[str, Any]]:
+        """Parse the JSON objects of an LLM response.
+
+        Args:
+            content: Response text, normally a JSON list wrapped in ``<blocks>`` tags.
+
+        Returns:
+            list[dict[str, Any]]: Parsed objects; unparsable parts are dropped.
+        """
+        blocks = extract_xml_data(["blocks"], content).get("blocks") or content
+        try:
+            parsed = json.loads(blocks)
+        except json.JSONDecodeError:
+            parsed, _ = split_and_parse_json_objects(blocks)
+        if isinstance(parsed, dict):
+            parsed = [parsed]
+        return [block for block in parsed if isinstance(block, dict) and not block.get("error")]
+
+    async def acomplete(self, prompt: str) -> str:
+        """Send one prompt to the LLM without blocking the event loop.
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            str: Response text.
+        """
+        from litellm import acompletion
+
+        response = await acompletion(
+            model=self.llm_config.provider,
+            messages=[{"role": "user", "content": prompt}],
+            api_key=self.llm_config.api_token,
+            base_url=self.llm_config.base_url,
+            max_retries=0,  # Retries are handled by _request with backoff
+            **(self.extra_args or {}),
+        )
+        if response.usage:
+            self.total_usage.prompt_tokens += response.usage.prompt_tokens
+            self.total_usage.completion_tokens += response.usage.completion_tokens
+            self.total_usage.total_tokens += response.usage.total_tokens
+        return response.choices[0].message.content or ""
+
+    async def _request(self, url: str, chunks: list[str]) -> list[dict[str, Any]]:
+        """Extract postings from one batch, retrying with exponential backoff.
+
+        Args:
+            url: URL of the page the chunks come from
+            chunks: HTML chunks of the batch
+
+        Returns:
+            list[dict[str, Any]]: Extracted postings.
+        """
+        prompt = self.build_prompt(url, chunks)
+        for attempt in range(self.max_retries):
+            try:
+                async with self._request_limit:
+                    content = await self.acomplete(prompt)
+                return self.parse_blocks(content)
+            except Exception:
+                if attempt == self.max_retries - 1:
+                    raise
+                await asyncio.sleep(self._backoff_delay(attempt))
+        return []
+
+    async def arun(self, url: str, chunks: list[str]) -> list[dict[str, Any]]:
+        """Extract postings from chunks, batching them and running the requests concurrently.
+
+        With a cache, only chunks without a cached result are sent to the LLM.
+
+        Args:
+            url: URL of the page the chunks come from
+            chunks: HTML chunks, ideally one per listing
+
+        Returns:
+            list[dict[str, Any]]: Extracted postings in chunk order.
+        """
+        chunks = [chunk for chunk in chunks if chunk.strip()]
+        cache = self.cache
+        if cache is None:
+            results = await asyncio.gather(*(self._request(url, batch) for batch in self.pack_chunks(chunks)))
+            return [item for items in results for item in items]
+
+        keys = [cache.key(chunk, self.instruction, self.schema, self.llm_config.provider) for chunk in chunks]
+        per_chunk: list[list[dict[str, Any]] | None] = await cache.aget_many(keys)
+        missing = [i for i, items in enumerate(per_chunk) if items is None]
+        batches: list[list[int]] = []
+        start = 0
+        for batch in self.pack_chunks([chunks[i] for i in missing]):
+            batches.append(missing[start : start + len(batch)])
+            start += len(batch)
+
+        results = await asyncio.gather(
+            *(
+                self._cached_request(cache, url, [chunks[i] for i in batch], [keys[i] for i in batch])
+                for batch in batches
+            )
+        )
+        for batch, batch_items in zip(batches, results):
+            for i, items in zip(batch, batch_items):
+                per_chunk[i] = items
+        return [item for items in per_chunk if items for item in items]
+
+    async def _cached_request(
+        self, cache: LLMCache, url: str, chunks: list[str], keys: list[str]
+    ) -> list[list[dict[str, Any]]]:
+        """Extract postings from one batch of uncached chunks and cache them.
+
+        Postings are cached per chunk when each can be traced back to the listing it came from.
+        Otherwise the whole batch is cached under a key of its chunks, which is hit again as long as
+        the same listings miss together.
+
+        Args:
+            cache: Cache of extracted items
+            url: URL of the page the chunks come from
+            chunks: HTML chunks of the batch
+            keys: Cache keys of the chunks
+
+        Returns:
+            list[list[dict[str, Any]]]: Postings per chunk.
+        """
+        if len(chunks) == 1:
+            items = await self._request(url, chunks)
+            await cache.aset_many([(keys[0], items)])
+            return [items]
+
+        empty: list[list[dict[str, Any]]] = [[] for _ in chunks[1:]]
+        batch_key = cache.batch_key(keys)
+        cached = await cache.aget_batch(batch_key, len(chunks))
+        if cached is not None:
+            return [cached, *empty]
+
+        items = await self._request(url, chunks)
+        per_chunk = self.assign_items(chunks, items)
+        if per_chunk is None:
+            await cache.aset_many([(batch_key, items)])
+            return [items, *empty]
+        await cache.aset_many(list(zip(keys, per_chunk)))
+        return per_chunk
+
+    @staticmethod
+    def assign_items(chunks: list[str], items: list[dict[str, Any]]) -> list[list[dict[str, Any]]] | None:
+        """Attribute extracted postings to the chunks they were extracted from by their URL.
+
+        Args:
+            chunks: HTML chunks sent in one request
+            items: Postings extracted from them
+
+        Returns:
+            list[list[dict[str, Any]]] | None: Postings per chunk, or None if a posting has no URL
+            or its URL does not appear in exactly one chunk.
+        """
+        assigned: list[list[dict[str, Any]]] = [[] for _ in chunks]
+        for item in items:
+            url = item.get("url")
+            if not url or not isinstance(url, str):
+                return None
+            # Listings usually link to the posting with a relative URL
+            parts = urlparse(url)
+            needle = parts.path if parts.path.strip("/") else url
+            owners = [i for i, chunk in enumerate(chunks) if needle in chunk]
+            if len(owners) != 1:
+                return None
+            assigned[owners[0]].append(item)
+        return assigned
+
+    async def aextract(self, url: str, html: str, base_selector: str | None = None) -> list[dict[str, Any]]:
+        """Extract postings from a page without blocking the event loop.
+
+        Args:
+            url: URL of the page
+            html: Page HTML
+            base_selector: CSS selector of one listing. If it matches, every listing becomes a
+                chunk; otherwise the page is split into chunks of ``chunk_token_threshold`` tokens.
+
+        Returns:
+            list[dict[str, Any]]: Extracted postings.
+        """
+        chunks = split_listings(html, base_selector) if base_selector else []
+        if not chunks:
+            chunks = merge_chunks(
+                docs=[html],
+                target_size=self.chunk_token_threshold,
+                overlap=int(self.chunk_token_threshold * self.overlap_rate),
+                word_token_ratio=self.word_token_rate,
+            )
+        return await self.arun(url, chunks)
 
     async def extract_with_retries(
         self,
@@ -103,6 +510,9 @@ Do not make assumptions or add information not present in the HTML.""",
     ) -> dict[str, Any]:
         """Extract job information with retry logic.
 
+        The synchronous parent ``extract`` runs in a worker thread so the event loop is not blocked,
+        and failed attempts are retried after an exponential backoff.
+
         Args:
             html: HTML content to extract from
             url: URL of the page being processed
@@ -113,10 +523,10 @@ Do not make assumptions or add information not present in the HTML.""",
         Returns:
             dict[str, Any]: Extracted job information
         """
+        extract = super().extract
         for attempt in range(max_retries):
             try:
-                # Call parent's extract method but override the non-async extract
-                result = super().extract(ix=ix, html=html, url=url)
+                result = await asyncio.to_thread(extract, ix=ix, html=html, url=url)
                 if result:
                     return result[0] if isinstance(result, list) else result
                 else:
@@ -125,12 +535,13 @@ Do not make assumptions or add information not present in the HTML.""",
                 if attempt == max_retries - 1 and fallback_provider:
                     # Try fallback provider on last attempt
                     self.llm_config.provider = fallback_provider
-                    result = super().extract(ix=ix, html=html, url=url)
+                    result = await asyncio.to_thread(extract, ix=ix, html=html, url=url)
                     if result:
                         return result[0] if isinstance(result, list) else result
                     else:
                         return {}
                 elif attempt < max_retries - 1:
+                    await asyncio.sleep(self._backoff_delay(attempt))
                     continue
                 raise
         return {}  # Return empty dict if all attempts fail
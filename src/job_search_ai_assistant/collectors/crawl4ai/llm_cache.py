@@ -0,0 +1,265 @@
+"""Persistent content-addressed cache of LLM extraction results."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from ...api.config import logger
+from .cache import CacheStats
+
+# Default location of the cache database, shared by all clients of the user
+DEFAULT_LLM_CACHE_PATH = Path.home() / ".cache" / "job-search-ai-assistant" / "llm_cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS llm_results_used ON llm_results (used);
+"""
+
+
+def normalize_chunk(chunk: str) -> str:
+    """Normalize an HTML chunk so formatting-only differences share a cache key.
+
+    Args:
+        chunk: HTML chunk sent to the LLM.
+
+    Returns:
+        str: Chunk with runs of whitespace collapsed to a single space.
+    """
+    return " ".join(chunk.split())
+
+
+class LLMCache:
+    """SQLite-backed cache of extracted items keyed by the hash of everything that shapes the answer.
+
+    Entries never expire: a changed listing hashes to a new key. The least recently used entries
+    are evicted once the stored results exceed ``max_bytes``.
+
+    The ``a``-prefixed methods run the database work in a worker thread, so lookups and writes of
+    a page do not block the event loop; the connection is shared under a lock.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_LLM_CACHE_PATH,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache. The database is opened on first use.
+
+        Args:
+            path: Database file, or ``":memory:"`` for a cache that lives as long as the object.
+            max_bytes: Maximum size of the stored results in bytes.
+            clock: Wall clock in seconds, used to order entries for eviction across runs.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._clock = clock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._bytes = 0
+
+    @staticmethod
+    def key(chunk: str, instruction: Optional[str], schema: Any, provider: str) -> str:
+        """Build the cache key of one chunk.
+
+        Args:
+            chunk: HTML chunk sent to the LLM.
+            instruction: Extraction instruction.
+            schema: JSON schema of the extracted items.
+            provider: LLM provider and model, e.g. ``openai/gpt-4``.
+
+        Returns:
+            str: Hex digest of the normalized chunk, instruction, schema and provider.
+        """
+        payload = json.dumps([normalize_chunk(chunk), instruction or "", schema, provider], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def batch_key(keys: Iterable[str]) -> str:
+        """Build the cache key of a batch of chunks sent in one request.
+
+        Args:
+            keys: Keys of the chunks in request order.
+
+        Returns:
+            str: Hex digest of the chunk keys.
+        """
+        return hashlib.sha256(":".join(["batch", *keys]).encode()).hexdigest()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Database connection, created with the table on first use."""
+        with self._lock:
+            if self._conn is None:
+                if self.path != ":memory:":
+                    Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+                self._bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_results").fetchone()[0]
+                self._conn = conn
+            return self._conn
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM llm_results").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Size of the stored results in bytes."""
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_results").fetchone()[0]
+
+    def get(self, key: str) -> Optional[list[dict[str, Any]]]:
+        """Look up cached items and update the counters.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Optional[list[dict[str, Any]]]: Cached items, or None on a miss.
+        """
+        return self.get_many([key])[0]
+
+    def set(self, key: str, items: list[dict[str, Any]]) -> None:
+        """Store extracted items, evicting least recently used entries when over capacity.
+
+        Args:
+            key: Cache key.
+            items: Items extracted by the LLM.
+        """
+        self.set_many([(key, items)])
+
+    def get_many(self, keys: list[str], count: bool = True) -> list[Optional[list[dict[str, Any]]]]:
+        """Look up cached items of several keys, marking the hits as used in one transaction.
+
+        Args:
+            keys: Cache keys.
+            count: Whether to count the hits and misses in ``stats``.
+
+        Returns:
+            list[Optional[list[dict[str, Any]]]]: Cached items per key, None on a miss.
+        """
+        with self._lock:
+            conn = self.conn
+            values = [conn.execute("SELECT value FROM llm_results WHERE key = ?", (key,)).fetchone() for key in keys]
+            now = self._clock()
+            hits = [(now, key) for key, row in zip(keys, values) if row is not None]
+            if hits:
+                conn.execute("BEGIN")
+                conn.executemany("UPDATE llm_results SET used = ? WHERE key = ?", hits)
+                conn.execute("COMMIT")
+        if count:
+            self.stats.hits += len(hits)
+            self.stats.misses += len(keys) - len(hits)
+        return [None if row is None else json.loads(row[0]) for row in values]
+
+    def set_many(self, entries: list[tuple[str, list[dict[str, Any]]]]) -> None:
+        """Store extracted items of several keys in one transaction, evicting when over capacity.
+
+        Args:
+            entries: Cache keys and the items extracted by the LLM.
+        """
+        rows = []
+        for key, items in entries:
+            value = json.dumps(items, default=str)
+            rows.append((key, value, len(key) + len(value.encode())))
+        with self._lock:
+            conn = self.conn
+            now = self._clock()
+            conn.execute("BEGIN")
+            for key, value, size in rows:
+                old = conn.execute("SELECT size FROM llm_results WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_results (key, value, size, created, used) VALUES (?, ?, ?, ?, ?)",
+                    (key, value, size, now, now),
+                )
+                self._bytes += size - (old[0] if old else 0)
+            conn.execute("COMMIT")
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    async def aget_many(self, keys: list[str]) -> list[Optional[list[dict[str, Any]]]]:
+        """Look up cached items of several keys in a worker thread, see ``get_many``."""
+        return await asyncio.to_thread(self.get_many, keys)
+
+    async def aget_batch(self, batch_key: str, chunks: int) -> Optional[list[dict[str, Any]]]:
+        """Look up the cached items of a batch whose chunks were each counted as a miss.
+
+        A hit turns the misses of its chunks into hits, so the hit rate counts listings
+        rather than lookups; a miss adds nothing, as its chunks are already counted.
+
+        Args:
+            batch_key: Cache key of the batch, see ``batch_key``.
+            chunks: Number of chunks in the batch.
+
+        Returns:
+            Optional[list[dict[str, Any]]]: Cached items of the batch, or None on a miss.
+        """
+        items = (await asyncio.to_thread(self.get_many, [batch_key], False))[0]
+        if items is not None:
+            self.stats.misses -= chunks
+            self.stats.hits += chunks
+        return items
+
+    async def aset_many(self, entries: list[tuple[str, list[dict[str, Any]]]]) -> None:
+        """Store extracted items of several keys in a worker thread, see ``set_many``."""
+        await asyncio.to_thread(self.set_many, entries)
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        excess = self._bytes - self.max_bytes
+        doomed: list[tuple[str]] = []
+        for key, size in self.conn.execute("SELECT key, size FROM llm_results ORDER BY used"):
+            if excess <= 0:
+                break
+            doomed.append((key,))
+            excess -= size
+            self._bytes -= size
+        self.conn.executemany("DELETE FROM llm_results WHERE key = ?", doomed)
+        self.stats.evictions += len(doomed)
+        logger.debug(f"Evicted {len(doomed)} LLM results from {self.path}")
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self.conn.execute("DELETE FROM llm_results")
+            self._bytes = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def to_dict(self) -> dict[str, float]:
+        """Convert the cache counters and size to dictionary format.
+
+        Returns:
+            Dictionary containing hits, misses, evictions, hit rate, entry count and size in bytes.
+        """
+        stats = self.stats.to_dict()
+        return {
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "evictions": stats["evictions"],
+            "hit_rate": stats["hit_rate"],
+            "entries": len(self),
+            "bytes": self.size,
+        }
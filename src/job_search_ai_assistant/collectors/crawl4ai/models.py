@@ -1,8 +1,65 @@
 """Job posting data models."""
 
+import dataclasses
+from functools import cached_property
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, ValidationInfo, field_validator, model_validator
+from pydantic.dataclasses import dataclass
+
+from ..salary import Salary, SalaryPeriod, parse_salary
+
+
+def _wrap_requirement(v: Any) -> Any:
+    """Return requirements extracted as one text as the only requirement, anything else unchanged."""
+    return [v] if isinstance(v, str) else v
+
+
+def _clean_requirements(v: list[str]) -> list[str]:
+    """Drop empty requirements, raising ValueError if none is left."""
+    # Requirements were stripped with every other string, see ``str_strip_whitespace``
+    requirements = [req for req in v if req]
+    if not requirements:
+        raise ValueError("At least one non-empty requirement must be provided")
+    return requirements
+
+
+def _derived_values(posting: "JobPosting | PostingRecord", info: ValidationInfo) -> dict[str, Any]:
+    """Return the platform of the validation context and the salary bounds parsed from the salary text.
+
+    Bounds given with the posting are kept. A ``salaries`` dictionary in the context memoizes
+    parsed salaries, as the same texts recur across a page.
+    """
+    context = info.context or {}
+    values: dict[str, Any] = {}
+    if "platform" in context:
+        values["platform"] = context["platform"]
+    if posting.salary_period is None and posting.salary_min is None and posting.salary_max is None:
+        salaries = context.get("salaries")
+        if salaries is None:
+            parsed = parse_salary(posting.salary)
+        elif posting.salary in salaries:
+            parsed = salaries[posting.salary]
+        else:
+            parsed = salaries[posting.salary] = parse_salary(posting.salary)
+        if parsed is not None:
+            values["salary_min"] = parsed.min_amount
+            values["salary_max"] = parsed.max_amount
+            values["salary_currency"] = parsed.currency
+            values["salary_period"] = parsed.period
+    return values
+
+
+def _parsed_salary(posting: "JobPosting | PostingRecord") -> Salary | None:
+    """Return the parsed salary bounds of a posting, or None if it states no salary amount."""
+    if posting.salary_period is None:
+        return None
+    return Salary(
+        min_amount=posting.salary_min,
+        max_amount=posting.salary_max,
+        currency=posting.salary_currency,
+        period=posting.salary_period,
+    )
 
 
 class JobPosting(BaseModel):
@@ -17,68 +74,85 @@ class JobPosting(BaseModel):
     url: HttpUrl = Field(..., description="Original job posting URL")
     apply_url: HttpUrl | None = Field(None, description="Direct application URL")
     platform: str | None = Field(None, description="Source platform name (e.g., LinkedIn, Djinni)")
+    posted_date: str | None = Field(None, description="Date when the job was posted (ISO format)")
+    salary_min: float | None = Field(None, description="Lower salary bound parsed from salary")
+    salary_max: float | None = Field(None, description="Upper salary bound parsed from salary")
+    salary_currency: str | None = Field(None, description="Salary currency code parsed from salary")
+    salary_period: SalaryPeriod | None = Field(None, description="Period the salary bounds are paid for")
 
-    @field_validator("requirements")
+    @field_validator("requirements", mode="before")
     @classmethod
-    def validate_requirements(cls, v: list[str]) -> list[str]:
-        """Validate job requirements.
+    def wrap_requirement(cls, v: Any) -> Any:
+        """Accept requirements extracted as one text, as by a ``text`` field of an extraction config.
 
         Args:
-            v: List of requirement strings
+            v: Raw requirements
 
         Returns:
-            list[str]: Cleaned requirements list
-
-        Raises:
-            ValueError: If requirements are empty or only whitespace
+            Any: The text as the only requirement, anything else unchanged
         """
-        requirements = [req.strip() for req in v if req and req.strip()]
-        if not requirements:
-            raise ValueError("At least one non-empty requirement must be provided")
-        return requirements
+        return _wrap_requirement(v)
 
-    @field_validator("url", "apply_url")
+    @field_validator("requirements")
     @classmethod
-    def validate_url_scheme(cls, v: HttpUrl | None) -> HttpUrl | None:
-        """Validate URL scheme.
+    def validate_requirements(cls, v: list[str]) -> list[str]:
+        """Validate job requirements.
 
         Args:
-            v: URL to validate
+            v: List of requirement strings
 
         Returns:
-            HttpUrl | None: Validated URL
+            list[str]: Cleaned requirements list
 
         Raises:
-            ValueError: If URL scheme is not http/https
+            ValueError: If requirements are empty or only whitespace
         """
-        if v is None:
-            return None
-        if str(v).startswith(("http://", "https://")):
-            return v
-        raise ValueError("URL must use http or https scheme")
+        return _clean_requirements(v)
 
-    @field_validator("title", "company", "location", "description")
-    @classmethod
-    def strip_whitespace(cls, v: str) -> str:
-        """Strip whitespace from string fields.
+    @model_validator(mode="after")
+    def parse_salary_range(self, info: ValidationInfo) -> "JobPosting":
+        """Parse the salary text into numeric bounds unless they were given, and set the platform of the context.
+
+        Fields are set in the instance dictionary at once, which saves an assignment through
+        ``BaseModel.__setattr__`` per field on every validated posting.
 
         Args:
-            v: String value to clean
+            info: Validation info. A ``platform`` in its context is set as the posting's platform,
+                so pages are validated without copying every item to add it. A ``salaries`` dictionary
+                in its context memoizes parsed salaries, as the same texts recur across a page.
 
         Returns:
-            str: Cleaned string
-
-        Raises:
-            ValueError: If string is empty after stripping
+            JobPosting: Posting with salary_min, salary_max, salary_currency and salary_period set
+            if the salary text contains an amount.
         """
-        v = v.strip()
-        if not v:
-            raise ValueError("Field cannot be empty or whitespace")
-        return v
+        values = _derived_values(self, info)
+        if values:
+            self.__dict__.update(values)
+            self.__pydantic_fields_set__.update(values)
+        return self
+
+    @cached_property
+    def folded_title(self) -> str:
+        """Case-folded title, computed once for text filters."""
+        return self.title.casefold()
+
+    @cached_property
+    def folded_description(self) -> str:
+        """Case-folded description, computed once for text filters."""
+        return self.description.casefold()
+
+    @property
+    def parsed_salary(self) -> Salary | None:
+        """Parsed salary bounds, or None if the posting states no salary amount."""
+        return _parsed_salary(self)
 
     class Config:
         """Pydantic model configuration."""
 
+        # Stripped while validating the types, so together with ``min_length`` no Python
+        # validator runs to reject blank titles, companies, locations or descriptions
+        str_strip_whitespace = True
+
         json_schema_extra: ClassVar[dict[str, Any]] = {
             "example": {
                 "title": "Senior Python Developer",
@@ -96,3 +170,75 @@ class JobPosting(BaseModel):
                 "platform": "LinkedIn",
             }
         }
+
+
+@dataclass(slots=True, kw_only=True, config=ConfigDict(str_strip_whitespace=True))
+class PostingRecord:
+    """Posting as it moves through a search, from a result page to the API and the job store.
+
+    Has the fields and validation of ``JobPosting``, applied once when the extracted items of a page
+    are ingested; everything downstream reads the record without validating it again. Fields live in
+    slots rather than an instance dictionary, and no set of explicitly given fields is kept, so a record
+    takes about a third of the memory of a ``JobPosting``.
+    """
+
+    title: str = Field(min_length=1)
+    company: str = Field(min_length=1)
+    location: str = Field(min_length=1)
+    salary: str | None = None
+    description: str = Field(min_length=1)
+    requirements: list[str] = Field(min_length=1)
+    url: HttpUrl
+    apply_url: HttpUrl | None = None
+    platform: str | None = None
+    posted_date: str | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: str | None = None
+    salary_period: SalaryPeriod | None = None
+    # Case-folded texts, filled on first use by the text filters
+    _folded_title: str | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    _folded_description: str | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+    @field_validator("requirements", mode="before")
+    @classmethod
+    def wrap_requirement(cls, v: Any) -> Any:
+        """Accept requirements extracted as one text, see ``JobPosting.wrap_requirement``."""
+        return _wrap_requirement(v)
+
+    @field_validator("requirements")
+    @classmethod
+    def validate_requirements(cls, v: list[str]) -> list[str]:
+        """Drop empty requirements, see ``JobPosting.validate_requirements``."""
+        return _clean_requirements(v)
+
+    @model_validator(mode="after")
+    def parse_salary_range(self, info: ValidationInfo) -> "PostingRecord":
+        """Parse the salary and set the platform of the context, see ``JobPosting.parse_salary_range``."""
+        for name, value in _derived_values(self, info).items():
+            setattr(self, name, value)
+        return self
+
+    @property
+    def folded_title(self) -> str:
+        """Case-folded title, computed once for text filters."""
+        if self._folded_title is None:
+            self._folded_title = self.title.casefold()
+        return self._folded_title
+
+    @property
+    def folded_description(self) -> str:
+        """Case-folded description, computed once for text filters."""
+        if self._folded_description is None:
+            self._folded_description = self.description.casefold()
+        return self._folded_description
+
+    @property
+    def parsed_salary(self) -> Salary | None:
+        """Parsed salary bounds, or None if the posting states no salary amount."""
+        return _parsed_salary(self)
+
+
+# A posting as read by the filters, the job store and the mapping to the API: found by a crawl,
+# or stored and loaded again
+Posting = JobPosting | PostingRecord
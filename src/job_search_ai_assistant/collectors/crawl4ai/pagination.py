@@ -0,0 +1,220 @@
+"""Pagination of job search results across platform pagination styles."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Awaitable
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from ...api.config import logger
+from ..platforms.base import PaginationStyle, PlatformConfig
+from .exceptions import RateLimitError
+
+PageFetcher = Callable[[str], Awaitable[list[dict[str, Any]]]]
+SessionFetcher = Callable[[Optional[str], bool], Awaitable[list[dict[str, Any]]]]
+
+
+class PaginationConfig(BaseModel):
+    """How to walk through the result pages of a search."""
+
+    style: PaginationStyle = Field(PaginationStyle.NUMBERED, description="Pagination style of the platform")
+    selector: str | None = Field(None, description="Selector of the 'more' button or next page link")
+    page_param: str = Field("page", description="Query parameter holding the page number")
+    max_pages: int = Field(1, ge=1, description="Maximum number of pages to scrape")
+    concurrency: int = Field(3, ge=1, description="Pages fetched in parallel for numbered pagination")
+    page_wait: float = Field(1.0, ge=0, description="Seconds to wait for appended results after a click")
+
+    @classmethod
+    def from_platform(cls, config: PlatformConfig) -> "PaginationConfig":
+        """Build pagination settings from a platform configuration.
+
+        Args:
+            config: Platform configuration.
+
+        Returns:
+            PaginationConfig: Pagination settings; a single page if the platform declares no style.
+        """
+        if config.pagination_style is None:
+            return cls()
+        return cls(
+            style=config.pagination_style,
+            selector=config.pagination_selector,
+            page_param=config.page_param or "page",
+            max_pages=config.max_pages or 1,
+            page_wait=config.dynamic_wait or 1.0,
+        )
+
+
+def page_url(url: str, page_param: str, page: int) -> str:
+    """Return the URL of a numbered results page.
+
+    Args:
+        url: Search URL of the first page.
+        page_param: Query parameter holding the page number.
+        page: 1-based page number.
+
+    Returns:
+        str: URL with the page parameter set.
+    """
+    parts = urlparse(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != page_param]
+    query.append((page_param, str(page)))
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+
+def next_page_js(style: PaginationStyle, selector: str | None) -> str:
+    """Build the JavaScript that loads the next batch of results in the current page.
+
+    Args:
+        style: Pagination style of the platform.
+        selector: Selector of the button loading more results.
+
+    Returns:
+        str: JavaScript snippet for ``CrawlerRunConfig.js_code``.
+    """
+    click = (
+        f"const button = document.querySelector({json.dumps(selector)}); if (button) button.click();"
+        if selector
+        else ""
+    )
+    if style is PaginationStyle.INFINITE_SCROLL:
+        return f"window.scrollTo(0, document.body.scrollHeight); {click}"
+    return click
+
+
+def _item_key(item: dict[str, Any]) -> str:
+    """Identify a posting across pages, preferring its URL."""
+    return str(item.get("url") or json.dumps(item, sort_keys=True, default=str))
+
+
+class _NewItems:
+    """Tracks which postings were already seen across pages."""
+
+    def __init__(self) -> None:
+        self._seen: set[str] = set()
+
+    def __call__(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        new = []
+        for item in items:
+            key = _item_key(item)
+            if key not in self._seen:
+                self._seen.add(key)
+                new.append(item)
+        return new
+
+
+async def iter_numbered_pages(
+    fetch: PageFetcher,
+    url: str,
+    pagination: PaginationConfig,
+    errors: Optional[list[Exception]] = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Fetch numbered pages in parallel windows and yield new postings as each page arrives.
+
+    The first page is fetched on its own so its errors propagate; failures of later pages end
+    the pagination, except throttling, which is raised. Pagination stops after the window in
+    which a page yields no new postings.
+
+    Args:
+        fetch: Coroutine function returning the extracted items of a URL.
+        url: Search URL of the first page.
+        pagination: Pagination settings.
+        errors: List the failures of later pages are appended to, so the caller knows results
+            were lost. If None, they are only logged.
+
+    Yields:
+        list[dict[str, Any]]: Postings not seen on earlier pages.
+
+    Raises:
+        RateLimitError: If the site throttled any page.
+    """
+    new_items = _NewItems()
+    first = new_items(await fetch(page_url(url, pagination.page_param, 1)))
+    yield first
+    if not first:
+        return
+
+    page = 2
+    while page <= pagination.max_pages:
+        window = range(page, min(page + pagination.concurrency, pagination.max_pages + 1))
+        tasks = [asyncio.ensure_future(fetch(page_url(url, pagination.page_param, number))) for number in window]
+        exhausted = False
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    items = new_items(await next_done)
+                except RateLimitError:
+                    # Fetching further pages would only hit the throttled site again
+                    raise
+                except Exception as e:
+                    _page_lost(url, e, errors)
+                    exhausted = True
+                    continue
+                exhausted = exhausted or not items
+                if items:
+                    yield items
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancelled fetches, so their browsers are back in the pool and their
+            # errors are retrieved
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if exhausted:
+            return
+        page += len(window)
+
+
+async def iter_session_pages(
+    fetch: SessionFetcher,
+    pagination: PaginationConfig,
+    errors: Optional[list[Exception]] = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Load further results inside one browser session and yield new postings after each load.
+
+    Used for "more" buttons and infinite scroll, where every load re-renders the page with all
+    results so far; only postings not seen before are yielded.
+
+    Args:
+        fetch: Coroutine function ``fetch(js_code, js_only)`` crawling the session page.
+        pagination: Pagination settings.
+        errors: List the failures of later loads are appended to. If None, they are only logged.
+
+    Yields:
+        list[dict[str, Any]]: Postings not seen on earlier loads.
+
+    Raises:
+        RateLimitError: If the site throttled any load.
+    """
+    new_items = _NewItems()
+    first = new_items(await fetch(None, False))
+    yield first
+    if not first:
+        return
+
+    js_code = next_page_js(pagination.style, pagination.selector)
+    for _ in range(pagination.max_pages - 1):
+        try:
+            items = new_items(await fetch(js_code, True))
+        except RateLimitError:
+            raise
+        except Exception as e:
+            _page_lost(f"{pagination.style.value} session", e, errors)
+            return
+        if not items:
+            return
+        yield items
+
+
+def _page_lost(source: str, error: Exception, errors: Optional[list[Exception]]) -> None:
+    """Log a later page that failed and record it for the caller."""
+    logger.warning(f"Pagination of {source} ended early: {error}")
+    if errors is not None:
+        errors.append(error)
+
+
+def new_session_id() -> str:
+    """Generate a unique browser session id for session-based pagination."""
+    return f"jobs-{uuid4().hex}"
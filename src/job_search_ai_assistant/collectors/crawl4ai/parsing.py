@@ -0,0 +1,277 @@
+"""Extraction, validation and filtering of result pages, on the event loop or in worker processes."""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, NamedTuple, Optional, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
+
+from ...api.config import logger
+from ...api.schemas.search import SearchFilters
+from ..matching import JobMatcher
+from ..salary import SalaryFilter
+from .exceptions import ScrapingError
+from .models import JobPosting, PostingRecord
+from .static import ListingExtractor
+from .telemetry import INVALID_POSTINGS, observe_stage
+
+T = TypeVar("T")
+
+# Validator of a whole page of postings, built once
+_POSTINGS = TypeAdapter(list[PostingRecord])
+
+# Extractors compiled by the current worker, per thread as compiled lxml selectors are not shared
+_local = threading.local()
+
+
+class InvalidPosting(NamedTuple):
+    """Extracted item that failed validation as a posting."""
+
+    index: int
+    item: Any
+    errors: list[dict[str, Any]]
+
+
+def validate_postings(items: list[dict[str, Any]], platform: str) -> tuple[list[PostingRecord], list[InvalidPosting]]:
+    """Validate the extracted items of a page as postings of a platform, in one call into pydantic-core.
+
+    This is where postings are validated; the records are passed on to the API and the job store
+    as they are.
+
+    The platform is passed in the validation context instead of being added to a copy of every
+    item, and each distinct salary text is parsed once. Items failing validation are left out
+    rather than failing the page; the others are then validated again.
+
+    Args:
+        items: Extracted items.
+        platform: Platform name set on every posting.
+
+    Returns:
+        tuple[list[PostingRecord], list[InvalidPosting]]: Validated postings, in the order of the items,
+        and the items that failed validation with their errors.
+    """
+    try:
+        return _POSTINGS.validate_python(items, context={"platform": platform, "salaries": {}}), []
+    except ValidationError as e:
+        errors: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+        for error in e.errors(include_url=False):
+            index, *loc = error["loc"]
+            errors[index].append({**error, "loc": tuple(loc)})
+    invalid = [InvalidPosting(index, items[index], item_errors) for index, item_errors in errors.items()]
+    valid = [item for index, item in enumerate(items) if index not in errors]
+    return _POSTINGS.validate_python(valid, context={"platform": platform, "salaries": {}}), invalid
+
+
+def report_invalid(platform: str, invalid: list[InvalidPosting]) -> None:
+    """Count and log the items of a page that failed validation.
+
+    Args:
+        platform: Platform name.
+        invalid: Items that failed validation, as returned by ``validate_postings``.
+    """
+    if not invalid:
+        return
+    INVALID_POSTINGS.inc(platform, amount=len(invalid))
+    first = invalid[0].errors[0]
+    logger.warning(
+        f"Dropped {len(invalid)} invalid postings of {platform}, e.g. {'.'.join(map(str, first['loc']))}: {first['msg']}"
+    )
+
+
+def filter_postings(jobs: list[PostingRecord], criteria: SearchFilters) -> list[PostingRecord]:
+    """Filter postings based on search criteria.
+
+    Args:
+        jobs: Postings to filter.
+        criteria: Search criteria to apply.
+
+    Returns:
+        list[PostingRecord]: Postings matching the criteria.
+    """
+    matcher = JobMatcher.from_criteria(criteria)
+    # Salaries were parsed when the postings were validated, so this is a numeric comparison
+    salary_filter = SalaryFilter.from_criteria(criteria)
+    if not matcher.active and salary_filter is None:
+        return jobs
+
+    return [
+        job
+        for job in jobs
+        if matcher.matches(job) and (salary_filter is None or salary_filter.matches(job.parsed_salary))
+    ]
+
+
+def _extract(html: str, extraction_config: dict[str, Any], base_url: str) -> list[dict[str, Any]]:
+    """Extract the listings of a page in a worker, compiling each config once per worker."""
+    extractors = getattr(_local, "extractors", None)
+    if extractors is None:
+        extractors = _local.extractors = {}
+    key = repr(extraction_config)
+    extractor = extractors.get(key)
+    if extractor is None:
+        extractor = extractors[key] = ListingExtractor(extraction_config)
+    return extractor.extract(html, base_url)
+
+
+def select_postings(items: list[dict[str, Any]], platform: str, criteria: SearchFilters) -> list[PostingRecord]:
+    """Validate the items of a page as postings and filter them on the event loop, recording both stages.
+
+    Args:
+        items: Extracted items.
+        platform: Platform name set on every posting.
+        criteria: Search criteria to apply.
+
+    Returns:
+        list[PostingRecord]: Validated postings matching the criteria.
+    """
+    started = time.perf_counter()
+    jobs, invalid = validate_postings(items, platform)
+    report_invalid(platform, invalid)
+    started = observe_stage(platform, "validate", started)
+    matches = filter_postings(jobs, criteria)
+    observe_stage(platform, "filter", started)
+    return matches
+
+
+def _select(
+    items: list[dict[str, Any]], platform: str, criteria: SearchFilters
+) -> tuple[list[PostingRecord], list[InvalidPosting], float]:
+    """Validate and filter the items of a page in a worker.
+
+    Returns:
+        tuple[list[PostingRecord], list[InvalidPosting], float]: Matching postings, the items that
+        failed validation and the seconds spent filtering.
+    """
+    jobs, invalid = validate_postings(items, platform)
+    started = time.perf_counter()
+    matches = filter_postings(jobs, criteria)
+    return matches, invalid, time.perf_counter() - started
+
+
+def _warm_up() -> None:
+    """Run extraction and validation once when a worker starts, so the first page does not pay for it."""
+    ListingExtractor({"baseSelector": "div", "fields": [{"name": "title", "selector": "h2"}]}).extract(
+        "<div><h2>Python Developer</h2></div>"
+    )
+    validate_postings([JobPosting.model_config["json_schema_extra"]["example"]], "warm-up")
+
+
+def _ready() -> int:
+    """Return the process ID of the worker, once it has started."""
+    return os.getpid()
+
+
+def _gil_enabled() -> bool:
+    """Whether the interpreter runs Python code one thread at a time."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+class ParserPool:
+    """Workers extracting, validating and filtering result pages off the event loop.
+
+    The workers are processes, or threads on free-threaded builds where threads run in parallel.
+    Pages are sent as HTML with their extraction config, which each worker compiles once; only
+    the extracted items and the matching postings are sent back.
+    """
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        """Initialize the pool without starting any worker.
+
+        Args:
+            workers: Number of workers. If None, one per CPU.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._executor: Optional[Executor] = None
+
+    @property
+    def started(self) -> bool:
+        """Whether the workers have been started."""
+        return self._executor is not None
+
+    def _new_executor(self) -> Executor:
+        """Create the executor running the workers."""
+        if not _gil_enabled():
+            return ThreadPoolExecutor(self.workers, thread_name_prefix="parser", initializer=_warm_up)
+        # Workers are spawned rather than forked, which is unsafe once the event loop runs threads
+        return ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"), initializer=_warm_up)
+
+    async def start(self) -> None:
+        """Start every worker and wait until it is warm, so no page waits for a worker to start."""
+        if self._executor is not None:
+            return
+        self._executor = self._new_executor()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._executor, _ready) for _ in range(self.workers)))
+
+    async def close(self) -> None:
+        """Stop the workers, cancelling pages not yet being parsed."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, cancel_futures=True)
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        """Run a function in a worker, starting the workers on first use.
+
+        Raises:
+            ScrapingError: If a worker died, e.g. killed for running out of memory. The workers
+                are started again by the next call.
+        """
+        if self._executor is None:
+            await self.start()
+        executor = self._executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+        except BrokenExecutor as e:
+            if self._executor is executor:
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise ScrapingError(message=f"Parser worker failed: {e}", error_type="EXTRACTION_ERROR") from e
+
+    async def extract(
+        self, html: str, extraction_config: dict[str, Any], base_url: str = "", platform: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """Extract the listings of a page in a worker.
+
+        Args:
+            html: Page HTML.
+            extraction_config: Extraction config as returned by ``PlatformAdapter.get_extraction_config``.
+            base_url: URL of the page, used to resolve relative links.
+            platform: Platform name under which the extraction time is recorded. If None, it is not recorded.
+
+        Returns:
+            list[dict[str, Any]]: One dictionary per listing.
+        """
+        started = time.perf_counter()
+        items = await self._run(_extract, html, extraction_config, base_url)
+        if platform is not None:
+            observe_stage(platform, "extract", started)
+        return items
+
+    async def select(self, items: list[dict[str, Any]], platform: str, criteria: SearchFilters) -> list[PostingRecord]:
+        """Validate the items of a page as postings and filter them in a worker.
+
+        The records of the worker are unpickled without validating them again. The time spent
+        filtering in the worker is recorded as the filter stage, the rest of the round trip as
+        the validate stage.
+
+        Args:
+            items: Extracted items.
+            platform: Platform name set on every posting.
+            criteria: Search criteria to apply.
+
+        Returns:
+            list[PostingRecord]: Validated postings matching the criteria.
+        """
+        started = time.perf_counter()
+        records, invalid, filter_seconds = await self._run(_select, items, platform, criteria)
+        report_invalid(platform, invalid)
+        observe_stage(platform, "validate", started + filter_seconds)
+        observe_stage(platform, "filter", time.perf_counter() - filter_seconds)
+        return records
@@ -0,0 +1,252 @@
+"""Pool of long-lived AsyncWebCrawler instances."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from typing import Any, Callable, Optional
+
+import psutil
+from pydantic import BaseModel, Field
+
+from ...api.config import logger
+from .exceptions import PoolExhaustedError
+
+
+class BrowserPoolConfig(BaseModel):
+    """Configuration for the browser pool."""
+
+    size: int = Field(4, ge=1, description="Maximum number of browser instances kept alive")
+    max_pages_per_browser: Optional[int] = Field(
+        100, ge=1, description="Recycle a browser after it has served this many pages"
+    )
+    max_rss_mb: Optional[float] = Field(
+        None, gt=0, description="Recycle a browser when the RSS of its own processes exceeds this value (MB)"
+    )
+    acquire_timeout: Optional[float] = Field(
+        30.0, gt=0, description="Seconds to wait for a free browser before giving up"
+    )
+
+
+class PooledCrawler:
+    """A started crawler together with its bookkeeping."""
+
+    def __init__(self, crawler: Any, stack: AsyncExitStack) -> None:
+        """Initialize the pooled crawler.
+
+        Args:
+            crawler: Started AsyncWebCrawler instance.
+            stack: Exit stack that owns the crawler's browser lifecycle.
+        """
+        self.crawler = crawler
+        self.stack = stack
+        self.pages_served = 0
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the underlying browser is still usable."""
+        if not getattr(self.crawler, "ready", True):
+            return False
+        browser_manager = getattr(getattr(self.crawler, "crawler_strategy", None), "browser_manager", None)
+        browser = getattr(browser_manager, "browser", None)
+        return browser is None or bool(browser.is_connected())
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Process ID of the Playwright driver that launched this crawler's browser, if it can be found."""
+        browser_manager = getattr(getattr(self.crawler, "crawler_strategy", None), "browser_manager", None)
+        return driver_pid(getattr(browser_manager, "playwright", None))
+
+    def rss_mb(self) -> Optional[float]:
+        """RSS of this crawler's driver and browser processes in MB, or None if they cannot be found."""
+        pid = self.pid
+        return None if pid is None else _process_tree_rss_mb(pid)
+
+    async def close(self) -> None:
+        """Shut down the underlying browser."""
+        await self.stack.aclose()
+
+
+def driver_pid(playwright: Any) -> Optional[int]:
+    """Return the process ID of the driver of a started Playwright instance, or None if it cannot be found.
+
+    Playwright has no public API for it, so the ID is read from its transport.
+
+    Args:
+        playwright: Playwright instance returned by ``async_playwright().start()``.
+
+    Returns:
+        Optional[int]: Process ID of the driver, the parent of the browser processes.
+    """
+    connection = getattr(getattr(playwright, "_impl_obj", None), "_connection", None)
+    return getattr(getattr(getattr(connection, "_transport", None), "_proc", None), "pid", None)
+
+
+def _process_tree_rss_mb(pid: int) -> Optional[float]:
+    """Return the RSS of a process and its descendants in MB, or None if the process is gone."""
+    try:
+        process = psutil.Process(pid)
+        rss = process.memory_info().rss
+        children = process.children(recursive=True)
+    except psutil.Error:
+        return None
+    for child in children:
+        with suppress(psutil.Error):
+            rss += child.memory_info().rss
+    return rss / (1024 * 1024)
+
+
+class BrowserPool:
+    """Pool of warm AsyncWebCrawler instances that are checked out and returned."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        config: Optional[BrowserPoolConfig] = None,
+    ) -> None:
+        """Initialize the browser pool.
+
+        Args:
+            factory: Callable returning a new, not yet started, AsyncWebCrawler.
+            config: Pool configuration. If None, uses default settings.
+        """
+        self._factory = factory
+        self.config = config or BrowserPoolConfig()
+        self._idle: asyncio.Queue[PooledCrawler] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.config.size)
+        self._all: set[PooledCrawler] = set()
+        # Held while the browsers are launched, so acquires racing the start wait for them
+        # instead of launching browsers of their own
+        self._start_lock = asyncio.Lock()
+        self._started = False
+        self._closed = False
+        self._rss_warned = False
+
+    @property
+    def started(self) -> bool:
+        """Whether the pool has been started and not yet closed."""
+        return self._started and not self._closed
+
+    @property
+    def in_use(self) -> int:
+        """Number of browsers currently checked out."""
+        return len(self._all) - self._idle.qsize()
+
+    @property
+    def idle(self) -> int:
+        """Number of warm browsers waiting to be checked out."""
+        return self._idle.qsize()
+
+    @property
+    def unmeasured(self) -> int:
+        """Number of browsers whose processes cannot be found, so they are never recycled for memory."""
+        return sum(1 for pooled in self._all if pooled.pid is None)
+
+    async def start(self) -> None:
+        """Launch all browsers of the pool up front.
+
+        Concurrent calls, including those of acquires on a pool not yet started, wait for the
+        first one to launch the browsers.
+        """
+        async with self._start_lock:
+            if self.started:
+                return
+            self._closed = False
+            missing = self.config.size - len(self._all)
+            crawlers = await asyncio.gather(*(self._launch() for _ in range(missing)))
+            for pooled in crawlers:
+                self._idle.put_nowait(pooled)
+            self._started = True
+
+    async def close(self) -> None:
+        """Shut down every browser owned by the pool."""
+        self._closed = True
+        self._started = False
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        pooled_crawlers, self._all = self._all, set()
+        for pooled in pooled_crawlers:
+            with suppress(Exception):
+                await pooled.close()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Check out a warm crawler for the duration of the context.
+
+        Yields:
+            A started AsyncWebCrawler instance.
+
+        Raises:
+            PoolExhaustedError: If no browser becomes available within ``acquire_timeout``.
+        """
+        if not self.started:
+            await self.start()
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.config.acquire_timeout)
+        except asyncio.TimeoutError as e:
+            raise PoolExhaustedError(
+                message="Timed out waiting for a free browser",
+                details={"pool_size": self.config.size, "timeout": self.config.acquire_timeout},
+            ) from e
+
+        try:
+            pooled = await self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        try:
+            yield pooled.crawler
+        finally:
+            pooled.pages_served += 1
+            await self._checkin(pooled)
+            self._slots.release()
+
+    async def _launch(self) -> PooledCrawler:
+        """Create and start a new pooled crawler."""
+        stack = AsyncExitStack()
+        crawler = await stack.enter_async_context(self._factory())
+        pooled = PooledCrawler(crawler, stack)
+        self._all.add(pooled)
+        return pooled
+
+    async def _checkout(self) -> PooledCrawler:
+        """Take a healthy idle crawler or launch a new one."""
+        while not self._idle.empty():
+            pooled = self._idle.get_nowait()
+            if pooled.healthy:
+                return pooled
+            await self._discard(pooled)
+        return await self._launch()
+
+    async def _checkin(self, pooled: PooledCrawler) -> None:
+        """Return a crawler to the pool, recycling it if it has reached its limits."""
+        if self._closed or self._needs_recycling(pooled):
+            await self._discard(pooled)
+        else:
+            self._idle.put_nowait(pooled)
+
+    def _needs_recycling(self, pooled: PooledCrawler) -> bool:
+        """Check the page and memory limits of a crawler."""
+        if not pooled.healthy:
+            return True
+        limit = self.config.max_pages_per_browser
+        if limit is not None and pooled.pages_served >= limit:
+            return True
+        if self.config.max_rss_mb is None:
+            return False
+        # Only the crawler's own processes count: the API process and the other browsers do not
+        # make this browser any bigger
+        rss = pooled.rss_mb()
+        if rss is None:
+            if not self._rss_warned:
+                self._rss_warned = True
+                logger.warning("Browser processes not found, browsers are not recycled for memory")
+            return False
+        return rss > self.config.max_rss_mb
+
+    async def _discard(self, pooled: PooledCrawler) -> None:
+        """Close a crawler and forget about it."""
+        self._all.discard(pooled)
+        with suppress(Exception):
+            await pooled.close()
@@ -0,0 +1,260 @@
+"""Adaptive per-host rate limiting of scrape requests."""
+
+import asyncio
+import re
+import time
+from collections.abc import Awaitable, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional, TypeVar
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, Field
+
+from ..platforms.base import PlatformConfig
+from .exceptions import RateLimitError
+
+T = TypeVar("T")
+
+# Response statuses that mean the site wants us to slow down
+BLOCK_STATUSES = frozenset({403, 429})
+
+# Page titles of captcha and bot challenge pages served with a 200 status
+CHALLENGE_TITLE = re.compile(
+    r"<title[^>]*>[^<]*(captcha|just a moment|attention required|security check|security verification)",
+    re.IGNORECASE,
+)
+
+
+class RateLimitPolicy(BaseModel):
+    """Request rate allowed against a single host."""
+
+    rate: float = Field(..., gt=0, description="Requests per second at full speed")
+    burst: int = Field(1, ge=1, description="Requests that may be sent back to back")
+    min_rate: float = Field(0.05, gt=0, description="Lowest rate the limiter backs off to")
+    max_wait: Optional[float] = Field(
+        None, ge=0, description="Seconds a request may queue before RateLimitError is raised; None waits"
+    )
+    backoff_factor: float = Field(0.5, gt=0, lt=1, description="Rate multiplier applied when the site pushes back")
+    recovery_factor: float = Field(1.2, gt=1, description="Rate multiplier applied after sustained success")
+    recovery_after: int = Field(20, ge=1, description="Consecutive successes required to relax the rate")
+
+    @classmethod
+    def from_platform(cls, config: PlatformConfig) -> Optional["RateLimitPolicy"]:
+        """Build the rate limit policy declared by a platform configuration.
+
+        Args:
+            config: Platform configuration.
+
+        Returns:
+            Optional[RateLimitPolicy]: Policy of the platform, or None if it is not rate limited.
+        """
+        if not config.rate_limit:
+            return None
+        return cls(
+            rate=config.rate_limit,
+            burst=config.rate_burst or 1,
+            min_rate=min(cls.model_fields["min_rate"].default, config.rate_limit),
+            max_wait=config.rate_max_wait,
+        )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def check_blocked(
+    url: str,
+    status_code: Optional[int],
+    html: Optional[str] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> None:
+    """Raise if a response shows the site is throttling or challenging us.
+
+    Args:
+        url: Requested URL.
+        status_code: Response status code, if known.
+        html: Response body.
+        headers: Response headers.
+
+    Raises:
+        RateLimitError: On a 403/429 response or a captcha page.
+    """
+    if status_code in BLOCK_STATUSES:
+        reason = f"HTTP {status_code}"
+    elif html and CHALLENGE_TITLE.search(html):
+        reason = "captcha page"
+    else:
+        return
+
+    retry_after = None
+    if headers:
+        retry_after = parse_retry_after(next((v for k, v in headers.items() if k.lower() == "retry-after"), None))
+    raise RateLimitError(
+        message=f"Blocked by {urlparse(url).netloc}: {reason}",
+        details={"url": url, "status_code": status_code, "reason": reason, "retry_after": retry_after},
+    )
+
+
+class TokenBucket:
+    """Token bucket whose rate adapts to how the site responds."""
+
+    def __init__(self, policy: RateLimitPolicy, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            policy: Rate limit policy of the host.
+            clock: Monotonic time source in seconds.
+        """
+        self.policy = policy
+        self.rate = policy.rate
+        self._clock = clock
+        self._tokens = float(policy.burst)
+        self._updated = clock()
+        self._successes = 0
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = self._clock()
+        self._tokens = min(float(self.policy.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """Take a token, queueing behind earlier reservations.
+
+        The balance may go negative: every reservation is scheduled after all earlier ones,
+        so waiting requests are served in arrival order.
+
+        Args:
+            max_wait: Maximum seconds the caller is willing to wait. None waits as long as needed.
+
+        Returns:
+            float: Seconds to wait before sending the request.
+
+        Raises:
+            RateLimitError: If the request would have to wait longer than ``max_wait``.
+        """
+        self._refill()
+        wait = max(0.0, (1.0 - self._tokens) / self.rate)
+        if max_wait is not None and wait > max_wait:
+            raise RateLimitError(
+                message=f"Rate limit queue is {wait:.1f}s long",
+                details={"retry_after": wait, "rate": self.rate},
+            )
+        self._tokens -= 1.0
+        return wait
+
+    def refund(self) -> None:
+        """Return the token of a reservation that was given up before its request was sent."""
+        self._refill()
+        self._tokens = min(float(self.policy.burst), self._tokens + 1.0)
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after the site pushed back.
+
+        Args:
+            retry_after: Seconds the site asked us to wait, if it said so.
+        """
+        self._refill()
+        self.rate = max(self.policy.min_rate, self.rate * self.policy.backoff_factor)
+        self._successes = 0
+        if retry_after:
+            # Push the next free token past the requested delay
+            self._tokens = min(self._tokens, 1.0 - retry_after * self.rate)
+
+    def record_success(self) -> None:
+        """Count a successful request, relaxing the rate after sustained success."""
+        self._successes += 1
+        if self._successes >= self.policy.recovery_after and self.rate < self.policy.rate:
+            self._refill()
+            self.rate = min(self.policy.rate, self.rate * self.policy.recovery_factor)
+            self._successes = 0
+
+
+class RateLimiter:
+    """Token buckets keyed by host."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            clock: Monotonic time source in seconds.
+        """
+        self._clock = clock
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str, policy: RateLimitPolicy) -> TokenBucket:
+        """Return the bucket of the URL's host, creating it on first use.
+
+        Args:
+            url: Request URL.
+            policy: Policy used if the host has no bucket yet.
+
+        Returns:
+            TokenBucket: Bucket of the host.
+        """
+        host = urlparse(url).netloc.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(policy, self._clock)
+        return bucket
+
+    def rates(self) -> dict[str, float]:
+        """Return the current request rate of every host."""
+        return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+    async def run(self, url: str, policy: Optional[RateLimitPolicy], request: Callable[[], Awaitable[T]]) -> T:
+        """Send a request once the host's rate allows it.
+
+        Args:
+            url: Request URL.
+            policy: Rate limit policy of the platform. If None, the request is sent immediately.
+            request: Coroutine function sending the request.
+
+        Returns:
+            The result of ``request``.
+
+        Raises:
+            RateLimitError: If the request would queue longer than ``policy.max_wait``,
+                or the site throttled or challenged the request.
+        """
+        if policy is None:
+            return await request()
+
+        bucket = self.bucket(url, policy)
+        try:
+            wait = bucket.reserve(policy.max_wait)
+        except RateLimitError as e:
+            e.details["url"] = url
+            raise
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                bucket.refund()
+                raise
+
+        try:
+            result = await request()
+        except RateLimitError as e:
+            bucket.penalize(e.details.get("retry_after"))
+            raise
+        bucket.record_success()
+        return result
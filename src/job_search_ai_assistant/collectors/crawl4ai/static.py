@@ -0,0 +1,261 @@
+"""Browser-free fetching and extraction of static job listing pages."""
+
+import time
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+from urllib.parse import urljoin
+
+import httpx
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+from .exceptions import NetworkError
+from .ratelimit import check_blocked
+from .telemetry import observe_stage
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "uk,en;q=0.8",
+}
+
+# Attributes holding links that are resolved against the page URL
+URL_ATTRIBUTES = frozenset({"href", "src"})
+
+
+@lru_cache(maxsize=512)
+def _compile(selector: str) -> CSSSelector:
+    """Compile a CSS selector once and reuse it for every page."""
+    return CSSSelector(selector)
+
+
+def _text(element: Any) -> str:
+    """Return the whitespace-normalized text content of an element."""
+    return " ".join(element.text_content().split())
+
+
+class _Field(NamedTuple):
+    """Field of an extraction config with its selector compiled."""
+
+    name: str
+    selector: Optional[CSSSelector]
+    type: str
+    attribute: Optional[str]
+    default: Any
+
+    @classmethod
+    def compile(cls, field: dict[str, Any]) -> "_Field":
+        """Compile a field definition of an extraction config."""
+        selector = field.get("selector")
+        return cls(
+            name=field["name"],
+            selector=_compile(selector) if selector else None,
+            type=field.get("type", "text"),
+            attribute=field.get("attribute"),
+            default=field.get("default"),
+        )
+
+    def extract(self, element: Any, base_url: str) -> Any:
+        """Extract the field from a listing element.
+
+        Args:
+            element: Listing element.
+            base_url: URL of the page, used to resolve relative links.
+
+        Returns:
+            The extracted value, or the field default if the selector does not match.
+        """
+        if self.selector is None:
+            matches = [element]
+        else:
+            matches = self.selector(element)
+            if not matches:
+                return self.default
+        target = matches[0]
+
+        if self.type == "text":
+            return _text(target)
+        if self.type == "text_array":
+            return [text for text in (_text(match) for match in matches) if text]
+        if self.type == "html":
+            return lxml_html.tostring(target, encoding="unicode")
+        if self.type == "attribute":
+            value = target.get(self.attribute)
+            if value is not None and self.attribute in URL_ATTRIBUTES:
+                value = urljoin(base_url, value)
+            return value
+        return None
+
+
+class ListingExtractor:
+    """Extraction config compiled for repeated use on lxml.
+
+    Every selector is compiled once, and each listing is visited once, evaluating each field once.
+    Output mirrors ``JsonCssExtractionStrategy``: fields whose selector does not match are left out,
+    and listings without any extracted field are skipped. Unlike it, text is whitespace-normalized
+    and links are resolved against the page URL.
+    """
+
+    def __init__(self, extraction_config: dict[str, Any]) -> None:
+        """Initialize the extractor.
+
+        Args:
+            extraction_config: Extraction config as returned by ``PlatformAdapter.get_extraction_config``.
+        """
+        self.base_selector = _compile(extraction_config["baseSelector"])
+        self.fields = tuple(_Field.compile(field) for field in extraction_config.get("fields", []))
+
+    def extract(self, html: str, base_url: str = "") -> list[dict[str, Any]]:
+        """Extract the listings of a page.
+
+        Args:
+            html: Page HTML.
+            base_url: URL of the page, used to resolve relative links.
+
+        Returns:
+            list[dict[str, Any]]: One dictionary per listing.
+        """
+        if not html.strip():
+            return []
+        document = lxml_html.document_fromstring(html)
+        items = []
+        for element in self.base_selector(document):
+            item = {}
+            for field in self.fields:
+                value = field.extract(element, base_url)
+                if value is not None:
+                    item[field.name] = value
+            if item:
+                items.append(item)
+        return items
+
+
+def extract_items(html: str, extraction_config: dict[str, Any], base_url: str = "") -> list[dict[str, Any]]:
+    """Extract listings from HTML using a ``baseSelector``/``fields`` extraction config.
+
+    See ``ListingExtractor``, which saves compiling the config when it extracts many pages.
+
+    Args:
+        html: Page HTML.
+        extraction_config: Extraction config as returned by ``PlatformAdapter.get_extraction_config``.
+        base_url: URL of the page, used to resolve relative links.
+
+    Returns:
+        list[dict[str, Any]]: One dictionary per listing.
+    """
+    return ListingExtractor(extraction_config).extract(html, base_url)
+
+
+def split_listings(html: str, base_selector: str) -> list[str]:
+    """Split a page into the HTML of its individual listings.
+
+    Args:
+        html: Page HTML.
+        base_selector: CSS selector matching one listing.
+
+    Returns:
+        list[str]: HTML of every matching listing, empty if nothing matches.
+    """
+    if not html.strip():
+        return []
+    document = lxml_html.document_fromstring(html)
+    return [lxml_html.tostring(element, encoding="unicode") for element in _compile(base_selector)(document)]
+
+
+class StaticFetcher:
+    """Pooled HTTP client fetching static listing pages without a browser."""
+
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        max_connections: int = 20,
+        headers: Optional[dict[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """Initialize the static fetcher.
+
+        Args:
+            timeout: Request timeout in seconds.
+            max_connections: Maximum number of pooled connections.
+            headers: Request headers. If None, browser-like defaults are used.
+            transport: Custom HTTP transport, e.g. for testing. If None, the default pooled transport is used.
+        """
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.headers = headers or DEFAULT_HEADERS
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client with keep-alive connections, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                follow_redirects=True,
+                transport=self.transport,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(self, url: str) -> str:
+        """Fetch a page.
+
+        Args:
+            url: Page URL.
+
+        Returns:
+            str: Page HTML.
+
+        Raises:
+            RateLimitError: If the site throttled the request or answered with a captcha page.
+            NetworkError: If the request fails or returns an error status.
+        """
+        try:
+            response = await self.client.get(url)
+        except httpx.HTTPError as e:
+            raise NetworkError(message=f"Failed to fetch {url}: {e}", details={"url": url}) from e
+        check_blocked(url, response.status_code, response.text, response.headers)
+        if response.status_code >= 400:
+            raise NetworkError(
+                message=f"Failed to fetch {url}: HTTP {response.status_code}",
+                details={"url": url, "status_code": response.status_code},
+            )
+        return response.text
+
+    async def fetch_items(
+        self, url: str, extraction_config: dict[str, Any], platform: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """Fetch a page and extract its listings.
+
+        Args:
+            url: Page URL.
+            extraction_config: Extraction config of the platform.
+            platform: Platform name under which the fetch and extraction times are recorded.
+                If None, they are not recorded.
+
+        Returns:
+            list[dict[str, Any]]: Extracted listings.
+
+        Raises:
+            RateLimitError: If the site throttled the request or answered with a captcha page.
+            NetworkError: If the request fails or returns an error status.
+        """
+        started = time.perf_counter()
+        html = await self.fetch(url)
+        if platform is None:
+            return extract_items(html, extraction_config, base_url=url)
+        started = observe_stage(platform, "navigate", started)
+        items = extract_items(html, extraction_config, base_url=url)
+        observe_stage(platform, "extract", started)
+        return items
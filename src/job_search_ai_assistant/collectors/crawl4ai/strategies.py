@@ -0,0 +1,86 @@
+"""Registry of compiled extraction strategies shared by all scrapes."""
+
+import copy
+import threading
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .extractors import FrozenStrategy
+
+
+def _key(config: dict[str, Any]) -> str:
+    """Key of an extraction config in the registry.
+
+    ``repr`` takes about half the time of hashing a sorted JSON dump; a config built with its keys in
+    another order only compiles one more strategy.
+    """
+    return repr(config)
+
+
+class StrategyRegistry:
+    """Extraction strategies compiled once per extraction config.
+
+    Strategies are immutable, so concurrent scrapes of any platforms share them without locking or
+    reconfiguration. Configs registered up front are compiled together on the first lookup, when
+    crawl4ai is imported for the first scrape anyway.
+    """
+
+    def __init__(self, configs: Iterable[dict[str, Any]] = (), native: bool = True) -> None:
+        """Initialize the registry.
+
+        Args:
+            configs: Extraction configs to compile on the first lookup, e.g. of every platform adapter.
+            native: Whether to extract with ``LxmlExtractionStrategy`` rather than crawl4ai's
+                BeautifulSoup-based ``JobExtractionStrategy``.
+        """
+        self.native = native
+        self._lock = threading.Lock()
+        self._pending: dict[str, dict[str, Any]] = {}
+        # Replaced as a whole under the lock, so lookups read it without taking the lock
+        self._strategies: dict[str, FrozenStrategy] = {}
+        self.register(configs)
+
+    def __len__(self) -> int:
+        """Return the number of compiled strategies."""
+        return len(self._strategies)
+
+    def register(self, configs: Iterable[dict[str, Any]]) -> None:
+        """Add extraction configs to compile on the next lookup.
+
+        Args:
+            configs: Extraction configs (see ``PlatformAdapter.get_extraction_config``).
+        """
+        with self._lock:
+            for config in configs:
+                key = _key(config)
+                if key not in self._strategies:
+                    self._pending[key] = copy.deepcopy(config)
+
+    def get(self, config: dict[str, Any]) -> "FrozenStrategy":
+        """Return the compiled strategy of an extraction config, compiling it if it is new.
+
+        Args:
+            config: Extraction config; equal configs share one strategy.
+
+        Returns:
+            FrozenStrategy: Immutable strategy of the config.
+        """
+        key = _key(config)
+        strategy = self._strategies.get(key)
+        if strategy is None:
+            with self._lock:
+                if key not in self._strategies:
+                    self._pending.setdefault(key, copy.deepcopy(config))
+                    self._compile_pending()
+                strategy = self._strategies[key]
+        return strategy
+
+    def _compile_pending(self) -> None:
+        """Compile all registered configs and publish them with the existing strategies."""
+        from .extractors import JobExtractionStrategy, LxmlExtractionStrategy
+
+        strategy_class = LxmlExtractionStrategy if self.native else JobExtractionStrategy
+        compiled = {key: strategy_class(config) for key, config in self._pending.items()}
+        self._strategies = {**self._strategies, **compiled}
+        self._pending.clear()
@@ -0,0 +1,67 @@
+"""Bounded buffering between page producers and posting consumers."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from typing import TypeVar, cast
+
+T = TypeVar("T")
+
+
+class _Failure:
+    """Exception raised by the producer, handed over to the consumer."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+_DONE = object()
+
+
+async def buffered(source: AsyncIterator[T], maxsize: int) -> AsyncIterator[T]:
+    """Consume an async iterator in a background task, buffering at most ``maxsize`` items.
+
+    The producer keeps working while the consumer handles earlier items, and pauses once the
+    buffer is full. Errors of the producer are re-raised to the consumer after the items
+    produced before them. If the consumer stops early the producer is cancelled, and ``source``
+    is closed either way, so its cleanup runs even while it is suspended at a ``yield``.
+
+    Args:
+        source: Async iterator to consume.
+        maxsize: Maximum number of items produced ahead of the consumer.
+
+    Yields:
+        Items of ``source`` in order.
+
+    Raises:
+        ValueError: If ``maxsize`` is not positive.
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize)
+
+    async def produce() -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(_Failure(e))
+        else:
+            await queue.put(_DONE)
+        finally:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (item := await queue.get()) is not _DONE:
+            if isinstance(item, _Failure):
+                raise item.error
+            yield cast(T, item)
+    finally:
+        producer.cancel()
+        with suppress(asyncio.CancelledError):
+            await producer
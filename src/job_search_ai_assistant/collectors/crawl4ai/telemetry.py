@@ -0,0 +1,98 @@
+"""Metrics of the crawl pipeline, rendered on the metrics endpoint."""
+
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from ...api.metrics import REGISTRY
+
+# Upper bounds of the pages per crawl buckets
+PAGE_BUCKETS = (1, 2, 3, 5, 10, 20, 50)
+
+# Upper bounds of the postings per page buckets
+POSTING_BUCKETS = (0, 1, 5, 10, 20, 50, 100, 200)
+
+# Stages timed per page: waiting for the rate limit and a browser, loading the page, extracting
+# its listings, validating them as postings and applying the search criteria
+STAGES = ("wait", "navigate", "extract", "validate", "filter")
+
+CRAWL_STAGE_SECONDS = REGISTRY.histogram(
+    "jobsearch_crawl_stage_seconds",
+    "Time spent per page in each stage of a crawl",
+    ("platform", "stage"),
+)
+
+PAGES_PER_CRAWL = REGISTRY.histogram(
+    "jobsearch_crawl_pages",
+    "Result pages loaded by a crawl",
+    ("platform",),
+    buckets=PAGE_BUCKETS,
+)
+
+POSTINGS_PER_PAGE = REGISTRY.histogram(
+    "jobsearch_page_postings",
+    "Postings extracted from a result page",
+    ("platform",),
+    buckets=POSTING_BUCKETS,
+)
+
+PAGES_FETCHED = REGISTRY.counter(
+    "jobsearch_pages_fetched",
+    "Result pages loaded, by whether a browser rendered them",
+    ("platform", "method"),
+)
+
+LLM_FALLBACKS = REGISTRY.counter(
+    "jobsearch_llm_fallbacks",
+    "Rendered pages whose listings were extracted by the LLM after CSS extraction failed",
+    ("platform",),
+)
+
+INVALID_POSTINGS = REGISTRY.counter(
+    "jobsearch_invalid_postings",
+    "Extracted listings left out of the results because they failed validation",
+    ("platform",),
+)
+
+SCRAPING_ERRORS = REGISTRY.counter(
+    "jobsearch_scraping_errors",
+    "Crawls that failed, by error type",
+    ("platform", "error_type"),
+)
+
+
+def observe_stage(platform: str, stage: str, started: float) -> float:
+    """Record the time since a stage started.
+
+    Args:
+        platform: Platform name.
+        stage: One of ``STAGES``.
+        started: ``time.perf_counter()`` when the stage started.
+
+    Returns:
+        float: The current ``time.perf_counter()``, i.e. the start of the next stage.
+    """
+    now = time.perf_counter()
+    CRAWL_STAGE_SECONDS.labels(platform, stage).observe(now - started)
+    return now
+
+
+async def count_pages(platform: str, pages: AsyncIterator[list[dict[str, Any]]]) -> AsyncIterator[list[dict[str, Any]]]:
+    """Pass the pages of a crawl through, recording the postings per page and the number of pages.
+
+    Args:
+        platform: Platform name.
+        pages: Extracted items per page.
+
+    Yields:
+        list[dict[str, Any]]: The items of each page.
+    """
+    postings = POSTINGS_PER_PAGE.labels(platform)
+    count = 0
+    try:
+        async for items in pages:
+            count += 1
+            postings.observe(len(items))
+            yield items
+    finally:
+        PAGES_PER_CRAWL.observe(count, platform)
@@ -0,0 +1,117 @@
+"""Text filters of search criteria, compiled once and run over case-folded postings."""
+
+import re
+from functools import lru_cache
+from typing import Optional
+
+from ..api.schemas.search import SearchFilters
+from .crawl4ai.models import Posting
+
+# Terms in a description that mark a posting as remote
+REMOTE_TERMS = ("remote", "віддалено", "дистанційно")
+
+# Term count from which one regex pass beats a substring search per term. CPython's re tries
+# an alternation at every position of the text, which for a few terms is slower than
+# running str.__contains__ once per term.
+REGEX_MIN_TERMS = 8
+
+
+class TermMatcher:
+    """Matcher of any of a set of terms in case-folded text."""
+
+    def __init__(self, terms: tuple[str, ...]) -> None:
+        """Initialize the matcher.
+
+        Args:
+            terms: Terms to match as plain substrings, in any case.
+        """
+        # Longer terms first so a term is not shadowed by its prefix in the alternation
+        self.terms = tuple(sorted({term.casefold() for term in terms}, key=len, reverse=True))
+        self.pattern: Optional[re.Pattern[str]] = None
+        if len(self.terms) >= REGEX_MIN_TERMS:
+            self.pattern = re.compile("|".join(re.escape(term) for term in self.terms))
+
+    def search(self, text: str) -> bool:
+        """Whether any term occurs in a case-folded text.
+
+        Args:
+            text: Case-folded text.
+
+        Returns:
+            bool: True if the text contains any of the terms.
+        """
+        if self.pattern is not None:
+            return self.pattern.search(text) is not None
+        return any(term in text for term in self.terms)
+
+
+@lru_cache(maxsize=256)
+def compile_terms(terms: tuple[str, ...]) -> TermMatcher:
+    """Build the matcher of a set of terms once and reuse it for equal criteria.
+
+    Args:
+        terms: Terms to match as plain substrings.
+
+    Returns:
+        TermMatcher: Matcher of any of the case-folded terms.
+    """
+    return TermMatcher(terms)
+
+
+class JobMatcher:
+    """Keyword, location and remote filters of search criteria."""
+
+    def __init__(
+        self,
+        keywords: Optional[TermMatcher] = None,
+        location: Optional[str] = None,
+        remote: Optional[TermMatcher] = None,
+    ) -> None:
+        """Initialize the matcher.
+
+        Args:
+            keywords: Terms of which one must occur in the title or description.
+            location: Case-folded text the location must contain.
+            remote: Terms of which one must occur in the description.
+        """
+        self.keywords = keywords
+        self.location = location
+        self.remote = remote
+
+    @classmethod
+    def from_criteria(cls, criteria: SearchFilters) -> "JobMatcher":
+        """Build the matcher of search criteria.
+
+        Args:
+            criteria: Search criteria.
+
+        Returns:
+            JobMatcher: Matcher of the keyword, location and remote filters.
+        """
+        return cls(
+            keywords=compile_terms(tuple(criteria.keywords)) if criteria.keywords else None,
+            location=criteria.location.casefold() if criteria.location else None,
+            remote=compile_terms(REMOTE_TERMS) if criteria.remote else None,
+        )
+
+    @property
+    def active(self) -> bool:
+        """Whether any filter is set."""
+        return self.keywords is not None or self.location is not None or self.remote is not None
+
+    def matches(self, job: Posting) -> bool:
+        """Whether a posting passes all filters.
+
+        Args:
+            job: Job posting.
+
+        Returns:
+            bool: True if the posting matches the keywords, location and remote filters.
+        """
+        if self.keywords is not None and not (
+            self.keywords.search(job.folded_title) or self.keywords.search(job.folded_description)
+        ):
+            return False
+        if self.location is not None and self.location not in job.location.casefold():
+            return False
+        return self.remote is None or self.remote.search(job.folded_description)
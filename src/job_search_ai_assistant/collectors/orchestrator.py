@@ -0,0 +1,441 @@
+"""Concurrent multi-platform job search orchestration."""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+from uuid import NAMESPACE_URL, uuid5
+
+from pydantic import BaseModel, Field
+
+from ..api.config import logger
+from ..api.crud import JobStore
+from ..api.metrics import LATENCY_BUCKETS, HistogramFamily
+from ..api.schemas.search import (
+    JobListing,
+    PlatformStatus,
+    SearchFilters,
+    SearchRequest,
+    SearchResponse,
+    SearchSummary,
+)
+from .crawl4ai.cache import CachePolicy, canonical_url
+from .crawl4ai.client import JobScraperClient
+from .crawl4ai.models import Posting, PostingRecord
+from .crawl4ai.pagination import PaginationConfig
+from .crawl4ai.ratelimit import RateLimitPolicy
+from .platforms import DjinniAdapter, DOUAdapter, LinkedInAdapter, PlatformAdapter, WorkUaAdapter
+from .singleflight import SingleFlight
+
+ALL_PLATFORMS = "all"
+DEFAULT_PLATFORM_CONCURRENCY = 2
+
+# Postings found but not yet read by a streamed search's consumer before the crawls pause
+STREAM_BUFFER = 100
+
+
+def default_adapters() -> dict[str, PlatformAdapter]:
+    """Create the adapters for every supported platform.
+
+    Returns:
+        dict[str, PlatformAdapter]: Adapters keyed by the platform names used in ``SearchRequest.platforms``.
+    """
+    return {
+        "linkedin": LinkedInAdapter(),
+        "djinni": DjinniAdapter(),
+        "dou": DOUAdapter(),
+        "workua": WorkUaAdapter(),
+    }
+
+
+def to_job_listing(posting: Posting, source: str) -> JobListing:
+    """Map a scraped job posting to the API job listing schema.
+
+    The posting was validated when it was extracted or stored, so the listing is built from its
+    values, the URL object included, without validating them again.
+
+    Args:
+        posting: Scraped or stored job posting.
+        source: Platform key the posting came from.
+
+    Returns:
+        JobListing: API representation with an id derived from the posting URL.
+    """
+    return JobListing.model_construct(
+        id=str(uuid5(NAMESPACE_URL, str(posting.url))),
+        title=posting.title,
+        company=posting.company,
+        url=posting.url,
+        source=source,
+        location=posting.location,
+        description=posting.description,
+        salary=posting.salary,
+        posted_date=posting.posted_date,
+    )
+
+
+class PlatformResult(BaseModel):
+    """Outcome of searching a single platform."""
+
+    platform: str = Field(..., description="Platform key")
+    jobs: list[PostingRecord] = Field(default_factory=list, description="Postings found on the platform")
+    error: Optional[str] = Field(None, description="Error description if the platform failed")
+    elapsed: float = Field(0.0, ge=0, description="Time spent on the platform in seconds")
+
+    @property
+    def ok(self) -> bool:
+        """Whether the platform was searched successfully."""
+        return self.error is None
+
+
+# Item of a streamed search's queue: a posting with its platform key, or a platform's final result
+StreamItem = Union[tuple[str, PostingRecord], PlatformResult]
+
+
+class SearchOrchestrator:
+    """Fan a search request out to all requested platforms concurrently."""
+
+    def __init__(
+        self,
+        client: JobScraperClient,
+        adapters: Optional[dict[str, PlatformAdapter]] = None,
+        max_concurrency: int = 8,
+        platform_concurrency: Union[int, dict[str, int]] = DEFAULT_PLATFORM_CONCURRENCY,
+        store: Optional[JobStore] = None,
+    ) -> None:
+        """Initialize the orchestrator.
+
+        Args:
+            client: Scraper client used for all platforms.
+            adapters: Platform adapters keyed by platform name. If None, all supported platforms are used.
+            max_concurrency: Maximum number of scrapes running at once across all platforms.
+            platform_concurrency: Maximum number of concurrent scrapes per platform, either one value
+                for every platform or a mapping of platform name to limit.
+            store: Open job store every found posting is saved to. If None, results are not persisted.
+        """
+        self.client = client
+        self.store = store
+        self.adapters = adapters if adapters is not None else default_adapters()
+        self._global_limit = asyncio.Semaphore(max_concurrency)
+        self._platform_limits = {
+            name: asyncio.Semaphore(
+                platform_concurrency.get(name, DEFAULT_PLATFORM_CONCURRENCY)
+                if isinstance(platform_concurrency, dict)
+                else platform_concurrency
+            )
+            for name in self.adapters
+        }
+        # Search latency per platform key, logged after every search and rendered on the metrics
+        # endpoint once registered by the application
+        self.latency = HistogramFamily(
+            "jobsearch_platform_search_seconds",
+            "Time to search a platform, including failed and timed out searches",
+            ("platform",),
+            buckets=LATENCY_BUCKETS,
+        )
+        # Identical searches running at the same time share one crawl
+        self._flights: SingleFlight[list[PostingRecord]] = SingleFlight()
+
+    def platform_key(self, name: str) -> str:
+        """Return the platform key of a platform name stored on postings, e.g. ``"workua"`` for ``"Work.ua"``.
+
+        Args:
+            name: Platform name of a posting.
+
+        Returns:
+            str: Platform key, or the lower-cased name if no adapter has that name.
+        """
+        return next((key for key, adapter in self.adapters.items() if adapter.config.name == name), name.lower())
+
+    def resolve_platforms(self, platforms: list[str]) -> list[str]:
+        """Resolve requested platform names, expanding ``"all"``.
+
+        Args:
+            platforms: Platform names from the search request.
+
+        Returns:
+            list[str]: Unique platform keys in request order.
+
+        Raises:
+            ValueError: If an unknown platform is requested.
+        """
+        resolved: list[str] = []
+        for name in platforms:
+            key = name.lower()
+            candidates = list(self.adapters) if key == ALL_PLATFORMS else [key]
+            for candidate in candidates:
+                if candidate not in self.adapters:
+                    raise ValueError(f"Unknown platform: {name}")
+                if candidate not in resolved:
+                    resolved.append(candidate)
+        return resolved
+
+    async def search_platform(self, platform: str, query: str, criteria: SearchFilters) -> PlatformResult:
+        """Search a single platform, capturing failures in the result.
+
+        Args:
+            platform: Platform key.
+            query: Search query string.
+            criteria: Filters applied to the extracted postings.
+
+        Returns:
+            PlatformResult: Postings or error for the platform.
+        """
+        unavailable = self._unavailable(platform)
+        if unavailable is not None:
+            return unavailable
+
+        adapter = self.adapters[platform]
+        url = adapter.build_search_url(query.split(), criteria.location)
+        extraction_config = adapter.get_extraction_config()
+        # Criteria are part of the key as the client filters postings by them
+        key = (
+            platform,
+            canonical_url(url),
+            json.dumps(extraction_config, sort_keys=True),
+            criteria.model_dump_json(),
+        )
+        started = time.perf_counter()
+        try:
+            jobs = await self._flights.do(key, lambda: self._crawl(platform, url, criteria, extraction_config))
+        except Exception as e:
+            logger.warning(f"Search on {platform} failed: {e}")
+            return PlatformResult(platform=platform, error=str(e), elapsed=time.perf_counter() - started)
+        return PlatformResult(platform=platform, jobs=jobs, elapsed=time.perf_counter() - started)
+
+    def _unavailable(self, platform: str) -> Optional[PlatformResult]:
+        """Return the failed result of a platform whose circuit breaker is open, None if it may be searched."""
+        name = self.adapters[platform].config.name
+        if not self.client.breakers.is_open(name):
+            return None
+        # Do not queue behind healthy platforms only to fail fast
+        breaker = self.client.breakers.get(name)
+        return PlatformResult(platform=platform, error=f"{name} is unavailable, retry in {breaker.retry_after:.0f}s")
+
+    def _scrape_options(self, platform: str, extraction_config: dict[str, Any]) -> dict[str, Any]:
+        """Return the scrape options of a platform, shared by batch and streamed searches."""
+        adapter = self.adapters[platform]
+        return {
+            "platform": adapter.config.name,
+            "wait_for": adapter.config.wait_for,
+            "extraction_config": extraction_config,
+            "pagination": PaginationConfig.from_platform(adapter.config),
+            "cache_policy": CachePolicy.from_platform(adapter.config),
+            "static_html": adapter.config.static_html,
+            "rate_limit": RateLimitPolicy.from_platform(adapter.config),
+        }
+
+    async def _save(self, platform: str, jobs: list[PostingRecord]) -> None:
+        """Store the postings found on a platform, if a store is configured."""
+        if self.store is None or not jobs:
+            return
+        try:
+            await self.store.upsert(jobs)
+        except Exception as e:
+            # The search succeeded; a storage failure only costs the local copy
+            logger.warning(f"Saving {len(jobs)} postings of {platform} failed: {e}")
+
+    def _record(self, results: list[PlatformResult]) -> None:
+        """Add the latency of each platform to its histogram and log it."""
+        for result in results:
+            histogram = self.latency.labels(result.platform)
+            histogram.observe(result.elapsed)
+            status = f"{len(result.jobs)} postings" if result.ok else "failed"
+            logger.info(
+                f"Search on {result.platform}: {status} in {result.elapsed:.2f}s, latency histogram {histogram.format()}"
+            )
+
+    async def _crawl(
+        self, platform: str, url: str, criteria: SearchFilters, extraction_config: dict[str, Any]
+    ) -> list[PostingRecord]:
+        """Scrape a platform's search URL and store the postings found.
+
+        Args:
+            platform: Platform key.
+            url: Search URL built by the platform adapter.
+            criteria: Filters applied to the extracted postings.
+            extraction_config: CSS extraction schema of the platform.
+
+        Returns:
+            list[PostingRecord]: Postings found.
+        """
+        # Take the platform slot first so a queued platform does not hold a global slot
+        async with self._platform_limits[platform], self._global_limit:
+            jobs = await self.client.scrape_jobs(
+                url=url, criteria=criteria, **self._scrape_options(platform, extraction_config)
+            )
+        await self._save(platform, jobs)
+        return jobs
+
+    async def search_platform_within(
+        self, platform: str, query: str, criteria: SearchFilters, timeout: Optional[float]
+    ) -> PlatformResult:
+        """Search a single platform, giving up once a deadline passes.
+
+        Args:
+            platform: Platform key.
+            query: Search query string.
+            criteria: Filters applied to the extracted postings.
+            timeout: Seconds the platform may take, or None to wait for it.
+
+        Returns:
+            PlatformResult: Postings or error for the platform.
+        """
+        if timeout is None:
+            return await self.search_platform(platform, query, criteria)
+        try:
+            return await asyncio.wait_for(self.search_platform(platform, query, criteria), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Search on {platform} did not finish within {timeout:g}s")
+            return PlatformResult(platform=platform, error=f"Timed out after {timeout:g}s", elapsed=timeout)
+
+    async def search_platforms(self, request: SearchRequest, timeout: Optional[float] = None) -> list[PlatformResult]:
+        """Search all requested platforms concurrently.
+
+        Args:
+            request: Search request.
+            timeout: Seconds the search may take. Platforms still running by then are cancelled and
+                reported as timed out. If None, every platform is waited for.
+
+        Returns:
+            list[PlatformResult]: One result per resolved platform, in request order.
+        """
+        criteria = request.filters or SearchFilters()
+        platforms = self.resolve_platforms(request.platforms)
+        results = list(
+            await asyncio.gather(
+                *(self.search_platform_within(platform, request.query, criteria, timeout) for platform in platforms)
+            )
+        )
+        self._record(results)
+        return results
+
+    async def search(self, request: SearchRequest, timeout: Optional[float] = None) -> SearchResponse:
+        """Search all requested platforms and merge the results.
+
+        Platforms that fail, time out, or whose circuit breaker is open, are left out of the merged job list.
+
+        Args:
+            request: Search request.
+            timeout: Seconds the search may take. If None, every platform is waited for.
+
+        Returns:
+            SearchResponse: Merged job listings from all platforms.
+        """
+        results = await self.search_platforms(request, timeout)
+        jobs = [to_job_listing(job, result.platform) for result in results for job in result.jobs]
+        return SearchResponse(
+            jobs=jobs,
+            total_count=len(jobs),
+            query=request.query,
+            platforms=[result.platform for result in results],
+        )
+
+    async def _stream_platform(
+        self, platform: str, query: str, criteria: SearchFilters, queue: "asyncio.Queue[StreamItem]"
+    ) -> None:
+        """Stream the postings of a single platform into a queue, ending with the platform's result.
+
+        Args:
+            platform: Platform key.
+            query: Search query string.
+            criteria: Filters applied to the extracted postings.
+            queue: Queue receiving ``(platform, posting)`` pairs and finally a ``PlatformResult``.
+        """
+        unavailable = self._unavailable(platform)
+        if unavailable is not None:
+            await queue.put(unavailable)
+            return
+
+        adapter = self.adapters[platform]
+        url = adapter.build_search_url(query.split(), criteria.location)
+        options = self._scrape_options(platform, adapter.get_extraction_config())
+        started = time.perf_counter()
+        jobs: list[PostingRecord] = []
+        try:
+            async with self._platform_limits[platform], self._global_limit:
+                async for job in self.client.stream_jobs(url=url, criteria=criteria, **options):
+                    jobs.append(job)
+                    await queue.put((platform, job))
+        except Exception as e:
+            logger.warning(f"Search on {platform} failed: {e}")
+            await queue.put(
+                PlatformResult(platform=platform, jobs=jobs, error=str(e), elapsed=time.perf_counter() - started)
+            )
+            return
+        await self._save(platform, jobs)
+        await queue.put(PlatformResult(platform=platform, jobs=jobs, elapsed=time.perf_counter() - started))
+
+    async def stream(
+        self, request: SearchRequest, timeout: Optional[float] = None
+    ) -> AsyncIterator[Union[JobListing, SearchSummary]]:
+        """Search all requested platforms, yielding job listings as soon as their page is extracted.
+
+        Streamed searches crawl on their own rather than joining identical searches in flight, as
+        a shared crawl would have to replay its pages to each late joiner.
+
+        Args:
+            request: Search request.
+            timeout: Seconds the search may take. Platforms still running by then are cancelled and
+                reported as timed out. If None, every platform is waited for.
+
+        Yields:
+            JobListing: Listings in the order they were found, across all platforms.
+            SearchSummary: Final event with the outcome and timing of every platform.
+
+        Raises:
+            ValueError: If an unknown platform is requested.
+        """
+        criteria = request.filters or SearchFilters()
+        platforms = self.resolve_platforms(request.platforms)
+        # Bounded so a slow reader pauses the crawls instead of letting postings pile up
+        queue: asyncio.Queue[StreamItem] = asyncio.Queue(STREAM_BUFFER)
+        tasks = [
+            asyncio.create_task(self._stream_platform(platform, request.query, criteria, queue))
+            for platform in platforms
+        ]
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        finished: dict[str, PlatformResult] = {}
+        # Postings sent per platform, reported for platforms cut off by the deadline
+        streamed: dict[str, list[PostingRecord]] = {platform: [] for platform in platforms}
+        try:
+            while len(finished) < len(platforms):
+                remaining = None if deadline is None else max(deadline - loop.time(), 0)
+                try:
+                    item = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if isinstance(item, PlatformResult):
+                    finished[item.platform] = item
+                else:
+                    streamed[item[0]].append(item[1])
+                    yield to_job_listing(item[1], item[0])
+        finally:
+            # Also reached when the reader goes away, which cancels the remaining crawls
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for platform in platforms:
+            if platform not in finished:
+                logger.warning(f"Search on {platform} did not finish within {timeout:g}s")
+                finished[platform] = PlatformResult(
+                    platform=platform,
+                    jobs=streamed[platform],
+                    error=f"Timed out after {timeout:g}s",
+                    elapsed=timeout or 0.0,
+                )
+        results = [finished[platform] for platform in platforms]
+        self._record(results)
+        yield SearchSummary(
+            total_count=sum(len(result.jobs) for result in results),
+            query=request.query,
+            platforms=[
+                PlatformStatus(
+                    platform=result.platform, count=len(result.jobs), error=result.error, elapsed=result.elapsed
+                )
+                for result in results
+            ],
+        )
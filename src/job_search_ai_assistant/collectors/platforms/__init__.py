@@ -1,6 +1,6 @@
 """Platform adapters for job search."""
 
-from .base import PlatformAdapter, PlatformConfig, SelectorConfig
+from .base import PaginationStyle, PlatformAdapter, PlatformConfig, SelectorConfig
 from .djinni import DjinniAdapter
 from .dou import DOUAdapter
 from .linkedin import LinkedInAdapter
@@ -10,6 +10,7 @@ __all__ = [
     "DOUAdapter",
     "DjinniAdapter",
     "LinkedInAdapter",
+    "PaginationStyle",
     "PlatformAdapter",
     "PlatformConfig",
     "SelectorConfig",
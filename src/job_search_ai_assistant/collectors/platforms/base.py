@@ -1,10 +1,19 @@
 """Base configuration and utilities for platform-specific scrapers."""
 
+from enum import Enum
 from typing import Any, Protocol
 
 from pydantic import BaseModel, Field
 
 
+class PaginationStyle(str, Enum):
+    """How a platform exposes further pages of results."""
+
+    NUMBERED = "numbered"  # Page number in the URL query, pages can be fetched independently
+    LOAD_MORE = "load_more"  # "More" button appending results to the same page
+    INFINITE_SCROLL = "infinite_scroll"  # Results appended while scrolling, with a "show more" fallback button
+
+
 class SelectorConfig(BaseModel):
     """Configuration for CSS selectors."""
 
@@ -27,8 +36,20 @@ class PlatformConfig(BaseModel):
     selectors: SelectorConfig = Field(..., description="CSS selectors for job data extraction")
     wait_for: str | None = Field(None, description="Element to wait for before extraction")
     dynamic_wait: float | None = Field(None, description="Additional wait time for dynamic content")
+    static_html: bool = Field(False, description="Listings are server-rendered and can be fetched without a browser")
     pagination_selector: str | None = Field(None, description="Selector for pagination element")
+    pagination_style: PaginationStyle | None = Field(None, description="How further pages are loaded")
+    page_param: str | None = Field(None, description="Query parameter holding the page number")
     max_pages: int | None = Field(10, description="Maximum number of pages to scrape")
+    cache_ttl: float | None = Field(None, description="Seconds crawl results are reused; None disables caching")
+    cache_stale_ttl: float | None = Field(
+        None, description="Seconds expired results are still served while being refreshed"
+    )
+    rate_limit: float | None = Field(None, gt=0, description="Requests per second to the site; None disables limiting")
+    rate_burst: int | None = Field(None, ge=1, description="Requests that may be sent back to back")
+    rate_max_wait: float | None = Field(
+        None, ge=0, description="Seconds a request may wait for the rate limit; None waits as long as needed"
+    )
 
     class Config:
         """Model configuration."""
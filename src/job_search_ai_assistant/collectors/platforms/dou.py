@@ -3,7 +3,7 @@
 from typing import Any
 from urllib.parse import urlencode
 
-from .base import PlatformAdapter, PlatformConfig, SelectorConfig
+from .base import PaginationStyle, PlatformAdapter, PlatformConfig, SelectorConfig
 
 
 class DOUAdapter(PlatformAdapter):
@@ -31,7 +31,14 @@ class DOUAdapter(PlatformAdapter):
             dynamic_wait=1.0,
             # "More" button for loading additional jobs
             pagination_selector="a.more-btn",
+            pagination_style=PaginationStyle.LOAD_MORE,
             max_pages=10,
+            # New postings appear a few times an hour
+            cache_ttl=120.0,
+            cache_stale_ttl=300.0,
+            # Each "more" click is an XHR to the same host
+            rate_limit=1.0,
+            rate_burst=2,
         )
 
     @property
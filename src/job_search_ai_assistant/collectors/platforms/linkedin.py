@@ -3,7 +3,7 @@
 from typing import Any
 from urllib.parse import urlencode
 
-from .base import PlatformAdapter, PlatformConfig, SelectorConfig
+from .base import PaginationStyle, PlatformAdapter, PlatformConfig, SelectorConfig
 
 
 class LinkedInAdapter(PlatformAdapter):
@@ -31,7 +31,14 @@ class LinkedInAdapter(PlatformAdapter):
             dynamic_wait=1.0,
             # "Show more jobs" button selector for pagination
             pagination_selector="button.infinite-scroller__show-more-button",
+            pagination_style=PaginationStyle.INFINITE_SCROLL,
             max_pages=10,
+            # Search covers the last 24 hours (f_TPR=r86400), so results stay valid for minutes
+            cache_ttl=300.0,
+            cache_stale_ttl=600.0,
+            # Guest search answers bursts with 429 and an authwall
+            rate_limit=0.5,
+            rate_burst=2,
         )
 
     @property
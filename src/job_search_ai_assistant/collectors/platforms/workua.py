@@ -3,7 +3,7 @@
 from typing import Any
 from urllib.parse import urlencode
 
-from .base import PlatformAdapter, PlatformConfig, SelectorConfig
+from .base import PaginationStyle, PlatformAdapter, PlatformConfig, SelectorConfig
 
 
 class WorkUaAdapter(PlatformAdapter):
@@ -29,9 +29,19 @@ class WorkUaAdapter(PlatformAdapter):
             wait_for="div#pjax-job-list",
             # No dynamic loading
             dynamic_wait=None,
+            # Listings are server-rendered, fetch them over plain HTTP
+            static_html=True,
             # Work.ua uses standard pagination
             pagination_selector="ul.pagination li:last-child:not(.active) a",
+            pagination_style=PaginationStyle.NUMBERED,
+            page_param="page",
             max_pages=10,
+            # New postings appear a few times an hour
+            cache_ttl=120.0,
+            cache_stale_ttl=300.0,
+            # Server-rendered pages, a couple of requests per second go unnoticed
+            rate_limit=2.0,
+            rate_burst=4,
         )
 
     @property
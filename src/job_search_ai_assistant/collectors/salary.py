@@ -0,0 +1,183 @@
+"""Parsing of free-text salaries into comparable numeric ranges."""
+
+import re
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from ..api.schemas.search import SearchFilters
+
+
+class SalaryPeriod(str, Enum):
+    """Period a salary amount is paid for."""
+
+    HOUR = "hour"
+    MONTH = "month"
+    YEAR = "year"
+
+
+# Months per period, used to bring every amount to a monthly figure
+PERIOD_MONTHS = {
+    SalaryPeriod.HOUR: 1 / 173,  # 40 hours a week
+    SalaryPeriod.MONTH: 1.0,
+    SalaryPeriod.YEAR: 12.0,
+}
+
+# Amounts without a period at or above this are taken as annual, unless paid in hryvnias
+ANNUAL_THRESHOLD = 20_000
+
+CURRENCIES = (
+    ("USD", re.compile(r"\$|\busd\b|дол", re.IGNORECASE)),
+    ("EUR", re.compile(r"€|\beur\b|євро", re.IGNORECASE)),
+    ("GBP", re.compile(r"£|\bgbp\b", re.IGNORECASE)),
+    ("PLN", re.compile(r"zł|\bpln\b", re.IGNORECASE)),
+    ("UAH", re.compile(r"₴|грн|\buah\b", re.IGNORECASE)),
+)
+
+PERIODS = (
+    (SalaryPeriod.HOUR, re.compile(r"/\s*(?:hr|hour|год)|per hour|an hour|hourly|(?:на|за) годину", re.IGNORECASE)),
+    (
+        SalaryPeriod.YEAR,
+        re.compile(r"/\s*(?:yr|year|рік)|per year|a year|annual|per annum|(?:на|за|в) рік", re.IGNORECASE),
+    ),
+    (
+        SalaryPeriod.MONTH,
+        re.compile(r"/\s*(?:mo|month|міс)|per month|a month|monthly|(?:на|за|в) місяць", re.IGNORECASE),
+    ),
+)
+
+# A number with optional thousands separators (comma, dot, apostrophe or any space) and a "k" suffix
+NUMBER = re.compile(
+    r"(?P<number>\d{1,3}(?:[,.'\s]\d{3})+(?!\d)|\d+(?:[.,]\d+)?)\s*(?P<thousands>[kк](?![a-z\u0430-\u044f])|тис)?",
+    re.IGNORECASE,
+)
+
+# Words announcing an upper bound ("до 4000 $") or a lower bound ("від 60 000 грн", "3000+")
+UPPER_BOUND = re.compile(r"\b(?:до|up to|upto|to|max|under|less than)\b", re.IGNORECASE)
+LOWER_BOUND = re.compile(r"\b(?:від|вiд|от|from|starting at|min|over|more than)\b", re.IGNORECASE)
+
+
+class Salary(BaseModel):
+    """Salary range parsed from a posting."""
+
+    min_amount: Optional[float] = Field(None, description="Lower bound, None if only an upper bound is given")
+    max_amount: Optional[float] = Field(None, description="Upper bound, None if only a lower bound is given")
+    currency: Optional[str] = Field(None, description="ISO currency code, None if not stated")
+    period: SalaryPeriod = Field(SalaryPeriod.MONTH, description="Period the amounts are paid for")
+
+    def monthly(self) -> tuple[Optional[float], Optional[float]]:
+        """Return the bounds converted to monthly amounts."""
+        months = PERIOD_MONTHS[self.period]
+        return (
+            None if self.min_amount is None else self.min_amount / months,
+            None if self.max_amount is None else self.max_amount / months,
+        )
+
+
+def _to_number(text: str) -> float:
+    """Convert a matched number with thousands separators or a decimal part to a float."""
+    compact = re.sub(r"\s", "", text)
+    # Separators followed by exactly three digits group thousands; anything else is a decimal part
+    if re.fullmatch(r"\d{1,3}(?:[,.']\d{3})+", compact):
+        return float(re.sub(r"[,.']", "", compact))
+    return float(compact.replace(",", "."))
+
+
+def parse_salary(text: Optional[str]) -> Optional[Salary]:
+    """Parse a salary as shown on job platforms.
+
+    Understands ranges (``$5000-7000``, ``25 000 - 35 000 грн``), upper and lower bounds
+    (``до 4000 $``, ``від 60 000 грн``, ``from $3k``), ``k``/``тис`` suffixes and hourly,
+    monthly or annual periods (``$120,000/yr``). Without an explicit period, hryvnia amounts
+    and amounts below ``ANNUAL_THRESHOLD`` are taken as monthly, larger ones as annual.
+
+    Args:
+        text: Salary text of a posting.
+
+    Returns:
+        Optional[Salary]: Parsed salary, or None if the text contains no amount.
+    """
+    if not text:
+        return None
+    matches = list(NUMBER.finditer(text))
+    if not matches:
+        return None
+
+    amounts = [_to_number(m["number"]) * (1000 if m["thousands"] else 1) for m in matches[:2]]
+    if len(amounts) == 2 and matches[1]["thousands"] and not matches[0]["thousands"] and amounts[0] < 1000:
+        # "$80-120k": the suffix applies to both bounds
+        amounts[0] *= 1000
+
+    currency = next((code for code, pattern in CURRENCIES if pattern.search(text)), None)
+    period = next((period for period, pattern in PERIODS if pattern.search(text)), None)
+    if period is None:
+        large = currency != "UAH" and max(amounts) >= ANNUAL_THRESHOLD
+        period = SalaryPeriod.YEAR if large else SalaryPeriod.MONTH
+
+    if len(amounts) == 2:
+        low, high = sorted(amounts)
+        return Salary(min_amount=low, max_amount=high, currency=currency, period=period)
+    before = text[: matches[0].start()]
+    if UPPER_BOUND.search(before):
+        return Salary(max_amount=amounts[0], currency=currency, period=period)
+    if LOWER_BOUND.search(before) or text[matches[0].end() :].lstrip().startswith("+"):
+        return Salary(min_amount=amounts[0], currency=currency, period=period)
+    return Salary(min_amount=amounts[0], max_amount=amounts[0], currency=currency, period=period)
+
+
+class SalaryFilter(BaseModel):
+    """Monthly salary bounds requested by search criteria."""
+
+    min_monthly: Optional[float] = Field(None, description="Lowest acceptable monthly salary")
+    max_monthly: Optional[float] = Field(None, description="Highest acceptable monthly salary")
+    currency: Optional[str] = Field(None, description="Currency of the bounds, None to compare amounts as they are")
+
+    @classmethod
+    def from_criteria(cls, criteria: SearchFilters) -> Optional["SalaryFilter"]:
+        """Build the salary filter of search criteria.
+
+        ``salary_min`` and ``salary_max`` are monthly amounts, ``salary_range`` is an annual range;
+        when both are given the narrower bound wins.
+
+        Args:
+            criteria: Search criteria.
+
+        Returns:
+            Optional[SalaryFilter]: Filter, or None if the criteria do not restrict the salary.
+        """
+        lows = [criteria.salary_min]
+        highs = [criteria.salary_max]
+        currency = None
+        if criteria.salary_range:
+            salary_range = criteria.salary_range
+            lows.append(None if salary_range.min_amount is None else salary_range.min_amount / 12)
+            highs.append(None if salary_range.max_amount is None else salary_range.max_amount / 12)
+            currency = salary_range.currency
+        low = max((value for value in lows if value is not None), default=None)
+        high = min((value for value in highs if value is not None), default=None)
+        if low is None and high is None:
+            return None
+        return cls(min_monthly=low, max_monthly=high, currency=currency.upper() if currency else None)
+
+    def matches(self, salary: Optional[Salary]) -> bool:
+        """Whether a posting's salary range overlaps the requested bounds.
+
+        Postings without a salary, or paid in another currency, cannot be shown to match.
+
+        Args:
+            salary: Parsed salary of the posting.
+
+        Returns:
+            bool: True if the posting pays within the bounds.
+        """
+        if salary is None:
+            return False
+        if self.currency and salary.currency and salary.currency != self.currency:
+            return False
+        low, high = salary.monthly()
+        upper = high if high is not None else low
+        lower = low if low is not None else high
+        if self.min_monthly is not None and (upper is None or upper < self.min_monthly):
+            return False
+        return self.max_monthly is None or (lower is not None and lower <= self.max_monthly)
@@ -0,0 +1,69 @@
+"""Coalescing of concurrent identical calls into one in-flight call."""
+
+import asyncio
+from collections.abc import Awaitable, Hashable
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class Flight(Generic[T]):
+    """In-flight call shared by every caller waiting on its key."""
+
+    def __init__(self, task: "asyncio.Task[T]") -> None:
+        """Initialize the flight.
+
+        Args:
+            task: Task running the call.
+        """
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one call per key at a time, sharing its result or error with concurrent callers.
+
+    The call runs in its own task and is cancelled only when every caller waiting on it has been
+    cancelled, so one client going away does not cancel the work for the others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._flights: dict[Hashable, Flight[T]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._flights)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a call, or join the call already running under the same key.
+
+        Args:
+            key: Identity of the call; callers with equal keys share one call.
+            call: Function starting the call, invoked only if none is in flight for the key.
+
+        Returns:
+            T: Result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised, re-raised to every caller.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        flight.waiters += 1
+        try:
+            # Shielded so cancelling one caller leaves the call running for the rest
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                self._forget(key, flight)
+
+    def _forget(self, key: Hashable, flight: Flight[T]) -> None:
+        """Drop a finished or abandoned flight so the next caller starts a new call."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -0,0 +1,395 @@
+"""Tests for the SQLite job store."""
+
+import asyncio
+import sqlite3
+import time
+from datetime import date, datetime, timezone
+
+import pytest
+
+from src.job_search_ai_assistant.api.crud import (
+    JobQuery,
+    SQLiteJobStore,
+    StoredJob,
+    build_match_query,
+    canonical_job_url,
+    create_job_store,
+    normalize_posted_date,
+)
+from src.job_search_ai_assistant.collectors.crawl4ai.models import JobPosting
+from src.job_search_ai_assistant.collectors.salary import SalaryPeriod
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_posting(i: int, **overrides) -> JobPosting:
+    """Create a valid job posting."""
+    data = {
+        "title": f"Python Developer {i}",
+        "company": "Tech Corp",
+        "location": "Kyiv, Ukraine",
+        "salary": "$5000-7000",
+        "description": "Build APIs",
+        "requirements": ["Python", "FastAPI"],
+        "url": f"https://djinni.co/jobs/{i}-python-developer/",
+        "platform": "Djinni",
+        "posted_date": "2026-10-01",
+    }
+    return JobPosting(**{**data, **overrides})
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+async def store(tmp_path, clock):
+    """Open job store in a temporary directory."""
+    async with SQLiteJobStore(tmp_path / "db" / "jobs.db", pool_size=2, clock=clock) as store:
+        yield store
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://djinni.co/jobs/1-python/", "https://djinni.co/jobs/1-python"),
+        (
+            "https://WWW.LinkedIn.com/jobs/view/42/?refId=abc&trackingId=x&position=1&pageNum=0",
+            "https://www.linkedin.com/jobs/view/42",
+        ),
+        ("https://jobs.dou.ua/vacancies/7/?from=list_hot&utm_source=tg", "https://jobs.dou.ua/vacancies/7"),
+        ("https://www.work.ua/jobs/9/?b=2&a=1#apply", "https://www.work.ua/jobs/9?a=1&b=2"),
+    ],
+)
+def test_canonical_job_url(url, expected):
+    """Test that tracking parameters and formatting differences are dropped."""
+    assert canonical_job_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("python", '"python"*'),
+        ("Python  Django", '"Python"* AND "Django"*'),
+        ('c++ OR "c#" NEAR(', '"c++"* AND "OR"* AND "c#"* AND "NEAR"*'),
+        ("  -- ", ""),
+    ],
+)
+def test_build_match_query(text, expected):
+    """Test that search words become quoted prefix terms, operators included."""
+    assert build_match_query(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("2026-10-01", "2026-10-01"),
+        ("2026-10-01T09:30:00Z", "2026-10-01"),
+        ("01.10.2026", "2026-10-01"),
+        ("1 жовтня 2026", "2026-10-01"),
+        ("Oct 1, 2026", "2026-10-01"),
+        ("20 жовтня", "2025-10-20"),
+        ("Сьогодні", "2026-10-17"),
+        ("вчора", "2026-10-16"),
+        ("3 days ago", "2026-10-14"),
+        ("2 тижні тому", "2026-10-03"),
+        ("31.02.2026", None),
+        ("Junior 5", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_normalize_posted_date(text, expected):
+    """Test that posted dates as shown on the platforms become ISO dates."""
+    assert normalize_posted_date(text, date(2026, 10, 17)) == expected
+
+
+def test_create_job_store(tmp_path):
+    """Test that database URLs select the backend."""
+    store = create_job_store(f"sqlite:///{tmp_path}/jobs.db")
+
+    assert isinstance(store, SQLiteJobStore)
+    assert store.path == tmp_path / "jobs.db"
+    with pytest.raises(ValueError, match="Unsupported"):
+        create_job_store("postgresql://localhost/jobs")
+
+
+class TestSQLiteJobStore:
+    """Tests for SQLiteJobStore."""
+
+    @pytest.mark.asyncio
+    async def test_wal_mode(self, store):
+        """Test that the database runs in WAL mode."""
+        conn = sqlite3.connect(store.path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    @pytest.mark.asyncio
+    async def test_upsert_and_get(self, store):
+        """Test that a stored posting round-trips with its parsed fields."""
+        assert await store.upsert([make_posting(1)]) == 1
+
+        job = await store.get("https://djinni.co/jobs/1-python-developer/?utm_source=feed")
+
+        assert job is not None
+        assert job.title == "Python Developer 1"
+        assert job.requirements == ["Python", "FastAPI"]
+        assert (job.salary_min, job.salary_max, job.salary_currency) == (5000, 7000, "USD")
+        assert job.first_seen == job.last_seen == datetime.fromtimestamp(1_700_000_000, timezone.utc)
+        assert await store.get("https://djinni.co/jobs/2/") is None
+
+    @pytest.mark.asyncio
+    async def test_loaded_posting_typed(self, store):
+        """Test that a posting loaded without validation has the types of a validated one."""
+        await store.upsert([make_posting(1, apply_url="https://djinni.co/jobs/1/apply")])
+
+        job = await store.get("https://djinni.co/jobs/1-python-developer/")
+
+        assert job.salary_period is SalaryPeriod.MONTH
+        assert StoredJob.model_validate(job.model_dump()) == job
+
+    @pytest.mark.asyncio
+    async def test_upsert_refreshes_known_postings(self, store, clock):
+        """Test that re-found postings keep first_seen and update everything else."""
+        await store.upsert([make_posting(1), make_posting(2)])
+        clock.now += 3600
+
+        await store.upsert([make_posting(1, title="Senior Python Developer"), make_posting(3)])
+
+        assert await store.count() == 3
+        job = await store.get("https://djinni.co/jobs/1-python-developer")
+        assert job.title == "Senior Python Developer"
+        assert job.last_seen.timestamp() - job.first_seen.timestamp() == 3600
+
+    @pytest.mark.asyncio
+    async def test_duplicates_in_batch(self, store):
+        """Test that one posting found under two URLs is stored once."""
+        written = await store.upsert(
+            [
+                make_posting(1),
+                make_posting(1, url="https://djinni.co/jobs/1-python-developer/?ref=similar"),
+            ]
+        )
+
+        assert written == 1
+        assert await store.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_find(self, store, clock):
+        """Test filtering by platform, location and dates, most recently seen first."""
+        await store.upsert([make_posting(1), make_posting(2, location="Lviv", posted_date="2026-09-01")])
+        clock.now += 60
+        await store.upsert(
+            [make_posting(3, platform="DOU", url="https://jobs.dou.ua/vacancies/3/", posted_date="2026-10-05")]
+        )
+
+        assert [job.title for job in await store.find(JobQuery())] == [
+            "Python Developer 3",
+            "Python Developer 1",
+            "Python Developer 2",
+        ]
+        assert [job.platform for job in await store.find(JobQuery(platform="DOU"))] == ["DOU"]
+        assert [job.location for job in await store.find(JobQuery(location="lviv"))] == ["Lviv"]
+        assert len(await store.find(JobQuery(posted_since="2026-10-01"))) == 2
+        seen = datetime.fromtimestamp(clock.now, timezone.utc)
+        assert [job.title for job in await store.find(JobQuery(seen_since=seen))] == ["Python Developer 3"]
+        assert len(await store.find(JobQuery(limit=1, offset=1))) == 1
+
+    @pytest.mark.asyncio
+    async def test_posted_since_compares_dates(self, store):
+        """Test that posted dates written in any format are filtered in date order."""
+        # The clock is at 2023-11-14
+        await store.upsert(
+            [
+                make_posting(1, posted_date="14.11.2023"),
+                make_posting(2, posted_date="2 days ago"),
+                make_posting(3, posted_date="1 листопада 2023"),
+                make_posting(4, posted_date="Nov 10, 2023"),
+                make_posting(5, posted_date="нещодавно"),
+            ]
+        )
+
+        jobs = await store.find(JobQuery(posted_since="2023-11-10"))
+
+        assert sorted(job.title for job in jobs) == ["Python Developer 1", "Python Developer 2", "Python Developer 4"]
+        assert (await store.get("https://djinni.co/jobs/2-python-developer")).posted_date == "2 days ago"
+
+    @pytest.mark.asyncio
+    async def test_location_cyrillic_case(self, store):
+        """Test that the location filter folds the case of Cyrillic letters, not only of ASCII ones."""
+        await store.upsert([make_posting(1, location="Київ, Україна"), make_posting(2, location="Львів")])
+
+        assert [job.location for job in await store.find(JobQuery(location="київ"))] == ["Київ, Україна"]
+        assert [job.location for job in await store.find(JobQuery(location="ЛЬВІВ"))] == ["Львів"]
+
+    @pytest.mark.asyncio
+    async def test_location_wildcards_literal(self, store):
+        """Test that LIKE wildcards in a location filter match only themselves."""
+        await store.upsert([make_posting(1, location="100% remote"), make_posting(2, location="Kyiv_Lviv")])
+        await store.upsert([make_posting(3, location="Kyiv, Ukraine")])
+
+        assert [job.location for job in await store.find(JobQuery(location="%"))] == ["100% remote"]
+        assert [job.location for job in await store.find(JobQuery(location="v_L"))] == ["Kyiv_Lviv"]
+        assert await store.find(JobQuery(location="v_U")) == []
+
+    @pytest.mark.asyncio
+    async def test_persists_across_reopen(self, tmp_path):
+        """Test that postings survive closing the store."""
+        path = tmp_path / "jobs.db"
+        async with SQLiteJobStore(path) as store:
+            await store.upsert([make_posting(1)])
+
+        async with SQLiteJobStore(path) as store:
+            assert await store.count() == 1
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_reads_during_write(self, store):
+        """Test that lookups are answered while a large batch is written."""
+        await store.upsert([make_posting(0)])
+        batch = [make_posting(i) for i in range(1, 5001)]
+
+        write = asyncio.create_task(store.upsert(batch))
+        await asyncio.sleep(0)
+        started = time.perf_counter()
+        reads = await asyncio.gather(*(store.get("https://djinni.co/jobs/0-python-developer/") for _ in range(10)))
+        elapsed = time.perf_counter() - started
+        await write
+
+        assert all(job is not None for job in reads)
+        assert await store.count() == 5001
+        assert elapsed < 1.0
+
+    @pytest.mark.asyncio
+    async def test_not_open(self, tmp_path):
+        """Test that using a closed store raises."""
+        with pytest.raises(RuntimeError, match="not open"):
+            await SQLiteJobStore(tmp_path / "jobs.db").count()
+
+
+class TestSearch:
+    """Tests for full-text search of SQLiteJobStore."""
+
+    @pytest.mark.asyncio
+    async def test_ranks_title_matches_first(self, store):
+        """Test that a word in the title outranks the same word in the description."""
+        await store.upsert(
+            [
+                make_posting(1, title="Backend Engineer", description="Django services on PostgreSQL"),
+                make_posting(2, title="Django Developer", description="Build APIs"),
+                make_posting(3, title="Frontend Developer", description="React"),
+            ]
+        )
+
+        jobs = await store.search("django", JobQuery())
+
+        assert [job.title for job in jobs] == ["Django Developer", "Backend Engineer"]
+
+    @pytest.mark.asyncio
+    async def test_all_words_as_prefixes(self, store):
+        """Test that every word must match the start of an indexed word, in any case."""
+        await store.upsert(
+            [
+                make_posting(1, title="Senior Python Developer", requirements=["Kubernetes"]),
+                make_posting(2, title="Python Developer", requirements=["Docker"]),
+            ]
+        )
+
+        assert len(await store.search("PYTH dev", JobQuery())) == 2
+        assert [job.title for job in await store.search("pyth kube", JobQuery())] == ["Senior Python Developer"]
+        assert await store.search("ython", JobQuery()) == []
+
+    @pytest.mark.asyncio
+    async def test_ukrainian_text(self, store):
+        """Test that Cyrillic words match in any case and inflection by prefix."""
+        await store.upsert(
+            [
+                make_posting(1, title="Розробник Python", description="Шукаємо розробника в Києві"),
+                make_posting(2, title="Тестувальник", description="Ручне тестування"),
+            ]
+        )
+
+        assert [job.title for job in await store.search("РОЗРОБ", JobQuery())] == ["Розробник Python"]
+        assert [job.title for job in await store.search("києв python", JobQuery())] == ["Розробник Python"]
+        assert await store.search("кі", JobQuery()) == []
+
+    @pytest.mark.asyncio
+    async def test_symbols_in_words(self, store):
+        """Test that technology names with symbols are searchable as written."""
+        await store.upsert(
+            [
+                make_posting(1, title="C++ Developer"),
+                make_posting(2, title="C# Developer"),
+                make_posting(3, title="C Developer"),
+            ]
+        )
+
+        assert [job.title for job in await store.search("c++", JobQuery())] == ["C++ Developer"]
+        assert [job.title for job in await store.search("C#", JobQuery())] == ["C# Developer"]
+
+    @pytest.mark.asyncio
+    async def test_filters(self, store):
+        """Test that lookup filters, limit and offset apply to search results."""
+        await store.upsert(
+            [
+                make_posting(1),
+                make_posting(2, location="Lviv"),
+                make_posting(3, platform="DOU", url="https://jobs.dou.ua/vacancies/3/"),
+            ]
+        )
+
+        assert [job.platform for job in await store.search("python", JobQuery(platform="DOU"))] == ["DOU"]
+        assert [job.location for job in await store.search("python", JobQuery(location="lviv"))] == ["Lviv"]
+        assert len(await store.search("python", JobQuery(limit=2, offset=2))) == 1
+
+    @pytest.mark.asyncio
+    async def test_index_follows_upserts(self, store, clock):
+        """Test that changed postings are re-indexed and unchanged ones are not duplicated."""
+        await store.upsert([make_posting(1, title="Scala Developer"), make_posting(2, title="Go Developer")])
+        clock.now += 60
+
+        await store.upsert([make_posting(1, title="Rust Developer"), make_posting(2, title="Go Developer")])
+
+        assert await store.search("scala", JobQuery()) == []
+        assert [job.title for job in await store.search("rust", JobQuery())] == ["Rust Developer"]
+        assert [job.title for job in await store.search("developer", JobQuery())] == [
+            "Rust Developer",
+            "Go Developer",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_text(self, store):
+        """Test that a text without words matches nothing."""
+        await store.upsert([make_posting(1)])
+
+        assert await store.search(" ?! ", JobQuery()) == []
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_search_latency(self, store):
+        """Test that a search over thousands of postings answers in milliseconds."""
+        await store.upsert(
+            [
+                make_posting(i, title=f"{'Python' if i % 10 == 0 else 'Java'} Developer {i}", description=f"Team {i}")
+                for i in range(10_000)
+            ]
+        )
+
+        started = time.perf_counter()
+        jobs = await store.search("python dev", JobQuery(limit=20))
+        elapsed = time.perf_counter() - started
+
+        assert len(jobs) == 20
+        assert elapsed < 0.1
@@ -0,0 +1,29 @@
+"""Tests for the metrics endpoint."""
+
+from fastapi.testclient import TestClient
+
+from src.job_search_ai_assistant.api.metrics import REGISTRY
+
+# HTTP status code constants
+HTTP_200_OK = 200
+
+
+def test_metrics_endpoint(client):
+    """Test that the metrics are served in the Prometheus text format."""
+    response = client.get("/metrics")
+
+    assert response.status_code == HTTP_200_OK
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    assert "# TYPE jobsearch_crawl_stage_seconds histogram" in response.text
+    assert "# TYPE jobsearch_event_loop_lag_seconds histogram" in response.text
+
+
+def test_lifespan_registers_client_metrics(app):
+    """Test that the running application reports its pool and caches and unregisters them on shutdown."""
+    with TestClient(app) as client:
+        text = client.get("/metrics").text
+        assert 'jobsearch_browser_pool{state="capacity"} 4' in text
+        assert 'jobsearch_cache_hit_ratio{cache="crawl"} 0' in text
+        assert "# TYPE jobsearch_platform_search_seconds histogram" in text
+
+    assert "jobsearch_browser_pool" not in REGISTRY.render()
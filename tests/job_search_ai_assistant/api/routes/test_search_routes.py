@@ -0,0 +1,226 @@
+"""Tests for the job search endpoints."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.job_search_ai_assistant.api import config
+from src.job_search_ai_assistant.api.crud import SQLiteJobStore
+from src.job_search_ai_assistant.api.routes.search import get_orchestrator
+from src.job_search_ai_assistant.api.schemas.search import SearchResponse
+from src.job_search_ai_assistant.collectors.crawl4ai.breaker import CircuitBreakerRegistry
+from src.job_search_ai_assistant.collectors.crawl4ai.client import JobScraperClient
+from src.job_search_ai_assistant.collectors.crawl4ai.models import PostingRecord
+from src.job_search_ai_assistant.collectors.orchestrator import SearchOrchestrator
+
+# HTTP status code constants
+HTTP_200_OK = 200
+HTTP_400_BAD_REQUEST = 400
+HTTP_422_UNPROCESSABLE_ENTITY = 422
+HTTP_503_SERVICE_UNAVAILABLE = 503
+
+
+def make_posting(platform: str, index: int = 1, **overrides) -> PostingRecord:
+    """Create a job posting for the given platform."""
+    data = {
+        "title": f"Python Developer {index}",
+        "company": "Tech Corp",
+        "location": "Kyiv",
+        "description": "Python developer needed",
+        "requirements": ["Python"],
+        "url": f"https://example.com/{platform}/{index}",
+        "platform": platform,
+    }
+    return PostingRecord(**{**data, **overrides})
+
+
+class FakeScraperClient:
+    """Scraper client stand-in with configurable per-platform latency."""
+
+    def __init__(self, delays: dict[str, float] | None = None):
+        self.delays = delays or {}
+        self.breakers = CircuitBreakerRegistry()
+
+    async def scrape_jobs(self, url, platform, criteria, **options):
+        await asyncio.sleep(self.delays.get(platform, 0.01))
+        return [make_posting(platform)]
+
+    async def stream_jobs(self, url, platform, criteria, **options):
+        for index in (1, 2):
+            await asyncio.sleep(self.delays.get(platform, 0.01))
+            yield make_posting(platform, index)
+
+
+@pytest.fixture
+def orchestrator() -> SearchOrchestrator:
+    """Orchestrator over fake platforms."""
+    return SearchOrchestrator(FakeScraperClient())
+
+
+@pytest.fixture
+def search_client(app, orchestrator) -> TestClient:
+    """Test client whose search endpoints use the fake orchestrator."""
+    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
+    return TestClient(app)
+
+
+def test_search(search_client):
+    """Test that a search returns the listings of the requested platforms."""
+    response = search_client.post("/api/v1/search/", json={"query": "python", "platforms": ["dou", "djinni"]})
+
+    assert response.status_code == HTTP_200_OK
+    data = SearchResponse(**response.json())
+    assert data.platforms == ["dou", "djinni"]
+    assert data.total_count == 2
+    assert {job.source for job in data.jobs} == {"dou", "djinni"}
+
+
+def test_search_unknown_platform(search_client):
+    """Test that unknown platforms are rejected as a bad request."""
+    response = search_client.post("/api/v1/search/", json={"query": "python", "platforms": ["indeed"]})
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Unknown platform: indeed"}
+
+
+def test_search_validates_request(search_client):
+    """Test that an empty query is rejected."""
+    response = search_client.post("/api/v1/search/", json={"query": ""})
+
+    assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_search_timeout(app, monkeypatch):
+    """Test that a slow platform is left out once the search timeout passes."""
+    orchestrator = SearchOrchestrator(FakeScraperClient(delays={"LinkedIn": 5.0}))
+    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
+    monkeypatch.setattr(config, "SEARCH_TIMEOUT", 0.2)
+
+    response = TestClient(app).post("/api/v1/search/", json={"query": "python"})
+
+    assert response.status_code == HTTP_200_OK
+    assert {job["source"] for job in response.json()["jobs"]} == {"djinni", "dou", "workua"}
+
+
+def test_stream_ndjson(search_client):
+    """Test that a streamed search sends one NDJSON line per listing and a summary line."""
+    response = search_client.post("/api/v1/search/stream", json={"query": "python", "platforms": ["dou", "djinni"]})
+
+    assert response.status_code == HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["event"] for line in lines] == ["job"] * 4 + ["summary"]
+    assert {line["data"]["source"] for line in lines[:-1]} == {"dou", "djinni"}
+    summary = lines[-1]["data"]
+    assert summary["total_count"] == 4
+    assert [status["platform"] for status in summary["platforms"]] == ["dou", "djinni"]
+    assert all(status["error"] is None and status["count"] == 2 for status in summary["platforms"])
+
+
+def test_stream_sse(search_client):
+    """Test that clients accepting event streams get server-sent events."""
+    response = search_client.post(
+        "/api/v1/search/stream",
+        json={"query": "python", "platforms": ["dou"]},
+        headers={"Accept": "text/event-stream", "Accept-Encoding": "gzip"},
+    )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "content-encoding" not in response.headers
+    events = response.text.strip().split("\n\n")
+    assert [event.splitlines()[0] for event in events] == ["event: job", "event: job", "event: summary"]
+    assert json.loads(events[0].splitlines()[1].removeprefix("data: "))["source"] == "dou"
+
+
+def test_stream_gzip(search_client):
+    """Test that a streamed search is compressed for clients accepting gzip."""
+    response = search_client.post(
+        "/api/v1/search/stream", json={"query": "python"}, headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert json.loads(response.text.splitlines()[-1])["data"]["total_count"] == 8
+
+
+def test_stream_unknown_platform(search_client):
+    """Test that unknown platforms are rejected before streaming starts."""
+    response = search_client.post("/api/v1/search/stream", json={"query": "python", "platforms": ["indeed"]})
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+def test_stored_search_without_store(search_client):
+    """Test that stored-postings search is unavailable without a job store."""
+    response = search_client.get("/api/v1/search/", params={"q": "python"})
+
+    assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+
+
+def test_stored_search(app, tmp_path):
+    """Test that stored postings are searched by relevance without crawling."""
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    orchestrator = SearchOrchestrator(FakeScraperClient(), store=store)
+    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
+
+    with TestClient(app) as client:
+        client.portal.call(store.open)
+        client.portal.call(
+            store.upsert,
+            [
+                make_posting("Work.ua", 1, title="Django Developer"),
+                make_posting("DOU", 2, title="Backend Developer", description="Django and FastAPI"),
+                make_posting("DOU", 3, title="Go Developer", description="Go"),
+            ],
+        )
+
+        response = client.get("/api/v1/search/", params={"q": "djang"})
+        filtered = client.get("/api/v1/search/", params={"q": "djang", "platform": "dou"})
+        unknown = client.get("/api/v1/search/", params={"q": "djang", "platform": "indeed"})
+        client.portal.call(store.close)
+
+    assert response.status_code == HTTP_200_OK
+    assert [(job["title"], job["source"]) for job in response.json()["jobs"]] == [
+        ("Django Developer", "workua"),
+        ("Backend Developer", "dou"),
+    ]
+    assert [job["title"] for job in filtered.json()["jobs"]] == ["Backend Developer"]
+    assert filtered.json()["platforms"] == ["dou"]
+    assert unknown.status_code == HTTP_400_BAD_REQUEST
+
+
+def test_bodies_match_response_model(app, tmp_path):
+    """Test that bodies serialized without FastAPI's response_model check are valid SearchResponses.
+
+    Postings loaded from the store are not validated again, so the stored search is checked as well.
+    """
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    orchestrator = SearchOrchestrator(FakeScraperClient(), store=store)
+    app.dependency_overrides[get_orchestrator] = lambda: orchestrator
+
+    with TestClient(app) as client:
+        client.portal.call(store.open)
+        crawled = client.post("/api/v1/search/", json={"query": "python", "platforms": ["dou", "djinni"]})
+        stored = client.get("/api/v1/search/", params={"q": "python"})
+        client.portal.call(store.close)
+
+    for response in (crawled, stored):
+        assert response.status_code == HTTP_200_OK
+        data = SearchResponse.model_validate_json(response.text)
+        assert response.json() == data.model_dump(mode="json")
+        assert data.jobs
+    assert len(SearchResponse.model_validate_json(stored.text).jobs) == 2
+
+
+def test_lifespan_creates_orchestrator(app, tmp_path, monkeypatch):
+    """Test that the application owns the scraper client and job store while running."""
+    monkeypatch.setattr(config, "DATABASE_URL", f"sqlite:///{tmp_path}/jobs.db")
+
+    with TestClient(app):
+        orchestrator = app.state.orchestrator
+        assert isinstance(orchestrator.client, JobScraperClient)
+        assert not orchestrator.client.pool.started
+        assert isinstance(orchestrator.store, SQLiteJobStore)
+
+    assert (tmp_path / "jobs.db").exists()
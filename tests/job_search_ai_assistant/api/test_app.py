@@ -1,5 +1,10 @@
 """Tests for the core FastAPI application."""
 
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
 from fastapi import FastAPI
 from starlette.testclient import TestClient
 
@@ -7,6 +12,24 @@ from starlette.testclient import TestClient
 HTTP_200_OK = 200
 HTTP_500_INTERNAL_SERVER_ERROR = 500
 
+ROOT = Path(__file__).parents[3]
+
+# Import time of the package plus app creation, in seconds, measured with -X importtime
+STARTUP_BUDGET = 1.0
+
+# Packages only scrapes need
+SCRAPING_PACKAGES = {"crawl4ai", "playwright", "litellm"}
+
+STARTUP_SCRIPT = f"""
+import sys
+from fastapi.testclient import TestClient
+from src.job_search_ai_assistant import assistant
+
+with TestClient(assistant()) as client:
+    assert client.get("/api/v1/health/").status_code == 200
+print(" ".join(sorted(name for name in sys.modules if name.split(".")[0] in {SCRAPING_PACKAGES!r})))
+"""
+
 
 def test_app_creation(app: FastAPI):
     """Test that the application is created with correct configuration."""
@@ -63,3 +86,32 @@ def test_error_handling(client):
     response = client.get("/test-error")
     assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
     assert response.json() == {"detail": "Internal server error"}
+
+
+def test_startup_skips_scraping_dependencies():
+    """Test that starting the app and answering a health check does not import crawl4ai and friends."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", STARTUP_SCRIPT], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == []
+
+
+@pytest.mark.benchmark
+def test_import_time_budget():
+    """Test that importing the package and creating the app stays within the startup budget."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", "from src.job_search_ai_assistant import assistant; assistant()"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines read "import time: <self us> | <cumulative us> | <module>", nested modules indented
+    rows = [line.split("|") for line in result.stderr.splitlines() if line.startswith("import time:")][1:]
+    top_level = [(name.strip(), int(cumulative)) for _, cumulative, name in rows if not name[1:].startswith(" ")]
+    total = sum(cumulative for _, cumulative in top_level) / 1_000_000
+    slowest = sorted(top_level, key=lambda row: row[1], reverse=True)[:5]
+    assert not {name.strip().split(".")[0] for *_, name in rows} & SCRAPING_PACKAGES
+    assert total < STARTUP_BUDGET, f"Startup imports took {total:.3f}s, slowest {slowest}"
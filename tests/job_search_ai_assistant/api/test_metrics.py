@@ -0,0 +1,139 @@
+"""Tests for in-process metrics."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.job_search_ai_assistant.api.metrics import (
+    Counter,
+    Histogram,
+    HistogramFamily,
+    MetricsRegistry,
+    monitor_event_loop_lag,
+)
+
+# Budget per observation; a Prometheus client takes about a microsecond
+OBSERVATION_BUDGET_US = 3.0
+
+
+def test_histogram_buckets():
+    """Test that values are counted in the first bucket whose upper bound they do not exceed."""
+    histogram = Histogram(buckets=(1.0, 5.0))
+
+    for value in (0.2, 1.0, 3.0, 7.5):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == 11.7
+    assert histogram.format() == "<=1:2 <=5:1 >5:1"
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_render_counter_and_gauge(self):
+        """Test the text format of counters and gauges."""
+        registry = MetricsRegistry()
+        errors = registry.counter("errors", "Failed crawls", ("platform", "error_type"))
+        pool = registry.gauge("pool", "Browsers in use")
+        errors.inc("DOU", "NETWORK_ERROR")
+        errors.inc("DOU", "NETWORK_ERROR", amount=2)
+        pool.set(3)
+
+        assert registry.render() == (
+            "# HELP errors Failed crawls\n"
+            "# TYPE errors counter\n"
+            'errors_total{platform="DOU",error_type="NETWORK_ERROR"} 3\n'
+            "# HELP pool Browsers in use\n"
+            "# TYPE pool gauge\n"
+            "pool 3\n"
+        )
+
+    def test_render_histogram(self):
+        """Test that histogram buckets are rendered cumulatively with sum and count."""
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", ("stage",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 2.0):
+            latency.observe(value, "navigate")
+
+        assert registry.render().splitlines()[2:] == [
+            'latency_seconds_bucket{stage="navigate",le="0.1"} 1',
+            'latency_seconds_bucket{stage="navigate",le="1"} 2',
+            'latency_seconds_bucket{stage="navigate",le="+Inf"} 3',
+            'latency_seconds_sum{stage="navigate"} 2.55',
+            'latency_seconds_count{stage="navigate"} 3',
+        ]
+
+    def test_label_values_escaped(self):
+        """Test that quotes, backslashes and newlines in label values are escaped."""
+        registry = MetricsRegistry()
+        registry.counter("errors", "Errors", ("message",)).inc('a "b"\\\n')
+
+        assert 'errors_total{message="a \\"b\\"\\\\\\n"} 1' in registry.render()
+
+    def test_collectors_rendered(self):
+        """Test that collector metrics are built on every render and can be removed."""
+        registry = MetricsRegistry()
+        calls = Counter("calls", "Collector calls")
+
+        def collector():
+            calls.inc()
+            return [calls]
+
+        registry.add_collector(collector)
+        registry.render()
+        assert "calls_total 2" in registry.render()
+
+        registry.remove_collector(collector)
+        assert registry.render() == "\n"
+
+    def test_duplicate_name_rejected(self):
+        """Test that two metrics cannot share a name, and that a name is free once unregistered."""
+        registry = MetricsRegistry()
+        family = registry.histogram("latency", "Latency")
+
+        with pytest.raises(ValueError):
+            registry.counter("latency", "Latency")
+
+        registry.unregister(family)
+        registry.counter("latency", "Latency")
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag():
+    """Test that a blocked event loop shows up as lag."""
+    lag = HistogramFamily("lag", "Lag", buckets=(0.01, 0.1))
+    monitor = asyncio.create_task(monitor_event_loop_lag(0.01, lag))
+    await asyncio.sleep(0.005)
+    time.sleep(0.05)  # Block the loop past the monitor's due time
+    await asyncio.sleep(0.02)
+    monitor.cancel()
+
+    assert lag.labels().count >= 1
+    assert lag.labels().sum >= 0.03
+
+
+class TestBenchmark:
+    """Benchmark of recording metrics on the crawl path."""
+
+    @pytest.mark.benchmark
+    def test_observation_overhead(self):
+        """Test that an observation costs at most a few microseconds."""
+        family = HistogramFamily("stage_seconds", "Stage time", ("platform", "stage"))
+        counter = Counter("errors", "Errors", ("platform", "error_type"))
+        rounds = 100_000
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            family.observe(0.02, "DOU", "navigate")
+        histogram_us = (time.perf_counter() - started) / rounds * 1e6
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            counter.inc("DOU", "NETWORK_ERROR")
+        counter_us = (time.perf_counter() - started) / rounds * 1e6
+
+        assert histogram_us < OBSERVATION_BUDGET_US
+        assert counter_us < OBSERVATION_BUDGET_US
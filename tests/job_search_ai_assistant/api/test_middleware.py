@@ -0,0 +1,230 @@
+"""Tests for the API middleware."""
+
+import statistics
+import time
+import zlib
+
+import pytest
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from src.job_search_ai_assistant.api.middleware import ErrorHandlingMiddleware, StreamingGZipMiddleware
+from src.job_search_ai_assistant.api.routes import health_router
+
+CHUNKS = [b'{"event": "job"}\n' * 5, b'{"event": "summary"}\n']
+
+
+def make_app(content_type: bytes):
+    """Create an ASGI app streaming ``CHUNKS`` with the given content type."""
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", content_type)]})
+        for index, chunk in enumerate(CHUNKS):
+            await send({"type": "http.response.body", "body": chunk, "more_body": index < len(CHUNKS) - 1})
+
+    return app
+
+
+async def run(app, accept_encoding: bytes = b"gzip") -> list[dict]:
+    """Send a request through the middleware and collect the messages sent to the server."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding)]}
+    await StreamingGZipMiddleware(app, minimum_size=10)(scope, receive, send)
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_streamed_chunks_flushed():
+    """Test that each streamed chunk can be decompressed as soon as it is sent."""
+    messages = await run(make_app(b"application/x-ndjson"))
+
+    start, *bodies = messages
+    assert (b"content-encoding", b"gzip") in start["headers"]
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert [decompressor.decompress(message["body"]) for message in bodies] == CHUNKS
+
+
+@pytest.mark.asyncio
+async def test_event_stream_not_compressed():
+    """Test that server-sent events pass through uncompressed."""
+    messages = await run(make_app(b"text/event-stream"))
+
+    assert [message["body"] for message in messages[1:]] == CHUNKS
+
+
+@pytest.mark.asyncio
+async def test_gzip_not_accepted():
+    """Test that responses are not compressed for clients not accepting gzip."""
+    messages = await run(make_app(b"application/x-ndjson"), accept_encoding=b"identity")
+
+    assert [message["body"] for message in messages[1:]] == CHUNKS
+
+
+def make_single_body_app(body: bytes, headers: list[tuple[bytes, bytes]]):
+    """Create an ASGI app sending ``body`` in one message with the given headers."""
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_single_body_compressed_with_length():
+    """Test that a body sent at once is compressed with the content length of the compressed body."""
+    body = b'{"jobs": []}' * 10
+    messages = await run(make_single_body_app(body, [(b"content-length", str(len(body)).encode())]))
+
+    start, message = messages
+    assert zlib.decompress(message["body"], 16 + zlib.MAX_WBITS) == body
+    assert (b"content-length", str(len(message["body"])).encode()) in start["headers"]
+    assert (b"vary", b"Accept-Encoding") in start["headers"]
+
+
+@pytest.mark.asyncio
+async def test_small_or_encoded_body_not_compressed():
+    """Test that bodies below the minimum size and bodies already encoded pass through."""
+    small = await run(make_single_body_app(b"{}", []))
+    encoded = await run(make_single_body_app(b"x" * 100, [(b"content-encoding", b"br")]))
+
+    assert [message.get("body") for message in small] == [None, b"{}"]
+    assert small[0]["headers"] == []
+    assert encoded[1]["body"] == b"x" * 100
+
+
+async def failing_app(scope, receive, send):
+    """ASGI app failing before it responds."""
+    raise ValueError("boom")
+
+
+async def failing_stream(scope, receive, send):
+    """ASGI app failing after it started responding."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    raise ValueError("boom")
+
+
+class TestErrorHandlingMiddleware:
+    """Tests for ErrorHandlingMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_error_becomes_500(self, caplog):
+        """Test that an unhandled error is logged and answered with a 500 JSON body."""
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        await ErrorHandlingMiddleware(failing_app)({"type": "http", "headers": []}, None, send)
+
+        assert messages[0]["status"] == 500
+        assert messages[1]["body"] == b'{"detail":"Internal server error"}'
+        assert "Unhandled error: boom" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_error_after_response_started(self):
+        """Test that an error after the response started is re-raised instead of sending a second response."""
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        with pytest.raises(ValueError, match="boom"):
+            await ErrorHandlingMiddleware(failing_stream)({"type": "http", "headers": []}, None, send)
+        assert len(messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_lifespan_passes_through(self):
+        """Test that non-HTTP scopes reach the app untouched."""
+        scopes = []
+
+        async def app(scope, receive, send):
+            scopes.append(scope["type"])
+
+        await ErrorHandlingMiddleware(app)({"type": "lifespan"}, None, None)
+
+        assert scopes == ["lifespan"]
+
+
+def make_health_app(pure_asgi: bool) -> FastAPI:
+    """Create the middleware stack of the API around the health endpoint."""
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+    app.add_middleware(StreamingGZipMiddleware, minimum_size=1000)
+    if pure_asgi:
+        app.add_middleware(ErrorHandlingMiddleware)
+    else:
+
+        @app.middleware("http")
+        async def error_handling_middleware(request: Request, call_next):
+            try:
+                return await call_next(request)
+            except Exception:
+                return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+    router = APIRouter(prefix="/api/v1")
+    router.include_router(health_router)
+    app.include_router(router)
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> tuple[float, float]:
+    """Call the health endpoint directly over ASGI and return requests per second and p99 latency in ms."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/health/",
+        "raw_path": b"/api/v1/health/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(requests):
+        request_started = time.perf_counter()
+        await app(dict(scope), receive, send)
+        latencies.append(time.perf_counter() - request_started)
+    elapsed = time.perf_counter() - started
+    return requests / elapsed, statistics.quantiles(latencies, n=100)[98] * 1000
+
+
+class TestBenchmark:
+    """Benchmark of the error handler on the health endpoint."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_faster_than_base_http_middleware(self):
+        """Test that the ASGI error handler serves more requests per second than @app.middleware("http")."""
+        base_http, pure_asgi = make_health_app(pure_asgi=False), make_health_app(pure_asgi=True)
+        await measure(base_http, 200)
+        await measure(pure_asgi, 200)
+
+        base_rps, base_p99 = await measure(base_http, 3000)
+        asgi_rps, asgi_p99 = await measure(pure_asgi, 3000)
+
+        assert asgi_rps > base_rps, (
+            f"@app.middleware {base_rps:.0f} req/s, p99 {base_p99:.3f}ms; "
+            f"ASGI middleware {asgi_rps:.0f} req/s, p99 {asgi_p99:.3f}ms"
+        )
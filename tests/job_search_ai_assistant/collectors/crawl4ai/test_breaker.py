@@ -0,0 +1,203 @@
+"""Tests for platform circuit breakers."""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.job_search_ai_assistant.api.schemas.search import SearchFilters
+from src.job_search_ai_assistant.collectors.crawl4ai.breaker import (
+    BreakerState,
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerRegistry,
+)
+from src.job_search_ai_assistant.collectors.crawl4ai.client import JobScraperClient
+from src.job_search_ai_assistant.collectors.crawl4ai.exceptions import (
+    CircuitOpenError,
+    ExtractionError,
+    NetworkError,
+    PoolExhaustedError,
+    ValidationError,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock) -> CircuitBreaker:
+    """Breaker opening after two failures with a 10s cooldown."""
+    return CircuitBreaker("LinkedIn", CircuitBreakerConfig(failure_threshold=2, cooldown=10), clock)
+
+
+async def crawl(pages=None, error=None):
+    """Async iterator over pages, optionally failing after them."""
+    for page in pages or []:
+        yield page
+    if error is not None:
+        raise error
+
+
+async def drain(pages) -> list:
+    """Collect all items of an async iterator."""
+    return [page async for page in pages]
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        """Test that the circuit opens once the failure threshold is reached."""
+        breaker.record_failure(NetworkError("timeout"))
+        assert breaker.state == BreakerState.CLOSED
+
+        breaker.record_failure(ExtractionError("no listings"))
+
+        assert breaker.state == BreakerState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.details["retry_after"] == 10
+
+    def test_success_resets_failures(self, breaker):
+        """Test that only consecutive failures count."""
+        breaker.record_failure(NetworkError("timeout"))
+        breaker.record_success()
+        breaker.record_failure(NetworkError("timeout"))
+
+        assert breaker.state == BreakerState.CLOSED
+
+    def test_other_errors_do_not_trip(self, breaker):
+        """Test that errors unrelated to platform health are ignored."""
+        for _ in range(5):
+            breaker.record_failure(ValidationError("bad item"))
+            breaker.record_failure(ValueError("bug"))
+
+        assert breaker.state == BreakerState.CLOSED
+
+    def test_pool_exhaustion_does_not_trip(self, breaker):
+        """Test that running out of local browsers does not count against the platform."""
+        for _ in range(5):
+            breaker.record_failure(PoolExhaustedError("Timed out waiting for a free browser"))
+
+        assert breaker.state == BreakerState.CLOSED
+
+    def test_half_open_allows_single_probe(self, breaker, clock):
+        """Test that after the cooldown exactly one probe is let through."""
+        for _ in range(2):
+            breaker.record_failure(NetworkError("timeout"))
+        clock.now = 10
+
+        assert breaker.state == BreakerState.HALF_OPEN
+        breaker.before_request()
+        assert not breaker.allows_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_successful_probe_closes(self, breaker, clock):
+        """Test that a successful probe closes the circuit."""
+        for _ in range(2):
+            breaker.record_failure(NetworkError("timeout"))
+        clock.now = 10
+        breaker.before_request()
+
+        breaker.record_success()
+
+        assert breaker.state == BreakerState.CLOSED
+        assert breaker.to_dict() == {"state": "closed", "failures": 0, "retry_after": 0.0}
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        """Test that a failed probe starts a new cooldown."""
+        for _ in range(2):
+            breaker.record_failure(NetworkError("timeout"))
+        clock.now = 10
+        breaker.before_request()
+
+        breaker.record_failure(NetworkError("timeout"))
+
+        assert breaker.state == BreakerState.OPEN
+        assert breaker.retry_after == 10
+
+    @pytest.mark.asyncio
+    async def test_guard_records_outcomes(self, breaker):
+        """Test that guarded crawls record failures and successes."""
+        for _ in range(2):
+            with pytest.raises(NetworkError):
+                await drain(breaker.guard(lambda: crawl(error=NetworkError("timeout"))))
+
+        with pytest.raises(CircuitOpenError):
+            await drain(breaker.guard(lambda: crawl([[1]])))
+
+    @pytest.mark.asyncio
+    async def test_abandoned_probe_releases_slot(self, breaker, clock):
+        """Test that a probe abandoned by its consumer lets the next probe through."""
+        for _ in range(2):
+            breaker.record_failure(NetworkError("timeout"))
+        clock.now = 10
+
+        pages = breaker.guard(lambda: crawl([[1], [2]]))
+        async for _ in pages:
+            break
+        await pages.aclose()
+
+        assert breaker.allows_request()
+        assert await drain(breaker.guard(lambda: crawl([[1]]))) == [[1]]
+        assert breaker.state == BreakerState.CLOSED
+
+
+def test_registry():
+    """Test that breakers are kept per platform."""
+    registry = CircuitBreakerRegistry(CircuitBreakerConfig(failure_threshold=1))
+
+    registry.get("LinkedIn").record_failure(NetworkError("timeout"))
+
+    assert registry.is_open("LinkedIn")
+    assert not registry.is_open("Djinni")
+    assert registry.states()["LinkedIn"]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_client_fails_fast_when_open(mocker: MockerFixture):
+    """Test that the client stops crawling a platform whose circuit is open."""
+
+    class MockCrawler:
+        def __init__(self):
+            self.calls = 0
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            return None
+
+        async def arun(self, url, config):
+            self.calls += 1
+
+            async def gen():
+                yield {"success": False, "error": "Timeout 30000ms exceeded"}
+
+            return gen()
+
+    crawler = MockCrawler()
+    mocker.patch("crawl4ai.AsyncWebCrawler", return_value=crawler)
+    client = JobScraperClient(breaker_config=CircuitBreakerConfig(failure_threshold=2))
+
+    for _ in range(2):
+        with pytest.raises(Exception, match="Timeout"):
+            await client.scrape_jobs(url="https://www.linkedin.com/jobs", platform="LinkedIn", criteria=SearchFilters())
+    with pytest.raises(CircuitOpenError):
+        await client.scrape_jobs(url="https://www.linkedin.com/jobs", platform="LinkedIn", criteria=SearchFilters())
+
+    assert crawler.calls == 2
+    assert client.breakers.is_open("LinkedIn")
@@ -0,0 +1,318 @@
+"""Tests for the crawl result cache."""
+
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.job_search_ai_assistant.api.schemas.search import SearchFilters
+from src.job_search_ai_assistant.collectors.crawl4ai.cache import (
+    CachePolicy,
+    CacheState,
+    CrawlCache,
+    canonical_url,
+)
+from src.job_search_ai_assistant.collectors.crawl4ai.client import JobScraperClient
+from src.job_search_ai_assistant.collectors.crawl4ai.pagination import PaginationConfig
+from src.job_search_ai_assistant.collectors.platforms import DjinniAdapter, LinkedInAdapter
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def policy() -> CachePolicy:
+    """Cache policy with a 60s TTL and 30s stale window."""
+    return CachePolicy(ttl=60, stale_ttl=30)
+
+
+def make_pages(count: int = 1) -> list[list[dict]]:
+    """Create result pages with one posting each."""
+    return [[{"url": f"https://example.com/job/{i}"}] for i in range(count)]
+
+
+async def crawl_pages(pages, calls: list):
+    """Async iterator over pages that records each crawl."""
+    calls.append(1)
+    for items in pages:
+        yield items
+
+
+class TestCachePolicy:
+    """Tests for CachePolicy."""
+
+    def test_default_policy_disabled(self):
+        """Test that the default policy does not cache."""
+        assert CachePolicy().enabled is False
+
+    def test_from_platform(self):
+        """Test per-platform TTLs."""
+        linkedin = CachePolicy.from_platform(LinkedInAdapter().config)
+        djinni = CachePolicy.from_platform(DjinniAdapter().config)
+
+        assert linkedin.enabled
+        assert linkedin.ttl > djinni.ttl
+
+
+def test_canonical_url():
+    """Test that equivalent URLs share a canonical form."""
+    first = canonical_url("HTTPS://Djinni.co/jobs/?page=1&primary_keyword=python#top")
+    second = canonical_url("https://djinni.co/jobs/?primary_keyword=python&page=1")
+
+    assert first == second
+
+
+class TestCrawlCache:
+    """Tests for CrawlCache."""
+
+    def test_key_depends_on_config(self):
+        """Test that different extraction configs produce different keys."""
+        first = CrawlCache.key("Djinni", "https://djinni.co/jobs/", {"baseSelector": "a"})
+        second = CrawlCache.key("Djinni", "https://djinni.co/jobs/", {"baseSelector": "b"})
+
+        assert first != second
+        assert first == CrawlCache.key("Djinni", "https://djinni.co/jobs/", {"baseSelector": "a"})
+
+    def test_fresh_stale_and_expired(self, clock, policy):
+        """Test freshness transitions of an entry."""
+        cache = CrawlCache(clock=clock)
+        key = CrawlCache.key("Djinni", "https://djinni.co/jobs/")
+        cache.set(key, make_pages(), policy)
+
+        assert cache.get(key)[1] == CacheState.FRESH
+        clock.now = 70
+        assert cache.get(key)[1] == CacheState.STALE
+        clock.now = 100
+        assert cache.get(key) == (None, CacheState.MISS)
+        assert cache.stats.to_dict()["hits"] == 1
+        assert cache.stats.stale_hits == 1
+        assert cache.stats.misses == 1
+
+    def test_disabled_policy_not_stored(self):
+        """Test that a disabled policy stores nothing."""
+        cache = CrawlCache()
+        cache.set(("p", "u", "c"), make_pages(), CachePolicy())
+
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_entries(self, policy):
+        """Test that the least recently used entry is evicted first."""
+        cache = CrawlCache(max_entries=2)
+        cache.set(("p", "a", ""), make_pages(), policy)
+        cache.set(("p", "b", ""), make_pages(), policy)
+        cache.get(("p", "a", ""))
+        cache.set(("p", "c", ""), make_pages(), policy)
+
+        assert cache.get(("p", "b", ""))[1] == CacheState.MISS
+        assert cache.get(("p", "a", ""))[1] == CacheState.FRESH
+        assert cache.stats.evictions == 1
+
+    def test_eviction_by_size(self, policy):
+        """Test that entries are evicted when the total number of postings is exceeded."""
+        cache = CrawlCache(max_items=5)
+        cache.set(("p", "a", ""), make_pages(3), policy)
+        cache.set(("p", "b", ""), make_pages(3), policy)
+
+        assert len(cache) == 1
+        assert cache.get(("p", "b", ""))[1] == CacheState.FRESH
+
+    @pytest.mark.asyncio
+    async def test_iter_pages_miss_then_hit(self, policy):
+        """Test that a completed crawl is replayed from the cache."""
+        cache = CrawlCache()
+        key = ("p", "u", "c")
+        calls: list = []
+        pages = make_pages(2)
+
+        first = [items async for items in cache.iter_pages(key, policy, lambda: crawl_pages(pages, calls))]
+        second = [items async for items in cache.iter_pages(key, policy, lambda: crawl_pages(pages, calls))]
+
+        assert first == second == pages
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_iter_pages_incomplete_crawl_not_stored(self, policy):
+        """Test that a crawl abandoned by the consumer is not cached."""
+        cache = CrawlCache()
+        calls: list = []
+        pages = cache.iter_pages(("p", "u", "c"), policy, lambda: crawl_pages(make_pages(3), calls))
+
+        async for _ in pages:
+            break
+        await pages.aclose()
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_iter_pages_lost_pages_not_stored(self, clock, policy):
+        """Test that a crawl that lost pages is neither cached nor replaces a stale entry."""
+        cache = CrawlCache(clock=clock)
+        calls: list = []
+
+        pages = [
+            items
+            async for items in cache.iter_pages(
+                ("p", "u", "c"), policy, lambda: crawl_pages(make_pages(2), calls), complete=lambda: False
+            )
+        ]
+        cache.set(("p", "u", "stale"), make_pages(1), policy)
+        clock.now = 70
+        async for _ in cache.iter_pages(
+            ("p", "u", "stale"), policy, lambda: crawl_pages(make_pages(2), calls), complete=lambda: False
+        ):
+            pass
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert pages == make_pages(2)
+        assert cache.get(("p", "u", "c")) == (None, CacheState.MISS)
+        assert cache.get(("p", "u", "stale")) == (make_pages(1), CacheState.STALE)
+        assert cache.stats.refreshes == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self, clock, policy):
+        """Test that stale pages are served while a single background refresh runs."""
+        cache = CrawlCache(clock=clock)
+        key = ("p", "u", "c")
+        calls: list = []
+        cache.set(key, make_pages(1), policy)
+        clock.now = 70
+
+        served = [
+            [items async for items in cache.iter_pages(key, policy, lambda: crawl_pages(make_pages(2), calls))]
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert served == [make_pages(1), make_pages(1)]
+        assert len(calls) == 1
+        assert cache.stats.refreshes == 1
+        assert cache.get(key) == (make_pages(2), CacheState.FRESH)
+
+
+class TestClientCache:
+    """Tests for caching in JobScraperClient."""
+
+    @pytest.mark.asyncio
+    async def test_identical_searches_reuse_crawl(self, mocker: MockerFixture):
+        """Test that an identical search within the TTL does not crawl again."""
+
+        class MockCrawler:
+            def __init__(self):
+                self.calls = 0
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+            async def arun(self, url, config):
+                self.calls += 1
+
+                async def gen():
+                    yield {
+                        "success": True,
+                        "content": [
+                            {
+                                "title": "Python Developer",
+                                "company": "Tech Corp",
+                                "location": "Kyiv",
+                                "description": "Python developer needed",
+                                "requirements": ["Python"],
+                                "url": "https://example.com/job/1",
+                            }
+                        ],
+                    }
+
+                return gen()
+
+        crawler = MockCrawler()
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=crawler)
+        client = JobScraperClient()
+
+        for criteria in (SearchFilters(), SearchFilters(keywords=["java"])):
+            await client.scrape_jobs(
+                url="https://example.com/jobs?q=python",
+                platform="test",
+                criteria=criteria,
+                cache_policy=CachePolicy(ttl=60),
+            )
+        jobs = await client.scrape_jobs(
+            url="https://example.com/jobs?q=python",
+            platform="test",
+            criteria=SearchFilters(),
+            cache_policy=CachePolicy(ttl=60),
+        )
+
+        assert crawler.calls == 1
+        assert len(jobs) == 1
+        assert client.cache.stats.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_crawl_with_failed_page_not_reused(self, mocker: MockerFixture):
+        """Test that a search whose later page failed crawls again instead of replaying the partial result."""
+
+        class MockCrawler:
+            def __init__(self):
+                self.urls = []
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+            async def arun(self, url, config):
+                self.urls.append(url)
+
+                async def gen():
+                    if "page=2" in url:
+                        yield {"success": False, "error": "Page crashed"}
+                        return
+                    yield {
+                        "success": True,
+                        "content": [
+                            {
+                                "title": "Python Developer",
+                                "company": "Tech Corp",
+                                "location": "Kyiv",
+                                "description": "Python developer needed",
+                                "requirements": ["Python"],
+                                "url": "https://example.com/job/1",
+                            }
+                        ],
+                    }
+
+                return gen()
+
+        crawler = MockCrawler()
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=crawler)
+        client = JobScraperClient()
+
+        for _ in range(2):
+            jobs = await client.scrape_jobs(
+                url="https://example.com/jobs?q=python",
+                platform="test",
+                criteria=SearchFilters(),
+                pagination=PaginationConfig(max_pages=3, concurrency=1),
+                cache_policy=CachePolicy(ttl=60),
+            )
+
+        assert len(jobs) == 1
+        assert len(crawler.urls) == 4
+        assert len(client.cache) == 0
@@ -4,11 +4,21 @@ import pytest
 from crawl4ai import BrowserConfig
 from pytest_mock import MockerFixture
 
-from src.job_search_ai_assistant.api.schemas.search import SearchFilters
+from src.job_search_ai_assistant.api.schemas.search import SalaryRange, SearchFilters
+from src.job_search_ai_assistant.collectors.crawl4ai.breaker import CircuitBreakerConfig
 from src.job_search_ai_assistant.collectors.crawl4ai.client import JobScraperClient
-from src.job_search_ai_assistant.collectors.crawl4ai.exceptions import ScrapingError
-from src.job_search_ai_assistant.collectors.crawl4ai.extractors import JobExtractionStrategy
+from src.job_search_ai_assistant.collectors.crawl4ai.exceptions import NetworkError, ScrapingError
+from src.job_search_ai_assistant.collectors.crawl4ai.extractors import JobExtractionStrategy, LxmlExtractionStrategy
 from src.job_search_ai_assistant.collectors.crawl4ai.models import JobPosting
+from src.job_search_ai_assistant.collectors.crawl4ai.pool import BrowserPoolConfig
+from src.job_search_ai_assistant.collectors.crawl4ai.telemetry import (
+    CRAWL_STAGE_SECONDS,
+    LLM_FALLBACKS,
+    PAGES_FETCHED,
+    PAGES_PER_CRAWL,
+    POSTINGS_PER_PAGE,
+    SCRAPING_ERRORS,
+)
 
 
 class TestJobScraperClient:
@@ -21,7 +31,7 @@ class TestJobScraperClient:
         assert client.browser_config.headless is True
         assert client.browser_config.viewport_width == 1920
         assert client.browser_config.viewport_height == 1080
-        assert isinstance(client.css_strategy, JobExtractionStrategy)
+        assert isinstance(client.css_strategy, LxmlExtractionStrategy)
         assert client.llm_strategy is None
 
     def test_init_custom_browser_config(self):
@@ -39,54 +49,112 @@ class TestJobScraperClient:
 
     def test_init_with_llm(self, mocker: MockerFixture):
         """Test initialization with LLM enabled."""
-        # Mock LLMExtractionStrategy
-        mock_llm_strategy = mocker.patch("src.job_search_ai_assistant.collectors.crawl4ai.client.LLMExtractionStrategy")
+        # Mock JobLLMExtractionStrategy
+        mock_llm_strategy = mocker.patch(
+            "src.job_search_ai_assistant.collectors.crawl4ai.extractors.JobLLMExtractionStrategy"
+        )
 
         client = JobScraperClient(use_llm=True)
 
         assert client.llm_strategy is not None
         mock_llm_strategy.assert_called_once()
 
-    def test_update_css_selectors(self):
-        """Test updating CSS selectors for a platform."""
-        client = JobScraperClient()
+    def test_beautifulsoup_extraction(self):
+        """Test that crawl4ai's BeautifulSoup-based strategy can be used instead of lxml."""
+        client = JobScraperClient(native_extraction=False)
 
-        platform_selectors = {
-            "baseSelector": "div.custom-job",
-            "fields": {
-                "title": "h3.job-title-custom",
-                "company": "span.company-custom",
-            },
-        }
+        assert isinstance(client.css_strategy, JobExtractionStrategy)
+
+    def test_platform_strategies_shared(self):
+        """Test that equal platform configs share one compiled strategy."""
+        client = JobScraperClient()
+        config = {"name": "Platform", "baseSelector": "li.job", "fields": []}
 
-        client.update_css_selectors(platform_selectors)
+        strategy = client._get_extraction_strategy(extraction_config=config)
 
-        # Verify the strategy was configured
-        assert isinstance(client.css_strategy, JobExtractionStrategy)
+        assert client._get_extraction_strategy(extraction_config=dict(config)) is strategy
+        assert client._get_extraction_strategy(extraction_config={**config, "baseSelector": "li.other"}) is not strategy
 
     def test_get_extraction_strategy_css_only(self):
         """Test getting extraction strategy when only CSS is available."""
         client = JobScraperClient(use_llm=False)
 
-        strategy = client._get_extraction_strategy(llm_fallback=True)
-        assert strategy == client.css_strategy
-
-        strategy = client._get_extraction_strategy(llm_fallback=False)
+        strategy = client._get_extraction_strategy()
         assert strategy == client.css_strategy
 
     def test_get_extraction_strategy_with_llm_fallback(self, mocker: MockerFixture):
-        """Test getting extraction strategy with LLM fallback."""
-        mocker.patch("src.job_search_ai_assistant.collectors.crawl4ai.client.LLMExtractionStrategy")
+        """Test that the LLM strategy is never run by the crawler itself."""
+        mocker.patch("src.job_search_ai_assistant.collectors.crawl4ai.extractors.JobLLMExtractionStrategy")
 
         client = JobScraperClient(use_llm=True)
 
-        # Should return CSS strategy when llm_fallback is False
-        strategy = client._get_extraction_strategy(llm_fallback=False)
+        strategy = client._get_extraction_strategy()
         assert strategy == client.css_strategy
 
-        # Should return LLM strategy when llm_fallback is True
-        strategy = client._get_extraction_strategy(llm_fallback=True)
-        assert strategy == client.llm_strategy
+    @pytest.mark.asyncio
+    async def test_start_and_close_lifecycle(self, mocker: MockerFixture):
+        """Test that start warms the browser pool and close shuts it down."""
+
+        class MockCrawler:
+            def __init__(self):
+                self.closed = False
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                self.closed = True
+
+        crawlers = []
+
+        def make_crawler(config):
+            crawlers.append(MockCrawler())
+            return crawlers[-1]
+
+        mocker.patch("crawl4ai.AsyncWebCrawler", side_effect=make_crawler)
+
+        async with JobScraperClient(pool_config=BrowserPoolConfig(size=2)) as client:
+            assert client.pool.idle == 2
+
+        assert len(crawlers) == 2
+        assert all(crawler.closed for crawler in crawlers)
+
+    @pytest.mark.asyncio
+    async def test_scrape_jobs_reuses_pooled_browser(self, mocker: MockerFixture):
+        """Test that consecutive scrapes share one browser instead of launching a new one."""
+
+        async def mock_async_generator():
+            yield {"success": True, "content": []}
+
+        class MockCrawler:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+            async def arun(self, url, config):
+                return mock_async_generator()
+
+        mock_factory = mocker.patch("crawl4ai.AsyncWebCrawler", return_value=MockCrawler())
+
+        client = JobScraperClient(pool_config=BrowserPoolConfig(size=1))
+        for _ in range(3):
+            await client.scrape_jobs(url="https://example.com", platform="test", criteria=SearchFilters())
+        await client.close()
+
+        assert mock_factory.call_count == 1
+
+    def test_get_extraction_strategy_with_platform_config(self):
+        """Test that a platform extraction config gets its own strategy instance."""
+        client = JobScraperClient()
+        config = {"name": "Platform", "baseSelector": "li.job", "fields": []}
+
+        strategy = client._get_extraction_strategy(extraction_config=config)
+
+        assert isinstance(strategy, LxmlExtractionStrategy)
+        assert strategy is not client.css_strategy
+        assert strategy.config == config
 
     @pytest.mark.asyncio
     async def test_scrape_jobs_success(self, mocker: MockerFixture):
@@ -122,9 +190,7 @@ class TestJobScraperClient:
             async def arun(self, url, config):
                 return mock_async_generator()
 
-        mocker.patch(
-            "src.job_search_ai_assistant.collectors.crawl4ai.client.AsyncWebCrawler", return_value=MockCrawler()
-        )
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=MockCrawler())
 
         client = JobScraperClient()
         criteria = SearchFilters(keywords=["Python"])
@@ -165,9 +231,7 @@ class TestJobScraperClient:
                 return mock_async_generator()
 
         mock_crawler = MockCrawler()
-        mocker.patch(
-            "src.job_search_ai_assistant.collectors.crawl4ai.client.AsyncWebCrawler", return_value=mock_crawler
-        )
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=mock_crawler)
 
         client = JobScraperClient()
         criteria = SearchFilters()
@@ -191,19 +255,17 @@ class TestJobScraperClient:
         """Test LLM fallback when CSS extraction fails."""
         # Create mock result dicts
         first_result = {"success": False, "error": "CSS extraction failed"}
-        second_result = {
-            "success": True,
-            "content": [
-                {
-                    "title": "LLM Extracted Job",
-                    "company": "Company",
-                    "location": "Location",
-                    "description": "Description",
-                    "requirements": ["Req1"],
-                    "url": "https://example.com/job",
-                }
-            ],
-        }
+        second_result = {"success": True, "html": "<html><body><div class='job-posting'>Job</div></body></html>"}
+        llm_items = [
+            {
+                "title": "LLM Extracted Job",
+                "company": "Company",
+                "location": "Location",
+                "description": "Description",
+                "requirements": ["Req1"],
+                "url": "https://example.com/job",
+            }
+        ]
 
         # Create proper async generators for both calls
         async def first_gen():
@@ -216,6 +278,7 @@ class TestJobScraperClient:
         class MockCrawler:
             def __init__(self):
                 self.call_count = 0
+                self.configs = []
                 self.generators = [first_gen(), second_gen()]
 
             async def __aenter__(self):
@@ -225,21 +288,19 @@ class TestJobScraperClient:
                 return None
 
             async def arun(self, url, config):
+                self.configs.append(config)
                 result = self.generators[self.call_count]
                 self.call_count += 1
                 return result
 
         mock_crawler = MockCrawler()
-        mocker.patch(
-            "src.job_search_ai_assistant.collectors.crawl4ai.client.AsyncWebCrawler", return_value=mock_crawler
-        )
-
-        # Mock LLMExtractionStrategy to return a proper instance
-        from crawl4ai.extraction_strategy import ExtractionStrategy
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=mock_crawler)
 
-        mock_llm_instance = mocker.MagicMock(spec=ExtractionStrategy)
+        # Mock JobLLMExtractionStrategy so no LLM is called
+        mock_llm_instance = mocker.MagicMock()
+        mock_llm_instance.aextract = mocker.AsyncMock(return_value=llm_items)
         mocker.patch(
-            "src.job_search_ai_assistant.collectors.crawl4ai.client.LLMExtractionStrategy",
+            "src.job_search_ai_assistant.collectors.crawl4ai.extractors.JobLLMExtractionStrategy",
             return_value=mock_llm_instance,
         )
 
@@ -256,6 +317,11 @@ class TestJobScraperClient:
         assert len(jobs) == 1
         assert jobs[0].title == "LLM Extracted Job"
         assert mock_crawler.call_count == 2
+        # The page is rendered again without extraction and the LLM runs on its HTML
+        assert mock_crawler.configs[1].extraction_strategy is None
+        mock_llm_instance.aextract.assert_awaited_once_with(
+            "https://example.com", second_result["html"], "div.job-posting"
+        )
 
     @pytest.mark.asyncio
     async def test_scrape_jobs_total_failure(self, mocker: MockerFixture):
@@ -278,9 +344,7 @@ class TestJobScraperClient:
             async def arun(self, url, config):
                 return failed_gen()
 
-        mocker.patch(
-            "src.job_search_ai_assistant.collectors.crawl4ai.client.AsyncWebCrawler", return_value=MockCrawler()
-        )
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=MockCrawler())
 
         client = JobScraperClient()
         criteria = SearchFilters()
@@ -398,6 +462,28 @@ class TestJobScraperClient:
         assert len(filtered) == 2
         assert any("remote" in job.description.lower() or "віддалено" in job.description.lower() for job in filtered)
 
+    def test_filter_jobs_by_salary(self):
+        """Test filtering jobs by monthly salary bounds across salary formats."""
+        client = JobScraperClient()
+
+        jobs = [
+            JobPosting(
+                title=f"Developer {i}",
+                company="Company",
+                location="Kyiv",
+                salary=salary,
+                description="Developer needed",
+                requirements=["Python"],
+                url=f"https://example.com/{i}",
+            )
+            for i, salary in enumerate(["$5000-7000", "до 4000 $", "$120,000/yr", "від 60 000 грн", None])
+        ]
+
+        filtered = client._filter_jobs(jobs, SearchFilters(salary_min=4500, salary_range=SalaryRange(currency="USD")))
+
+        assert [job.title for job in filtered] == ["Developer 0", "Developer 2"]
+        assert client._filter_jobs(jobs, SearchFilters(salary_max=3000)) == []
+
     def test_filter_jobs_combined_criteria(self):
         """Test filtering with multiple criteria."""
         client = JobScraperClient()
@@ -468,3 +554,110 @@ class TestJobScraperClient:
 
         assert len(filtered) == len(jobs)
         assert filtered == jobs
+
+
+class TestMetrics:
+    """Tests for the crawl metrics of JobScraperClient.
+
+    The metrics are process-wide, so every test scrapes under a platform name of its own.
+    """
+
+    @staticmethod
+    def mock_crawler(mocker: MockerFixture, *results: dict) -> None:
+        """Patch the crawler to answer each call with the next result."""
+        pending = list(results)
+
+        class MockCrawler:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+            async def arun(self, url, config):
+                result = pending.pop(0)
+
+                async def gen():
+                    yield result
+
+                return gen()
+
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=MockCrawler())
+
+    @pytest.mark.asyncio
+    async def test_stages_recorded(self, mocker: MockerFixture):
+        """Test that each stage of a rendered page and the page and posting counts are recorded."""
+        item = {
+            "title": "Python Developer",
+            "company": "Tech Corp",
+            "location": "Kyiv",
+            "description": "Python developer needed",
+            "requirements": ["Python"],
+            "url": "https://example.com/job/1",
+        }
+        self.mock_crawler(mocker, {"success": True, "content": [item, {**item, "url": "https://example.com/job/2"}]})
+
+        await JobScraperClient().scrape_jobs(url="https://example.com", platform="Staged", criteria=SearchFilters())
+
+        for stage in ("wait", "navigate", "validate", "filter"):
+            assert CRAWL_STAGE_SECONDS.labels("Staged", stage).count == 1
+        assert PAGES_FETCHED.value("Staged", "browser") == 1
+        assert PAGES_PER_CRAWL.labels("Staged").sum == 1
+        assert POSTINGS_PER_PAGE.labels("Staged").sum == 2
+
+    @pytest.mark.asyncio
+    async def test_llm_fallback_counted(self, mocker: MockerFixture):
+        """Test that pages extracted by the LLM are counted."""
+        self.mock_crawler(mocker, {"success": False, "error": "No match"}, {"success": True, "html": "<html></html>"})
+        llm = mocker.MagicMock()
+        llm.aextract = mocker.AsyncMock(return_value=[])
+        mocker.patch(
+            "src.job_search_ai_assistant.collectors.crawl4ai.extractors.JobLLMExtractionStrategy",
+            return_value=llm,
+        )
+
+        await JobScraperClient(use_llm=True).scrape_jobs(
+            url="https://example.com", platform="Fallback", criteria=SearchFilters()
+        )
+
+        assert LLM_FALLBACKS.value("Fallback") == 1
+        assert CRAWL_STAGE_SECONDS.labels("Fallback", "extract").count == 1
+
+    @pytest.mark.asyncio
+    async def test_scraping_error_counted(self, mocker: MockerFixture):
+        """Test that failed crawls are counted by error type."""
+        self.mock_crawler(mocker, {"success": False, "error": "Total failure"})
+
+        with pytest.raises(ScrapingError):
+            await JobScraperClient().scrape_jobs(
+                url="https://example.com", platform="Failing", criteria=SearchFilters()
+            )
+
+        assert SCRAPING_ERRORS.value("Failing", "EXTRACTION_ERROR") == 1
+
+    def test_pool_and_cache_gauges(self):
+        """Test that the collector reports pool utilization and cache hit rates."""
+        client = JobScraperClient(pool_config=BrowserPoolConfig(size=2))
+        client.cache.stats.hits = 3
+        client.cache.stats.misses = 1
+
+        samples = {(metric.name, labels): value for metric in client.metrics() for _, labels, value in metric.samples()}
+
+        assert samples["jobsearch_browser_pool", (("state", "capacity"),)] == 2
+        assert samples["jobsearch_browser_pool", (("state", "in_use"),)] == 0
+        assert samples["jobsearch_browser_pool_unmeasured", ()] == 0
+        assert samples["jobsearch_cache_hit_ratio", (("cache", "crawl"),)] == 0.75
+        assert ("jobsearch_cache_hit_ratio", (("cache", "llm"),)) not in samples
+
+    def test_circuit_gauges(self):
+        """Test that the collector reports the state of every platform's circuit breaker."""
+        client = JobScraperClient(breaker_config=CircuitBreakerConfig(failure_threshold=1))
+        client.breakers.get("LinkedIn").record_failure(NetworkError("timeout"))
+        client.breakers.get("Djinni")
+
+        samples = {(metric.name, labels): value for metric in client.metrics() for _, labels, value in metric.samples()}
+
+        assert samples["jobsearch_circuit_state", (("platform", "LinkedIn"), ("state", "open"))] == 1
+        assert samples["jobsearch_circuit_state", (("platform", "LinkedIn"), ("state", "closed"))] == 0
+        assert samples["jobsearch_circuit_state", (("platform", "Djinni"), ("state", "closed"))] == 1
+        assert samples["jobsearch_circuit_failures", (("platform", "LinkedIn"),)] == 1
@@ -0,0 +1,154 @@
+"""Tests for the LLM extraction result cache."""
+
+import pytest
+
+from src.job_search_ai_assistant.collectors.crawl4ai.llm_cache import LLMCache
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Manually advanced clock."""
+    return FakeClock()
+
+
+SCHEMA = {"type": "object", "properties": {"title": {"type": "string"}}}
+
+
+class TestKey:
+    """Tests for LLMCache.key."""
+
+    def test_whitespace_ignored(self):
+        """Test that reformatted HTML of the same listing shares a key."""
+        assert LLMCache.key("<li>\n  <h2>Python</h2>\n</li>", "extract", SCHEMA, "openai/gpt-4") == LLMCache.key(
+            "<li> <h2>Python</h2> </li>", "extract", SCHEMA, "openai/gpt-4"
+        )
+
+    @pytest.mark.parametrize(
+        "chunk,instruction,schema,provider",
+        [
+            ("<li>Go</li>", "extract", SCHEMA, "openai/gpt-4"),
+            ("<li>Python</li>", "extract all", SCHEMA, "openai/gpt-4"),
+            ("<li>Python</li>", "extract", {"type": "object"}, "openai/gpt-4"),
+            ("<li>Python</li>", "extract", SCHEMA, "openai/gpt-4o-mini"),
+        ],
+    )
+    def test_inputs_change_key(self, chunk, instruction, schema, provider):
+        """Test that every input shaping the answer is part of the key."""
+        assert LLMCache.key(chunk, instruction, schema, provider) != LLMCache.key(
+            "<li>Python</li>", "extract", SCHEMA, "openai/gpt-4"
+        )
+
+    def test_batch_key_depends_on_order(self):
+        """Test that batch keys differ for the same chunks in another order."""
+        assert LLMCache.batch_key(["a", "b"]) != LLMCache.batch_key(["b", "a"])
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+
+    def test_get_and_set(self):
+        """Test storing and looking up items with hit counting."""
+        cache = LLMCache(":memory:")
+
+        assert cache.get("k") is None
+        cache.set("k", [{"title": "Python Developer"}])
+
+        assert cache.get("k") == [{"title": "Python Developer"}]
+        assert cache.to_dict() == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "hit_rate": 0.5,
+            "entries": 1,
+            "bytes": cache.size,
+        }
+
+    def test_empty_result_cached(self):
+        """Test that a listing without postings is remembered as such."""
+        cache = LLMCache(":memory:")
+        cache.set("k", [])
+
+        assert cache.get("k") == []
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that results survive a restart."""
+        path = tmp_path / "cache" / "llm.sqlite3"
+        cache = LLMCache(path)
+        cache.set("k", [{"title": "Python Developer"}])
+        cache.close()
+
+        reopened = LLMCache(path)
+
+        assert reopened.get("k") == [{"title": "Python Developer"}]
+        assert reopened.size > 0
+        reopened.close()
+
+    def test_evicts_least_recently_used(self, clock):
+        """Test that the least recently used entries are evicted once over the size limit."""
+        cache = LLMCache(":memory:", max_bytes=250, clock=clock)
+        item = [{"description": "x" * 50}]
+        for key in ("a", "b", "c"):
+            clock.now += 1
+            cache.set(key, item)
+        clock.now += 1
+        cache.get("a")
+
+        clock.now += 1
+        cache.set("d", item)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == item
+        assert cache.stats.evictions == 1
+        assert cache.size <= 250
+
+    def test_overwrite_keeps_size(self):
+        """Test that replacing an entry does not count its old size."""
+        cache = LLMCache(":memory:")
+        cache.set("k", [{"title": "A" * 100}])
+        cache.set("k", [{"title": "B"}])
+
+        assert len(cache) == 1
+        assert cache.size == cache._bytes
+
+    def test_clear(self):
+        """Test that clearing drops all entries."""
+        cache = LLMCache(":memory:")
+        cache.set("k", [])
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_async_many(self, clock):
+        """Test that looking up and storing several keys off the event loop marks the hits as used."""
+        cache = LLMCache(":memory:", clock=clock)
+        await cache.aset_many([("a", [{"title": "A"}]), ("b", [])])
+        clock.now += 1
+
+        assert await cache.aget_many(["a", "b", "c"]) == [[{"title": "A"}], [], None]
+        assert cache.conn.execute("SELECT used FROM llm_results ORDER BY key").fetchall() == [(1.0,), (1.0,)]
+        assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_batch_hit_counts_chunks(self):
+        """Test that a batch hit turns the misses of its chunks into hits and a batch miss counts nothing."""
+        cache = LLMCache(":memory:")
+        cache.set("batch", [{"title": "A"}])
+        assert await cache.aget_many(["x", "y", "z"]) == [None, None, None]
+
+        assert await cache.aget_batch("other", 3) is None
+        assert (cache.stats.hits, cache.stats.misses) == (0, 3)
+        assert await cache.aget_batch("batch", 3) == [{"title": "A"}]
+        assert (cache.stats.hits, cache.stats.misses) == (3, 0)
@@ -0,0 +1,188 @@
+"""Tests and benchmark of the lxml extraction strategy against crawl4ai's JsonCssExtractionStrategy."""
+
+import time
+from urllib.parse import urljoin
+
+import pytest
+
+from src.job_search_ai_assistant.collectors.crawl4ai.extractors import JobExtractionStrategy, LxmlExtractionStrategy
+from src.job_search_ai_assistant.collectors.platforms import DjinniAdapter, DOUAdapter, LinkedInAdapter, WorkUaAdapter
+
+# Listings per results page, as served by the platforms
+LISTINGS_PER_PAGE = 20
+
+# Minimum CPU time reduction per page over JsonCssExtractionStrategy
+MIN_SPEEDUP = 5.0
+
+DESCRIPTION = (
+    "We are looking for an engineer to join the <b>platform team</b> building the services behind our "
+    "marketplace. You will design APIs, own features from idea to production and mentor colleagues. "
+    "Our stack: Python, FastAPI, PostgreSQL, Redis, Kafka, Kubernetes on AWS. "
+    "<br>We offer flexible hours, remote work, paid conferences and an education budget."
+)
+
+LISTING_TEMPLATES = {
+    "Djinni": """
+<div class="list-jobs__item job-list__item" id="job-item-{i}">
+  <div class="d-flex align-items-start">
+    <div class="job-list-item__title mb-1"><a class="h3 job_item__header-link" href="/jobs/{i}-python-developer/">
+      Senior Python Developer {i}</a></div>
+    <span class="public-salary-item">$4500-6000</span>
+  </div>
+  <div class="job-list-item__info"><a class="mr-2" href="/jobs/?company=tech-{i}">Tech Corp {i}</a>
+    <span class="location-text">Kyiv, Remote</span> <span class="nobr">5 years of experience</span></div>
+  <div class="job-post__description-text js-truncated-text">{description}</div>
+  <ul class="job-additional-info--item-text"><li>Python</li><li>FastAPI</li><li>PostgreSQL</li></ul>
+  <div class="job-list-item__counts"><span>12 views</span><span>3 applications</span>
+    <a class="btn-green" href="/jobs/{i}-python-developer/apply">Apply</a></div>
+</div>""",
+    "DOU": """
+<li class="l-vacancy __hot">
+  <div class="date">17 October</div>
+  <div class="title"><a class="vt" href="https://jobs.dou.ua/companies/tech-{i}/vacancies/{i}/">
+    Python Developer {i}</a>
+    <strong>at&nbsp;<a class="company" href="https://jobs.dou.ua/companies/tech-{i}/">Tech Corp {i}</a></strong>
+    <span class="salary">$4000-5500</span> <span class="cities">Kyiv, Lviv, remote</span></div>
+  <div class="sh-info"><div class="text">{description}</div></div>
+  <div class="requirements">Python, Django, Celery, 3+ years</div>
+  <a class="btn-apply" href="https://jobs.dou.ua/companies/tech-{i}/vacancies/{i}/apply/">Apply</a>
+</li>""",
+    "LinkedIn": """
+<li class="jobs-search-results__list-item">
+  <div class="base-card base-search-card job-search-card" data-entity-urn="urn:li:jobPosting:{i}">
+    <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/python-developer-{i}?refId=x&amp;trk=y">
+      <span class="sr-only">Python Developer {i}</span></a>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">Python Developer {i}</h3>
+      <h4 class="base-search-card__subtitle"><a class="hidden-nested-link" href="/company/tech-{i}">Tech Corp {i}</a></h4>
+      <div class="base-search-card__metadata"><span class="job-search-card__location">Kyiv, Ukraine</span>
+        <span class="job-search-card__salary-info">$60,000 - $80,000</span>
+        <time class="job-search-card__listdate" datetime="2026-10-16">1 day ago</time></div>
+    </div>
+    <div class="show-more-less-html__markup">{description}</div>
+    <div class="description__text">Requirements: Python, AWS, Docker</div>
+    <button class="jobs-apply-button" href="/jobs/view/{i}/apply">Easy Apply</button>
+  </div>
+</li>""",
+    "Work.ua": """
+<div class="card card-hover card-visited wordwrap job-link js-job-link-blank" id="job-{i}">
+  <h2 class="cut"><a href="/jobs/{i}/" title="Python developer {i}">Python developer {i}</a></h2>
+  <div class="mt-xs"><span class="strong-600">45 000 - 60 000 UAH</span></div>
+  <div class="add-top-xs"><span><b>Tech Corp {i}</b></span><span class="middot"></span><span>Kyiv</span>
+    <span class="middot"></span><span class="nowrap">45 000 UAH</span></div>
+  <div class="text-muted"><ul><li>Full-time</li><li>Python, Django</li></ul></div>
+  <p class="ellipsis ellipsis-line ellipsis-line-3 text-default-7 mb-0">{description}</p>
+  <div class="pull-right"><a class="btn btn-default" href="/jobs/{i}/apply/">Apply</a></div>
+</div>""",
+}
+
+PAGE_WRAPPERS = {
+    "Djinni": '<main><div class="list-jobs">{listings}</div></main>',
+    "DOU": '<div id="vacancyListId"><ul>{listings}</ul></div>',
+    "LinkedIn": '<section><div class="jobs-search__results-list"><ul>{listings}</ul></div></section>',
+    "Work.ua": '<div id="pjax-job-list">{listings}</div>',
+}
+
+ADAPTERS = {
+    "Djinni": DjinniAdapter(),
+    "DOU": DOUAdapter(),
+    "LinkedIn": LinkedInAdapter(),
+    "Work.ua": WorkUaAdapter(),
+}
+
+
+def results_page(platform: str) -> str:
+    """Build a results page of a platform with the markup of its listings and typical page chrome.
+
+    Recorded pages are not kept in the repository, so pages are assembled from the markup the
+    adapters' selectors target, surrounded by the navigation, filters, styles and scripts that make
+    up most of a real page.
+    """
+    listings = "".join(
+        LISTING_TEMPLATES[platform].format(i=i, description=DESCRIPTION) for i in range(LISTINGS_PER_PAGE)
+    )
+    navigation = "".join(f'<li><a href="/jobs/?category={i}">Category {i}</a></li>' for i in range(150))
+    filters = "".join(
+        f'<label><input type="checkbox" name="f{i}" value="{i}"> Filter option {i}</label>' for i in range(100)
+    )
+    styles = "".join(f".c{i}{{margin:{i}px;padding:{i % 7}px}}" for i in range(400))
+    script = "window.__STATE__ = {" + ",".join(f'"k{i}": "{"x" * 40}"' for i in range(300)) + "};"
+    return (
+        f'<!DOCTYPE html><html lang="uk"><head><meta charset="utf-8"><title>{platform} jobs</title>'
+        f"<style>{styles}</style><script>{script}</script></head><body>"
+        f'<header><nav><ul class="menu">{navigation}</ul></nav></header>'
+        f'<aside class="filters"><form>{filters}</form></aside>'
+        f"{PAGE_WRAPPERS[platform].format(listings=listings)}"
+        f"<footer><ul>{navigation}</ul><p>&copy; {platform}</p></footer></body></html>"
+    )
+
+
+def squeeze(value: str) -> str:
+    """Remove all whitespace, which BeautifulSoup's ``get_text(strip=True)`` drops between elements."""
+    return "".join(value.split())
+
+
+@pytest.mark.parametrize("platform", list(ADAPTERS))
+def test_matches_json_css_extraction(platform: str):
+    """Test that the lxml strategy extracts the same listings as JsonCssExtractionStrategy."""
+    config = ADAPTERS[platform].get_extraction_config()
+    url = ADAPTERS[platform].config.base_url
+    html = results_page(platform)
+
+    native = LxmlExtractionStrategy(config).run(url, [html])
+    reference = JobExtractionStrategy(config).run(url, [html])
+
+    assert len(native) == len(reference) == LISTINGS_PER_PAGE
+    for native_item, reference_item in zip(native, reference):
+        assert native_item.keys() == reference_item.keys()
+        for name, value in reference_item.items():
+            if name in ("url", "apply_url"):
+                assert native_item[name] == urljoin(url, value)
+            else:
+                assert squeeze(native_item[name]) == squeeze(value)
+
+
+def test_text_whitespace_normalized():
+    """Test that text spread over elements and lines keeps single spaces between words."""
+    config = DjinniAdapter().get_extraction_config()
+
+    items = LxmlExtractionStrategy(config).run("https://djinni.co/jobs/", [results_page("Djinni")])
+
+    assert items[0]["title"] == "Senior Python Developer 0"
+    assert items[0]["description"].startswith("We are looking for an engineer to join the platform team building")
+    assert items[0]["url"] == "https://djinni.co/jobs/0-python-developer/"
+
+
+def test_empty_page():
+    """Test that an empty page yields no listings."""
+    assert LxmlExtractionStrategy(DOUAdapter().get_extraction_config()).run("https://jobs.dou.ua/", [""]) == []
+
+
+class TestBenchmark:
+    """Benchmark of CPU time per results page on every platform."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("platform", list(ADAPTERS))
+    def test_faster_than_json_css(self, platform: str):
+        """Test that the lxml strategy takes several times less CPU per page than JsonCssExtractionStrategy."""
+        config = ADAPTERS[platform].get_extraction_config()
+        url = ADAPTERS[platform].config.base_url
+        html = results_page(platform)
+        native, reference = LxmlExtractionStrategy(config), JobExtractionStrategy(config)
+        native.run(url, [html])
+        reference.run(url, [html])
+        rounds = 20
+
+        started = time.process_time()
+        for _ in range(rounds):
+            reference.run(url, [html])
+        reference_ms = (time.process_time() - started) / rounds * 1000
+
+        started = time.process_time()
+        for _ in range(rounds):
+            native.run(url, [html])
+        native_ms = (time.process_time() - started) / rounds * 1000
+
+        assert reference_ms / native_ms >= MIN_SPEEDUP, (
+            f"JsonCssExtractionStrategy {reference_ms:.2f}ms, lxml {native_ms:.2f}ms per page"
+        )
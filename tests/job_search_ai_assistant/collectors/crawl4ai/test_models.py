@@ -1,9 +1,20 @@
 """Tests for job posting data models."""
 
+import pickle
+import tracemalloc
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+
+from src.job_search_ai_assistant.collectors.crawl4ai.models import JobPosting, PostingRecord
+
+# Maximum memory of a PostingRecord as a share of the memory of a JobPosting with the same values
+MAX_RECORD_MEMORY_SHARE = 0.5
 
-from src.job_search_ai_assistant.collectors.crawl4ai.models import JobPosting
+# Postings measured in the memory benchmark
+BENCHMARK_POSTINGS = 2000
+
+EXAMPLE = JobPosting.model_config["json_schema_extra"]["example"]
 
 
 class TestJobPosting:
@@ -57,6 +68,38 @@ class TestJobPosting:
         assert job.apply_url is None
         assert job.platform is None
 
+    def test_salary_parsed_on_validation(self):
+        """Test that the salary text is parsed into numeric bounds once, on validation."""
+        job = JobPosting(
+            title="Developer",
+            company="Company",
+            location="Kyiv",
+            salary="від 60 000 грн",
+            description="Job description",
+            requirements=["Requirement 1"],
+            url="https://example.com/job",
+        )
+
+        assert (job.salary_min, job.salary_max, job.salary_currency) == (60000, None, "UAH")
+        assert job.salary_period == "month"
+        assert job.parsed_salary is not None and job.parsed_salary.monthly() == (60000, None)
+
+    def test_explicit_salary_bounds_kept(self):
+        """Test that bounds given with the posting are not overwritten by parsing."""
+        job = JobPosting(
+            title="Developer",
+            company="Company",
+            location="Kyiv",
+            salary="$5000-7000",
+            salary_min=4000,
+            salary_period="month",
+            description="Job description",
+            requirements=["Requirement 1"],
+            url="https://example.com/job",
+        )
+
+        assert (job.salary_min, job.salary_max) == (4000, None)
+
     def test_whitespace_stripping(self):
         """Test that whitespace is stripped from string fields."""
         job_data = {
@@ -161,6 +204,39 @@ class TestJobPosting:
         assert len(job.requirements) == 2
         assert job.requirements == ["Valid requirement", "Another requirement"]
 
+    def test_requirements_text(self):
+        """Test that requirements extracted as one text become the only requirement."""
+        job = JobPosting(
+            title="Developer",
+            company="Company",
+            location="Remote",
+            description="Description",
+            requirements="  Python, Django, 3+ years ",
+            url="https://example.com/job",
+        )
+
+        assert job.requirements == ["Python, Django, 3+ years"]
+
+    def test_platform_from_context(self):
+        """Test that a platform in the validation context is set on the posting."""
+        job_data = {
+            "title": "Developer",
+            "company": "Company",
+            "location": "Remote",
+            "salary": "$4000",
+            "description": "Description",
+            "requirements": ["Requirement"],
+            "url": "https://example.com/job",
+            "platform": "Other",
+        }
+
+        job = JobPosting.model_validate(job_data, context={"platform": "DOU"})
+
+        assert job.platform == "DOU"
+        assert job_data["platform"] == "Other"
+        assert job.salary_min == 4000
+        assert {"platform", "salary_min"} <= job.model_fields_set
+
     def test_valid_url_schemes(self):
         """Test that http and https URLs are accepted."""
         # Test with https
@@ -324,3 +400,69 @@ class TestJobPosting:
         assert isinstance(job_json, str)
         assert "Developer" in job_json
         assert "Company" in job_json
+
+
+class TestPostingRecord:
+    """Test PostingRecord."""
+
+    def test_matches_job_posting(self):
+        """Test that a record gets the values a JobPosting validated from the same item gets."""
+        item = {**EXAMPLE, "title": "  Senior Python Developer ", "requirements": "Python, FastAPI"}
+
+        record = TypeAdapter(PostingRecord).validate_python(item, context={"platform": "DOU"})
+        job = JobPosting.model_validate(item, context={"platform": "DOU"})
+
+        assert {name: getattr(record, name) for name in JobPosting.model_fields} == job.model_dump()
+        assert record.parsed_salary == job.parsed_salary
+        assert record.folded_title == job.folded_title == "senior python developer"
+
+    def test_invalid_rejected(self):
+        """Test that a record rejects what a JobPosting rejects."""
+        with pytest.raises(ValidationError) as exc_info:
+            PostingRecord(**{**EXAMPLE, "title": "   ", "requirements": [" "], "url": "ftp://example.com/job"})
+
+        assert {error["loc"] for error in exc_info.value.errors()} == {("title",), ("requirements",), ("url",)}
+
+    def test_compact(self):
+        """Test that a record keeps its values in slots and is sent to and from workers as it is."""
+        record = PostingRecord(**EXAMPLE)
+        assert record.folded_description.startswith("we are looking")
+
+        copy = pickle.loads(pickle.dumps(record))  # noqa: S301
+
+        assert not hasattr(record, "__dict__")
+        assert copy == record
+        assert copy.folded_title == "senior python developer"
+
+
+def retained_bytes(validate) -> int:
+    """Return the memory still allocated by the postings a function validates, while they are kept."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        postings = validate()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(postings) == BENCHMARK_POSTINGS
+    return retained
+
+
+class TestBenchmark:
+    """Benchmark of the memory taken by a posting."""
+
+    @pytest.mark.benchmark
+    def test_record_memory(self):
+        """Test that a record takes at most half the memory of a JobPosting with the same values."""
+        items = [
+            {**EXAMPLE, "title": f"Python Developer {i}", "url": f"https://example.com/jobs/{i}"}
+            for i in range(BENCHMARK_POSTINGS)
+        ]
+        jobs, records = TypeAdapter(list[JobPosting]), TypeAdapter(list[PostingRecord])
+
+        job_bytes = retained_bytes(lambda: jobs.validate_python(items)) / BENCHMARK_POSTINGS
+        record_bytes = retained_bytes(lambda: records.validate_python(items)) / BENCHMARK_POSTINGS
+
+        assert record_bytes <= job_bytes * MAX_RECORD_MEMORY_SHARE, (
+            f"Memory per posting: JobPosting {job_bytes:.0f} B, PostingRecord {record_bytes:.0f} B"
+        )
@@ -0,0 +1,366 @@
+"""Tests for result pagination."""
+
+import asyncio
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.job_search_ai_assistant.api.schemas.search import SearchFilters
+from src.job_search_ai_assistant.collectors.crawl4ai.client import JobScraperClient
+from src.job_search_ai_assistant.collectors.crawl4ai.exceptions import RateLimitError
+from src.job_search_ai_assistant.collectors.crawl4ai.pagination import (
+    PaginationConfig,
+    iter_numbered_pages,
+    iter_session_pages,
+    next_page_js,
+    page_url,
+)
+from src.job_search_ai_assistant.collectors.platforms import (
+    DjinniAdapter,
+    DOUAdapter,
+    LinkedInAdapter,
+    PaginationStyle,
+    WorkUaAdapter,
+)
+
+
+def make_item(index: int) -> dict:
+    """Create a raw extracted job item."""
+    return {
+        "title": f"Python Developer {index}",
+        "company": "Tech Corp",
+        "location": "Kyiv",
+        "description": "Python developer needed",
+        "requirements": ["Python"],
+        "url": f"https://example.com/job/{index}",
+    }
+
+
+def page_number(url: str) -> int:
+    """Return the page number of a numbered page URL."""
+    return int(parse_qs(urlparse(url).query)["page"][0])
+
+
+async def collect(pages) -> list[list[dict]]:
+    """Collect all pages of an async page iterator."""
+    return [page async for page in pages]
+
+
+class TestPaginationConfig:
+    """Tests for PaginationConfig."""
+
+    @pytest.mark.parametrize(
+        "adapter_class,style",
+        [
+            (DjinniAdapter, PaginationStyle.NUMBERED),
+            (WorkUaAdapter, PaginationStyle.NUMBERED),
+            (DOUAdapter, PaginationStyle.LOAD_MORE),
+            (LinkedInAdapter, PaginationStyle.INFINITE_SCROLL),
+        ],
+    )
+    def test_from_platform(self, adapter_class, style):
+        """Test that every adapter declares its pagination style."""
+        adapter = adapter_class()
+
+        pagination = PaginationConfig.from_platform(adapter.config)
+
+        assert pagination.style == style
+        assert pagination.selector == adapter.config.pagination_selector
+        assert pagination.max_pages == 10
+
+    def test_from_platform_without_style(self):
+        """Test that a platform without a pagination style gets a single page."""
+        config = DjinniAdapter().config.model_copy(update={"pagination_style": None})
+
+        assert PaginationConfig.from_platform(config).max_pages == 1
+
+
+def test_page_url_replaces_page_param():
+    """Test that the page parameter is replaced and other parameters kept."""
+    url = page_url("https://djinni.co/jobs/?primary_keyword=python&page=1", "page", 3)
+
+    query = parse_qs(urlparse(url).query)
+    assert query == {"primary_keyword": ["python"], "page": ["3"]}
+
+
+def test_next_page_js():
+    """Test the JavaScript used to load more results."""
+    load_more = next_page_js(PaginationStyle.LOAD_MORE, "a.more-btn")
+    scroll = next_page_js(PaginationStyle.INFINITE_SCROLL, "button.show-more")
+
+    assert 'document.querySelector("a.more-btn")' in load_more
+    assert "scrollTo" not in load_more
+    assert "scrollTo" in scroll
+    assert 'document.querySelector("button.show-more")' in scroll
+
+
+class TestNumberedPages:
+    """Tests for numbered pagination."""
+
+    @pytest.mark.asyncio
+    async def test_stops_at_first_empty_page(self):
+        """Test that pagination stops once a page yields no new postings."""
+        fetched: list[int] = []
+
+        async def fetch(url):
+            number = page_number(url)
+            fetched.append(number)
+            return [make_item(number * 10 + i) for i in range(2)] if number <= 4 else []
+
+        pages = await collect(iter_numbered_pages(fetch, "https://x.test/?page=1", PaginationConfig(max_pages=10)))
+
+        assert sum(len(page) for page in pages) == 8
+        assert max(fetched) <= 7
+
+    @pytest.mark.asyncio
+    async def test_respects_max_pages(self):
+        """Test that no more than max_pages pages are fetched."""
+        fetched: list[int] = []
+
+        async def fetch(url):
+            fetched.append(page_number(url))
+            return [make_item(page_number(url))]
+
+        await collect(iter_numbered_pages(fetch, "https://x.test/", PaginationConfig(max_pages=5)))
+
+        assert sorted(fetched) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_skips_repeated_postings(self):
+        """Test that a page repeating earlier postings ends the pagination."""
+
+        async def fetch(url):
+            return [make_item(1)]
+
+        pages = await collect(iter_numbered_pages(fetch, "https://x.test/", PaginationConfig(max_pages=5)))
+
+        assert pages == [[make_item(1)]]
+
+    @pytest.mark.asyncio
+    async def test_pages_fetched_in_parallel(self):
+        """Test that pages after the first are fetched concurrently."""
+        running = 0
+        peak = 0
+
+        async def fetch(url):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [make_item(page_number(url))]
+
+        await collect(iter_numbered_pages(fetch, "https://x.test/", PaginationConfig(max_pages=7, concurrency=3)))
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_yields_pages_as_they_arrive(self):
+        """Test that a fast page is yielded before a slow page of the same window."""
+
+        async def fetch(url):
+            number = page_number(url)
+            await asyncio.sleep(0.05 if number == 2 else 0)
+            return [make_item(number)]
+
+        pages = await collect(
+            iter_numbered_pages(fetch, "https://x.test/", PaginationConfig(max_pages=3, concurrency=2))
+        )
+
+        assert [page[0]["url"] for page in pages] == [
+            "https://example.com/job/1",
+            "https://example.com/job/3",
+            "https://example.com/job/2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_first_page_error_propagates(self):
+        """Test that a failure on the first page is raised."""
+
+        async def fetch(url):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await collect(iter_numbered_pages(fetch, "https://x.test/", PaginationConfig(max_pages=3)))
+
+    @pytest.mark.asyncio
+    async def test_later_page_error_ends_pagination(self):
+        """Test that a failure on a later page keeps the results collected so far."""
+
+        async def fetch(url):
+            if page_number(url) == 2:
+                raise RuntimeError("boom")
+            return [make_item(page_number(url))]
+
+        errors = []
+        pages = await collect(
+            iter_numbered_pages(fetch, "https://x.test/", PaginationConfig(max_pages=10, concurrency=1), errors)
+        )
+
+        assert len(pages) == 1
+        assert [str(error) for error in errors] == ["boom"]
+
+    @pytest.mark.asyncio
+    async def test_throttled_page_raised(self):
+        """Test that throttling on a later page is raised once the other fetches of its window are cancelled."""
+        finished = []
+
+        async def fetch(url):
+            try:
+                if page_number(url) == 2:
+                    raise RateLimitError("HTTP 429")
+                if page_number(url) == 3:
+                    await asyncio.sleep(5)
+                return [make_item(page_number(url))]
+            finally:
+                finished.append(page_number(url))
+
+        with pytest.raises(RateLimitError):
+            await collect(iter_numbered_pages(fetch, "https://x.test/", PaginationConfig(max_pages=3)))
+
+        assert sorted(finished) == [1, 2, 3]
+
+
+class TestSessionPages:
+    """Tests for "more" button and infinite scroll pagination."""
+
+    @pytest.mark.asyncio
+    async def test_yields_only_new_postings(self):
+        """Test that each load yields only postings appended since the previous load."""
+        loads: list[tuple] = []
+
+        async def fetch(js_code, js_only):
+            loads.append((js_code, js_only))
+            count = min(len(loads), 3) * 2
+            return [make_item(i) for i in range(count)]
+
+        pagination = PaginationConfig(style=PaginationStyle.LOAD_MORE, selector="a.more-btn", max_pages=10)
+        pages = await collect(iter_session_pages(fetch, pagination))
+
+        assert [len(page) for page in pages] == [2, 2, 2]
+        assert loads[0] == (None, False)
+        assert all(js_only for _, js_only in loads[1:])
+        assert "a.more-btn" in loads[1][0]
+        assert len(loads) == 4
+
+    @pytest.mark.asyncio
+    async def test_respects_max_pages(self):
+        """Test that no more than max_pages loads are performed."""
+        loads = 0
+
+        async def fetch(js_code, js_only):
+            nonlocal loads
+            loads += 1
+            return [make_item(i) for i in range(loads)]
+
+        pagination = PaginationConfig(style=PaginationStyle.INFINITE_SCROLL, max_pages=3)
+        await collect(iter_session_pages(fetch, pagination))
+
+        assert loads == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_load_recorded(self):
+        """Test that a failed load ends the session with the results so far and is recorded."""
+
+        async def fetch(js_code, js_only):
+            if js_only:
+                raise RuntimeError("button gone")
+            return [make_item(0)]
+
+        errors = []
+        pagination = PaginationConfig(style=PaginationStyle.LOAD_MORE, selector="a.more-btn", max_pages=3)
+        pages = await collect(iter_session_pages(fetch, pagination, errors))
+
+        assert pages == [[make_item(0)]]
+        assert [str(error) for error in errors] == ["button gone"]
+
+
+class TestClientPagination:
+    """Tests for paginated scraping through JobScraperClient."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_numbered_pages(self, mocker: MockerFixture):
+        """Test that numbered pages are scraped and merged."""
+
+        class MockCrawler:
+            def __init__(self):
+                self.urls = []
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+            async def arun(self, url, config):
+                self.urls.append(url)
+                number = page_number(url)
+
+                async def gen():
+                    yield {"success": True, "content": [make_item(number)] if number <= 3 else []}
+
+                return gen()
+
+        crawler = MockCrawler()
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=crawler)
+
+        client = JobScraperClient()
+        jobs = await client.scrape_jobs(
+            url="https://djinni.co/jobs/?primary_keyword=python&page=1",
+            platform="Djinni",
+            criteria=SearchFilters(),
+            pagination=PaginationConfig(max_pages=10, concurrency=2),
+        )
+
+        assert sorted(job.title for job in jobs) == [f"Python Developer {i}" for i in (1, 2, 3)]
+        assert len(crawler.urls) <= 6
+
+    @pytest.mark.asyncio
+    async def test_scrape_load_more_session(self, mocker: MockerFixture):
+        """Test that load-more pagination reuses one browser session."""
+
+        class MockStrategy:
+            def __init__(self):
+                self.killed = []
+
+            async def kill_session(self, session_id):
+                self.killed.append(session_id)
+
+        class MockCrawler:
+            def __init__(self):
+                self.configs = []
+                self.crawler_strategy = MockStrategy()
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+            async def arun(self, url, config):
+                self.configs.append(config)
+                count = min(len(self.configs), 2)
+
+                async def gen():
+                    yield {"success": True, "content": [make_item(i) for i in range(count)]}
+
+                return gen()
+
+        crawler = MockCrawler()
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=crawler)
+
+        client = JobScraperClient()
+        jobs = await client.scrape_jobs(
+            url="https://jobs.dou.ua/vacancies/?search=python",
+            platform="DOU",
+            criteria=SearchFilters(),
+            pagination=PaginationConfig(style=PaginationStyle.LOAD_MORE, selector="a.more-btn", max_pages=5),
+        )
+
+        assert len(jobs) == 2
+        session_ids = {config.session_id for config in crawler.configs}
+        assert len(session_ids) == 1
+        assert crawler.configs[0].js_only is False
+        assert crawler.configs[1].js_only is True
+        assert crawler.crawler_strategy.killed == list(session_ids)
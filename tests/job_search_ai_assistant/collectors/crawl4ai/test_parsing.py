@@ -0,0 +1,298 @@
+"""Tests for parsing result pages in worker processes."""
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.job_search_ai_assistant.api.schemas.search import SearchFilters
+from src.job_search_ai_assistant.collectors.crawl4ai.client import JobScraperClient
+from src.job_search_ai_assistant.collectors.crawl4ai.exceptions import ScrapingError
+from src.job_search_ai_assistant.collectors.crawl4ai.models import JobPosting
+from src.job_search_ai_assistant.collectors.crawl4ai.parsing import (
+    ParserPool,
+    filter_postings,
+    select_postings,
+    validate_postings,
+)
+from src.job_search_ai_assistant.collectors.crawl4ai.static import ListingExtractor
+from src.job_search_ai_assistant.collectors.crawl4ai.telemetry import INVALID_POSTINGS
+from src.job_search_ai_assistant.collectors.platforms import DjinniAdapter, DOUAdapter, LinkedInAdapter, WorkUaAdapter
+
+ADAPTERS = (DjinniAdapter(), DOUAdapter(), LinkedInAdapter(), WorkUaAdapter())
+
+DOU_URL = "https://jobs.dou.ua/vacancies/"
+
+# Listings per results page, as served by the platforms
+LISTINGS_PER_PAGE = 20
+
+# Maximum event loop lag with pages parsed in workers, as a share of the lag with pages parsed on the loop
+MAX_LAG_SHARE = 0.5
+
+CONFIG = DOUAdapter().get_extraction_config()
+
+# Minimum speedup of validating a page at once over validating a copy of every item
+MIN_BULK_SPEEDUP = 1.3
+
+# Extracted records in the validation benchmark
+BENCHMARK_RECORDS = 5000
+
+# Salary texts of the benchmark records; platforms show a few rounded ranges over and over
+SALARIES = ("$4000-5500", "$3000-4500", "до $5000", "від 60 000 грн", "$80-120k", "€4,500/month", None)
+
+LISTING = """
+<li class="l-vacancy">
+  <div class="title"><a class="vt" href="/companies/tech-{i}/vacancies/{i}/">{title} {i}</a>
+    <strong><a class="company" href="/companies/tech-{i}/">Tech Corp {i}</a></strong>
+    <span class="salary">$4000-5500</span> <span class="cities">Kyiv, remote</span></div>
+  <div class="sh-info"><div class="text">We build the services behind our marketplace.
+    You will design APIs, own features from idea to production and mentor colleagues.</div></div>
+  <div class="requirements">Python, Django, Celery, 3+ years</div>
+</li>"""
+
+
+def results_page(title: str = "Python Developer") -> str:
+    """Build a DOU results page with its listings surrounded by page chrome."""
+    listings = "".join(LISTING.format(i=i, title=title) for i in range(LISTINGS_PER_PAGE))
+    navigation = "".join(f'<li><a href="/vacancies/?category={i}">Category {i}</a></li>' for i in range(300))
+    script = "window.__STATE__ = {" + ",".join(f'"k{i}": "{"x" * 40}"' for i in range(300)) + "};"
+    return (
+        f"<html><head><script>{script}</script></head><body><nav><ul>{navigation}</ul></nav>"
+        f'<div id="vacancyListId"><ul>{listings}</ul></div><footer><ul>{navigation}</ul></footer></body></html>'
+    )
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Two warm workers shared by the tests of this module."""
+    pool = ParserPool(workers=2)
+    asyncio.run(pool.start())
+    yield pool
+    asyncio.run(pool.close())
+
+
+def record(i: int) -> dict:
+    """Build an extracted record as the lxml strategy returns it."""
+    return {
+        "title": f"Python Developer {i}",
+        "company": f"Tech Corp {i % 50}",
+        "location": "Kyiv, remote",
+        "salary": SALARIES[i % len(SALARIES)],
+        "description": "We build the services behind our marketplace. You will design APIs and mentor colleagues.",
+        "requirements": "Python, Django, Celery, 3+ years",
+        "url": f"https://jobs.dou.ua/companies/tech-{i % 50}/vacancies/{i}/",
+        "apply_url": f"https://jobs.dou.ua/companies/tech-{i % 50}/vacancies/{i}/apply/",
+    }
+
+
+class TestValidatePostings:
+    """Tests for validate_postings."""
+
+    def test_platform_set_without_changing_items(self):
+        """Test that every posting gets the platform and the extracted items are left as they are."""
+        items = [record(0), record(1)]
+
+        jobs, invalid = validate_postings(items, "DOU")
+
+        assert invalid == []
+        assert [job.platform for job in jobs] == ["DOU", "DOU"]
+        assert [job.requirements for job in jobs] == [["Python, Django, Celery, 3+ years"]] * 2
+        assert items == [record(0), record(1)]
+
+    def test_invalid_items_left_out(self):
+        """Test that items failing validation are reported and the others are still validated."""
+        items = [record(0), {**record(1), "title": "  "}, record(2), {**record(3), "url": "ftp://example.com/3"}]
+
+        jobs, invalid = validate_postings(items, "DOU")
+
+        assert [job.title for job in jobs] == ["Python Developer 0", "Python Developer 2"]
+        assert [(posting.index, posting.item) for posting in invalid] == [(1, items[1]), (3, items[3])]
+        assert [error["loc"] for error in invalid[0].errors] == [("title",)]
+        assert [error["loc"] for error in invalid[1].errors] == [("url",)]
+
+    def test_matches_one_by_one(self):
+        """Test that validating a page at once gives the postings of validating every item alone."""
+        items = [record(i) for i in range(2 * len(SALARIES))]
+
+        jobs, _ = validate_postings(items, "DOU")
+
+        assert [{name: getattr(job, name) for name in JobPosting.model_fields} for job in jobs] == [
+            JobPosting.model_validate({**item, "platform": "DOU"}).model_dump() for item in items
+        ]
+
+    def test_invalid_counted(self):
+        """Test that items failing validation are counted and left out of the results."""
+        items = [record(0), {**record(1), "company": ""}]
+
+        jobs = select_postings(items, "Invalid", SearchFilters())
+
+        assert len(jobs) == 1
+        assert INVALID_POSTINGS.value("Invalid") == 1
+
+
+class TestParserPool:
+    """Tests for ParserPool."""
+
+    def test_workers_started_warm(self, pool: ParserPool):
+        """Test that every worker process is started by ``start``."""
+        assert pool.started
+        assert len(pool._executor._processes) == 2
+
+    @pytest.mark.asyncio
+    async def test_extract_matches_event_loop(self, pool: ParserPool):
+        """Test that workers extract the same listings as the event loop for every platform."""
+        html = results_page()
+        for adapter in ADAPTERS:
+            config = adapter.get_extraction_config()
+
+            items = await pool.extract(html, config, base_url=DOU_URL)
+
+            assert items == ListingExtractor(config).extract(html, base_url=DOU_URL)
+        assert len(await pool.extract(html, CONFIG, DOU_URL)) == LISTINGS_PER_PAGE
+
+    @pytest.mark.asyncio
+    async def test_select_matches_event_loop(self, pool: ParserPool):
+        """Test that workers return the postings validated and filtered on the event loop."""
+        extractor = ListingExtractor(CONFIG)
+        items = extractor.extract(results_page(), DOU_URL) + extractor.extract(results_page("Java Developer"), DOU_URL)
+        criteria = SearchFilters(keywords=["Python"])
+
+        jobs = await pool.select(items, "DOU", criteria)
+
+        assert len(jobs) == LISTINGS_PER_PAGE
+        assert jobs == filter_postings(validate_postings(items, "DOU")[0], criteria)
+        assert jobs[0].platform == "DOU"
+        assert jobs[0].url.host == "jobs.dou.ua"
+        assert jobs[0].parsed_salary.min_amount == 4000
+
+    @pytest.mark.asyncio
+    async def test_worker_failure(self):
+        """Test that a dead worker fails the page and the workers are started again for the next one."""
+        pool = ParserPool(workers=1)
+        try:
+            with pytest.raises(ScrapingError):
+                await pool._run(os._exit, 1)
+
+            assert not pool.started
+            assert len(await pool.extract(results_page(), CONFIG)) == LISTINGS_PER_PAGE
+        finally:
+            await pool.close()
+
+
+class TestClient:
+    """Tests for JobScraperClient with a parser pool."""
+
+    @pytest.mark.asyncio
+    async def test_rendered_pages_parsed_in_workers(self, mocker: MockerFixture, pool: ParserPool):
+        """Test that the crawler only renders pages and the workers extract, validate and filter them."""
+        configs = []
+
+        class MockCrawler:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+            async def arun(self, url, config):
+                configs.append(config)
+
+                async def gen():
+                    yield {"success": True, "html": results_page()}
+
+                return gen()
+
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=MockCrawler())
+        client = JobScraperClient(parser_pool=pool)
+
+        jobs = await client.scrape_jobs(
+            url=DOU_URL, platform="DOU", criteria=SearchFilters(keywords=["Python"]), extraction_config=CONFIG
+        )
+
+        assert configs[0].extraction_strategy is None
+        assert len(jobs) == LISTINGS_PER_PAGE
+        assert jobs[0].title == "Python Developer 0"
+        assert str(jobs[0].url) == "https://jobs.dou.ua/companies/tech-0/vacancies/0/"
+
+
+async def max_lag(work: Awaitable[Any]) -> float:
+    """Return the longest delay of a 1 ms timer on the event loop while the work runs."""
+    lags = []
+    done = False
+
+    async def probe() -> None:
+        while not done:
+            due = time.perf_counter() + 0.001
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - due)
+
+    task = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+    await work
+    done = True
+    await task
+    return max(lags)
+
+
+class TestBenchmark:
+    """Benchmarks of validation and of event loop lag while several platforms are parsed at once."""
+
+    @pytest.mark.benchmark
+    def test_bulk_validation_faster(self):
+        """Test that validating extracted records a page at a time beats validating a copy of every record."""
+        items = [record(i) for i in range(BENCHMARK_RECORDS)]
+        pages = [items[start : start + LISTINGS_PER_PAGE] for start in range(0, len(items), LISTINGS_PER_PAGE)]
+        rounds = 3
+
+        def one_by_one() -> None:
+            for page in pages:
+                [JobPosting.model_validate({**item, "platform": "DOU"}) for item in page]
+
+        def bulk() -> None:
+            for page in pages:
+                validate_postings(page, "DOU")
+
+        one_by_one()
+        bulk()
+        started = time.perf_counter()
+        for _ in range(rounds):
+            one_by_one()
+        one_by_one_ms = (time.perf_counter() - started) / rounds * 1000
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            bulk()
+        bulk_ms = (time.perf_counter() - started) / rounds * 1000
+
+        assert one_by_one_ms / bulk_ms >= MIN_BULK_SPEEDUP, f"One by one {one_by_one_ms:.1f}ms, bulk {bulk_ms:.1f}ms"
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_lag_flat(self, pool: ParserPool):
+        """Test that parsing in workers keeps the event loop lag well below parsing on the loop."""
+        html = results_page()
+        criteria = SearchFilters(keywords=["Python"])
+        extractor = ListingExtractor(CONFIG)
+        pages_per_platform = 10
+
+        async def parse_on_loop(platform: str) -> None:
+            for _ in range(pages_per_platform):
+                select_postings(extractor.extract(html, DOU_URL), platform, criteria)
+                await asyncio.sleep(0)
+
+        async def parse_in_workers(platform: str) -> None:
+            for _ in range(pages_per_platform):
+                await pool.select(await pool.extract(html, CONFIG, DOU_URL), platform, criteria)
+
+        platforms = [adapter.config.name for adapter in ADAPTERS]
+        await parse_in_workers("warm-up")
+        loop_lag = await max_lag(asyncio.gather(*(parse_on_loop(platform) for platform in platforms)))
+        pool_lag = await max_lag(asyncio.gather(*(parse_in_workers(platform) for platform in platforms)))
+
+        assert pool_lag <= loop_lag * MAX_LAG_SHARE, (
+            f"Max event loop lag {loop_lag * 1000:.2f}ms on the loop, {pool_lag * 1000:.2f}ms in workers"
+        )
@@ -0,0 +1,256 @@
+"""Tests for the browser pool."""
+
+import asyncio
+import subprocess
+import sys
+from contextlib import AsyncExitStack
+from types import SimpleNamespace
+
+import psutil
+import pytest
+
+from src.job_search_ai_assistant.collectors.crawl4ai.exceptions import PoolExhaustedError
+from src.job_search_ai_assistant.collectors.crawl4ai.pool import (
+    BrowserPool,
+    BrowserPoolConfig,
+    PooledCrawler,
+    driver_pid,
+)
+
+
+class FakeCrawler:
+    """Minimal stand-in for AsyncWebCrawler that records its lifecycle."""
+
+    def __init__(self):
+        self.ready = False
+        self.closed = False
+
+    async def __aenter__(self):
+        self.ready = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.closed = True
+
+
+@pytest.fixture
+def created() -> list[FakeCrawler]:
+    """List collecting every crawler created by the pool factory."""
+    return []
+
+
+@pytest.fixture
+def factory(created):
+    """Factory creating FakeCrawler instances."""
+
+    def _factory():
+        crawler = FakeCrawler()
+        created.append(crawler)
+        return crawler
+
+    return _factory
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool."""
+
+    @pytest.mark.asyncio
+    async def test_start_warms_all_browsers(self, factory, created):
+        """Test that start launches the configured number of browsers."""
+        pool = BrowserPool(factory, BrowserPoolConfig(size=3))
+
+        await pool.start()
+
+        assert len(created) == 3
+        assert all(crawler.ready for crawler in created)
+        assert pool.idle == 3
+        assert pool.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_reuses_browsers(self, factory, created):
+        """Test that browsers are returned to the pool and reused."""
+        pool = BrowserPool(factory, BrowserPoolConfig(size=1))
+
+        async with pool.acquire() as first:
+            assert pool.in_use == 1
+        async with pool.acquire() as second:
+            pass
+
+        assert first is second
+        assert len(created) == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_starts_pool_lazily(self, factory):
+        """Test that acquiring from a pool that was not started starts it."""
+        pool = BrowserPool(factory, BrowserPoolConfig(size=1))
+
+        async with pool.acquire():
+            assert pool.started
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_acquires(self, created):
+        """Test that acquires racing the start of the pool launch no more than `size` browsers."""
+
+        class SlowCrawler(FakeCrawler):
+            async def __aenter__(self):
+                await asyncio.sleep(0.01)
+                return await super().__aenter__()
+
+        def slow_factory():
+            crawler = SlowCrawler()
+            created.append(crawler)
+            return crawler
+
+        pool = BrowserPool(slow_factory, BrowserPoolConfig(size=2))
+
+        async def use_browser():
+            async with pool.acquire():
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(use_browser() for _ in range(4)))
+
+        assert len(created) <= 2
+        assert pool.idle == len(created)
+
+    @pytest.mark.asyncio
+    async def test_recycle_after_max_pages(self, factory, created):
+        """Test that a browser is replaced after serving max_pages_per_browser pages."""
+        pool = BrowserPool(factory, BrowserPoolConfig(size=1, max_pages_per_browser=2))
+
+        for _ in range(3):
+            async with pool.acquire():
+                pass
+
+        assert len(created) == 2
+        assert created[0].closed is True
+        assert created[1].closed is False
+
+    @pytest.mark.asyncio
+    async def test_recycle_on_rss_threshold(self, factory, created, mocker):
+        """Test that a browser is replaced when memory exceeds the RSS threshold."""
+        mocker.patch(
+            "src.job_search_ai_assistant.collectors.crawl4ai.pool.PooledCrawler.rss_mb",
+            return_value=4096.0,
+        )
+        pool = BrowserPool(factory, BrowserPoolConfig(size=1, max_rss_mb=1024))
+
+        async with pool.acquire():
+            pass
+
+        assert created[0].closed is True
+        assert pool.idle == 0
+
+    @pytest.mark.asyncio
+    async def test_rss_of_unknown_processes_ignored(self, factory, created, caplog):
+        """Test that a browser whose processes cannot be found is not recycled for memory, with one warning."""
+        pool = BrowserPool(factory, BrowserPoolConfig(size=1, max_rss_mb=1))
+
+        for _ in range(2):
+            async with pool.acquire():
+                pass
+
+        assert created[0].closed is False
+        assert pool.idle == 1
+        assert pool.unmeasured == 1
+        assert caplog.text.count("Browser processes not found") == 1
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_browser_is_replaced(self, factory, created):
+        """Test that a dead idle browser is discarded on checkout."""
+        pool = BrowserPool(factory, BrowserPoolConfig(size=1))
+        await pool.start()
+        created[0].ready = False
+
+        async with pool.acquire() as crawler:
+            assert crawler is created[1]
+
+        assert created[0].closed is True
+
+    @pytest.mark.asyncio
+    async def test_browser_returned_after_error(self, factory, created):
+        """Test that an exception inside the context still returns the browser."""
+        pool = BrowserPool(factory, BrowserPoolConfig(size=1))
+
+        with pytest.raises(ValueError):
+            async with pool.acquire():
+                raise ValueError("boom")
+
+        assert pool.idle == 1
+        assert pool.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout(self, factory):
+        """Test that waiting for a busy pool raises PoolExhaustedError after the timeout."""
+        pool = BrowserPool(factory, BrowserPoolConfig(size=1, acquire_timeout=0.01))
+
+        async with pool.acquire():
+            with pytest.raises(PoolExhaustedError) as exc_info:
+                async with pool.acquire():
+                    pass
+
+        assert exc_info.value.error_type == "POOL_EXHAUSTED"
+        assert exc_info.value.details["pool_size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pool_size_caps_concurrency(self, factory, created):
+        """Test that no more than `size` browsers are checked out at once."""
+        pool = BrowserPool(factory, BrowserPoolConfig(size=2))
+        peak = 0
+
+        async def use_browser():
+            nonlocal peak
+            async with pool.acquire():
+                peak = max(peak, pool.in_use)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(use_browser() for _ in range(6)))
+
+        assert peak == 2
+        assert len(created) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_browsers(self, factory, created):
+        """Test that close shuts down every browser."""
+        pool = BrowserPool(factory, BrowserPoolConfig(size=2))
+        await pool.start()
+
+        await pool.close()
+
+        assert all(crawler.closed for crawler in created)
+        assert not pool.started
+        assert pool.idle == 0
+
+
+@pytest.mark.asyncio
+async def test_driver_pid_of_installed_playwright():
+    """Test that the driver process of the installed Playwright is found, as memory recycling needs it."""
+    from playwright.async_api import async_playwright
+
+    playwright = await async_playwright().start()
+    try:
+        pid = driver_pid(playwright)
+
+        assert pid is not None
+        assert pid in {child.pid for child in psutil.Process().children()}
+    finally:
+        await playwright.stop()
+
+
+def test_rss_measured_per_browser():
+    """Test that a crawler's RSS is that of its own Playwright driver process and nothing else."""
+    driver = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])  # noqa: S603
+    try:
+        transport = SimpleNamespace(_proc=SimpleNamespace(pid=driver.pid))
+        playwright = SimpleNamespace(_impl_obj=SimpleNamespace(_connection=SimpleNamespace(_transport=transport)))
+        crawler = SimpleNamespace(
+            crawler_strategy=SimpleNamespace(browser_manager=SimpleNamespace(playwright=playwright))
+        )
+        pooled = PooledCrawler(crawler, AsyncExitStack())
+
+        assert pooled.pid == driver.pid
+        assert 0 < pooled.rss_mb() < 1024
+    finally:
+        driver.kill()
+        driver.wait()
+
+    assert pooled.rss_mb() is None
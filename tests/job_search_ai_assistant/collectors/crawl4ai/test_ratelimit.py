@@ -0,0 +1,292 @@
+"""Tests for adaptive rate limiting."""
+
+import asyncio
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from src.job_search_ai_assistant.api.schemas.search import SearchFilters
+from src.job_search_ai_assistant.collectors.crawl4ai.client import JobScraperClient
+from src.job_search_ai_assistant.collectors.crawl4ai.exceptions import RateLimitError
+from src.job_search_ai_assistant.collectors.crawl4ai.ratelimit import (
+    RateLimiter,
+    RateLimitPolicy,
+    TokenBucket,
+    check_blocked,
+    parse_retry_after,
+)
+from src.job_search_ai_assistant.collectors.crawl4ai.static import StaticFetcher
+from src.job_search_ai_assistant.collectors.platforms import DjinniAdapter, LinkedInAdapter
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def policy() -> RateLimitPolicy:
+    """Two requests per second with a burst of two."""
+    return RateLimitPolicy(rate=2.0, burst=2, recovery_after=3)
+
+
+class TestRateLimitPolicy:
+    """Tests for RateLimitPolicy."""
+
+    def test_from_platform(self):
+        """Test per-platform rates."""
+        linkedin = RateLimitPolicy.from_platform(LinkedInAdapter().config)
+        djinni = RateLimitPolicy.from_platform(DjinniAdapter().config)
+
+        assert linkedin is not None and djinni is not None
+        assert linkedin.rate < djinni.rate
+        assert linkedin.max_wait is None
+
+    def test_from_platform_without_rate(self):
+        """Test that a platform without a rate is not limited."""
+        config = DjinniAdapter().config.model_copy(update={"rate_limit": None})
+
+        assert RateLimitPolicy.from_platform(config) is None
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("120", 120.0), (None, None), ("soon", None), ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0)],
+)
+def test_parse_retry_after(value, expected):
+    """Test parsing of Retry-After values."""
+    assert parse_retry_after(value) == expected
+
+
+class TestCheckBlocked:
+    """Tests for check_blocked."""
+
+    def test_too_many_requests(self):
+        """Test that a 429 raises with the requested delay."""
+        with pytest.raises(RateLimitError) as exc_info:
+            check_blocked("https://www.linkedin.com/jobs", 429, "", {"Retry-After": "30"})
+
+        assert exc_info.value.details["status_code"] == 429
+        assert exc_info.value.details["retry_after"] == 30.0
+
+    def test_captcha_page(self):
+        """Test that a challenge page served with 200 raises."""
+        html = "<html><head><title>Just a moment...</title></head></html>"
+
+        with pytest.raises(RateLimitError) as exc_info:
+            check_blocked("https://djinni.co/jobs/", 200, html)
+
+        assert exc_info.value.details["reason"] == "captcha page"
+
+    def test_regular_page(self):
+        """Test that a normal page passes."""
+        check_blocked("https://djinni.co/jobs/", 200, "<html><head><title>Python jobs</title></head></html>")
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_queue(self, clock, policy):
+        """Test that requests beyond the burst are scheduled one interval apart."""
+        bucket = TokenBucket(policy, clock)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits == [0.0, 0.0, 0.5, 1.0]
+
+    def test_refill(self, clock, policy):
+        """Test that tokens refill over time up to the burst."""
+        bucket = TokenBucket(policy, clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now = 10
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    def test_bounded_wait(self, clock, policy):
+        """Test that a request refuses to queue longer than max_wait."""
+        bucket = TokenBucket(policy, clock)
+        for _ in range(3):
+            bucket.reserve()
+
+        with pytest.raises(RateLimitError) as exc_info:
+            bucket.reserve(max_wait=0.5)
+
+        assert exc_info.value.details["retry_after"] == 1.0
+        # The refused request did not take a token
+        assert bucket.reserve() == 1.0
+
+    def test_refund(self, clock, policy):
+        """Test that a refunded reservation frees its slot, up to the burst."""
+        bucket = TokenBucket(policy, clock)
+        for _ in range(3):
+            bucket.reserve()
+
+        bucket.refund()
+        assert bucket.reserve() == 0.5
+
+        clock.now = 10
+        bucket.refund()
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    def test_penalize_and_recover(self, clock, policy):
+        """Test that the rate halves on push back and recovers after sustained success."""
+        bucket = TokenBucket(policy, clock)
+
+        bucket.penalize()
+        assert bucket.rate == 1.0
+        for _ in range(3):
+            bucket.record_success()
+        assert bucket.rate == 1.2
+        for _ in range(30):
+            bucket.record_success()
+        assert bucket.rate == policy.rate
+
+    def test_penalize_respects_retry_after(self, clock, policy):
+        """Test that the next request waits for the delay the site asked for."""
+        bucket = TokenBucket(policy, clock)
+
+        bucket.penalize(retry_after=5)
+
+        assert bucket.reserve() == pytest.approx(5.0)
+
+    def test_rate_floor(self, clock):
+        """Test that backing off never goes below the minimum rate."""
+        bucket = TokenBucket(RateLimitPolicy(rate=1.0, min_rate=0.4), clock)
+
+        bucket.penalize()
+        bucket.penalize()
+
+        assert bucket.rate == 0.4
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_buckets_per_host(self, policy):
+        """Test that hosts are limited independently."""
+        limiter = RateLimiter()
+
+        assert limiter.bucket("https://djinni.co/jobs/", policy) is limiter.bucket("https://DJINNI.co/?page=2", policy)
+        assert limiter.bucket("https://djinni.co/", policy) is not limiter.bucket("https://jobs.dou.ua/", policy)
+
+    @pytest.mark.asyncio
+    async def test_requests_queue(self):
+        """Test that requests over the rate are delayed rather than rejected."""
+        limiter = RateLimiter()
+        policy = RateLimitPolicy(rate=20.0, burst=1)
+        loop = asyncio.get_running_loop()
+        sent: list[float] = []
+
+        async def request():
+            sent.append(loop.time())
+
+        await asyncio.gather(*(limiter.run("https://djinni.co/", policy, request) for _ in range(4)))
+
+        assert sent[-1] - sent[0] >= 0.14
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_returns_token(self, clock):
+        """Test that a request cancelled while queued gives its slot to the next one."""
+        limiter = RateLimiter(clock)
+        policy = RateLimitPolicy(rate=2.0, burst=1)
+        sent = []
+
+        async def request():
+            sent.append(clock.now)
+
+        await limiter.run("https://djinni.co/", policy, request)
+        task = asyncio.create_task(limiter.run("https://djinni.co/", policy, request))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert sent == [0.0]
+        assert limiter.bucket("https://djinni.co/", policy).reserve() == 0.5
+
+    @pytest.mark.asyncio
+    async def test_blocked_response_slows_host(self, policy):
+        """Test that a throttled request lowers the host's rate."""
+        limiter = RateLimiter()
+
+        async def request():
+            check_blocked("https://djinni.co/jobs/", 429)
+
+        with pytest.raises(RateLimitError):
+            await limiter.run("https://djinni.co/jobs/", policy, request)
+
+        assert limiter.rates() == {"djinni.co": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_no_policy_not_limited(self):
+        """Test that requests without a policy bypass the limiter."""
+        limiter = RateLimiter()
+
+        async def request():
+            return 42
+
+        assert await limiter.run("https://djinni.co/", None, request) == 42
+        assert limiter.rates() == {}
+
+
+@pytest.mark.asyncio
+async def test_static_fetcher_too_many_requests():
+    """Test that the static fetcher reports throttling as RateLimitError."""
+    fetcher = StaticFetcher(
+        transport=httpx.MockTransport(lambda request: httpx.Response(429, headers={"Retry-After": "10"}))
+    )
+
+    with pytest.raises(RateLimitError) as exc_info:
+        await fetcher.fetch("https://djinni.co/jobs/")
+
+    assert exc_info.value.details["retry_after"] == 10.0
+
+
+@pytest.mark.asyncio
+async def test_client_backs_off_on_captcha(mocker: MockerFixture):
+    """Test that a captcha page fails the scrape and slows the host down."""
+
+    class MockCrawler:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            return None
+
+        async def arun(self, url, config):
+            async def gen():
+                yield {
+                    "success": True,
+                    "status_code": 200,
+                    "html": "<html><head><title>Security Verification</title></head></html>",
+                    "content": [],
+                }
+
+            return gen()
+
+    mocker.patch("crawl4ai.AsyncWebCrawler", return_value=MockCrawler())
+    client = JobScraperClient()
+
+    with pytest.raises(RateLimitError):
+        await client.scrape_jobs(
+            url="https://www.linkedin.com/jobs/search?keywords=python",
+            platform="LinkedIn",
+            criteria=SearchFilters(),
+            rate_limit=RateLimitPolicy(rate=0.5, burst=2),
+        )
+
+    assert client.rate_limiter.rates() == {"www.linkedin.com": 0.25}
@@ -0,0 +1,249 @@
+"""Tests for the browser-free static HTML path."""
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from src.job_search_ai_assistant.api.schemas.search import SearchFilters
+from src.job_search_ai_assistant.collectors.crawl4ai.client import JobScraperClient
+from src.job_search_ai_assistant.collectors.crawl4ai.exceptions import NetworkError, RateLimitError
+from src.job_search_ai_assistant.collectors.crawl4ai.static import StaticFetcher, extract_items
+from src.job_search_ai_assistant.collectors.crawl4ai.telemetry import CRAWL_STAGE_SECONDS
+from src.job_search_ai_assistant.collectors.platforms import DjinniAdapter
+
+DJINNI_HTML = """
+<html><body>
+<div class="list-jobs">
+  <div class="list-jobs__item">
+    <div class="job-list-item__title"><a href="/jobs/101-python-developer/">Python   Developer</a></div>
+    <a class="mr-2">Tech Corp</a>
+    <span class="location-text">Kyiv</span>
+    <span class="public-salary-item">$5000-7000</span>
+    <div class="job-post__description-text">Build APIs with FastAPI</div>
+    <ul class="job-additional-info--item-text"><li>Python</li></ul>
+  </div>
+  <div class="list-jobs__item">
+    <div class="job-list-item__title"><a href="https://djinni.co/jobs/102-django/">Django Developer</a></div>
+    <a class="mr-2">Other Corp</a>
+    <span class="location-text">Lviv</span>
+    <div class="job-post__description-text">Django services</div>
+    <ul class="job-additional-info--item-text"><li>Django</li></ul>
+  </div>
+</div>
+</body></html>
+"""
+
+
+def mock_fetcher(handler) -> StaticFetcher:
+    """Create a static fetcher backed by a mock transport."""
+    return StaticFetcher(transport=httpx.MockTransport(handler))
+
+
+class TestExtractItems:
+    """Tests for extract_items."""
+
+    def test_extracts_platform_config(self):
+        """Test extraction with the Djinni adapter config."""
+        items = extract_items(
+            DJINNI_HTML, DjinniAdapter().get_extraction_config(), base_url="https://djinni.co/jobs/?page=1"
+        )
+
+        assert len(items) == 2
+        assert items[0]["title"] == "Python Developer"
+        assert items[0]["company"] == "Tech Corp"
+        assert items[0]["salary"] == "$5000-7000"
+        assert items[0]["url"] == "https://djinni.co/jobs/101-python-developer/"
+        assert items[1]["url"] == "https://djinni.co/jobs/102-django/"
+
+    def test_missing_fields_left_out(self):
+        """Test that fields whose selector does not match are omitted."""
+        items = extract_items(DJINNI_HTML, DjinniAdapter().get_extraction_config())
+
+        assert "salary" not in items[1]
+        assert "apply_url" not in items[0]
+
+    def test_text_array_and_default(self):
+        """Test text_array fields and field defaults."""
+        config = {
+            "baseSelector": "div.list-jobs__item",
+            "fields": [
+                {"name": "requirements", "selector": "ul li", "type": "text_array"},
+                {"name": "remote", "selector": "span.remote", "type": "text", "default": "no"},
+            ],
+        }
+
+        items = extract_items(DJINNI_HTML, config)
+
+        assert items[0] == {"requirements": ["Python"], "remote": "no"}
+
+    def test_empty_html(self):
+        """Test that empty HTML yields no items."""
+        assert extract_items("  ", DjinniAdapter().get_extraction_config()) == []
+
+
+class TestStaticFetcher:
+    """Tests for StaticFetcher."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_items(self):
+        """Test fetching and extracting a page."""
+        fetcher = mock_fetcher(lambda request: httpx.Response(200, text=DJINNI_HTML))
+
+        items = await fetcher.fetch_items("https://djinni.co/jobs/", DjinniAdapter().get_extraction_config())
+        await fetcher.close()
+
+        assert len(items) == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_items_records_stages(self):
+        """Test that the fetch and extraction times are recorded under the platform."""
+        fetcher = mock_fetcher(lambda request: httpx.Response(200, text=DJINNI_HTML))
+
+        await fetcher.fetch_items("https://djinni.co/jobs/", DjinniAdapter().get_extraction_config(), platform="Static")
+        await fetcher.close()
+
+        assert CRAWL_STAGE_SECONDS.labels("Static", "navigate").count == 1
+        assert CRAWL_STAGE_SECONDS.labels("Static", "extract").count == 1
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises_network_error(self):
+        """Test that HTTP error statuses raise NetworkError."""
+        fetcher = mock_fetcher(lambda request: httpx.Response(503))
+
+        with pytest.raises(NetworkError) as exc_info:
+            await fetcher.fetch("https://djinni.co/jobs/")
+
+        assert exc_info.value.details["status_code"] == 503
+
+    @pytest.mark.asyncio
+    async def test_transport_error_raises_network_error(self):
+        """Test that connection failures raise NetworkError."""
+
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        with pytest.raises(NetworkError):
+            await mock_fetcher(handler).fetch("https://djinni.co/jobs/")
+
+
+class TestClientStaticPath:
+    """Tests for the static path in JobScraperClient."""
+
+    @pytest.fixture
+    def browser(self, mocker: MockerFixture):
+        """Mock browser returning one posting."""
+
+        class MockCrawler:
+            def __init__(self):
+                self.calls = 0
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+            async def arun(self, url, config):
+                self.calls += 1
+
+                async def gen():
+                    yield {
+                        "success": True,
+                        "content": [
+                            {
+                                "title": "Rendered Job",
+                                "company": "Tech Corp",
+                                "location": "Kyiv",
+                                "description": "Rendered by the browser",
+                                "requirements": ["Python"],
+                                "url": "https://djinni.co/jobs/200/",
+                            }
+                        ],
+                    }
+
+                return gen()
+
+        crawler = MockCrawler()
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=crawler)
+        return crawler
+
+    @pytest.mark.asyncio
+    async def test_static_page_skips_browser(self, browser, mocker: MockerFixture):
+        """Test that static listings are used without launching a browser."""
+        client = JobScraperClient()
+        mocker.patch.object(
+            client.static_fetcher,
+            "fetch_items",
+            return_value=[
+                {
+                    "title": "Static Job",
+                    "company": "Tech Corp",
+                    "location": "Kyiv",
+                    "description": "Fetched over HTTP",
+                    "requirements": ["Python"],
+                    "url": "https://djinni.co/jobs/100/",
+                }
+            ],
+        )
+
+        jobs = await client.scrape_jobs(
+            url="https://djinni.co/jobs/",
+            platform="Djinni",
+            criteria=SearchFilters(),
+            extraction_config=DjinniAdapter().get_extraction_config(),
+            static_html=True,
+        )
+
+        assert [job.title for job in jobs] == ["Static Job"]
+        assert browser.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_empty_static_page_falls_back_to_browser(self, browser, mocker: MockerFixture):
+        """Test that the browser is used when the static fetch finds no listings."""
+        client = JobScraperClient()
+        mocker.patch.object(client.static_fetcher, "fetch_items", return_value=[])
+
+        jobs = await client.scrape_jobs(
+            url="https://djinni.co/jobs/",
+            platform="Djinni",
+            criteria=SearchFilters(),
+            extraction_config=DjinniAdapter().get_extraction_config(),
+            static_html=True,
+        )
+
+        assert [job.title for job in jobs] == ["Rendered Job"]
+        assert browser.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_static_fetch_falls_back_to_browser(self, browser, mocker: MockerFixture):
+        """Test that the browser is used when the static fetch fails."""
+        client = JobScraperClient()
+        mocker.patch.object(client.static_fetcher, "fetch_items", side_effect=NetworkError("HTTP 403"))
+
+        jobs = await client.scrape_jobs(
+            url="https://djinni.co/jobs/",
+            platform="Djinni",
+            criteria=SearchFilters(),
+            extraction_config=DjinniAdapter().get_extraction_config(),
+            static_html=True,
+        )
+
+        assert len(jobs) == 1
+        assert browser.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_throttled_static_fetch_not_rendered(self, browser, mocker: MockerFixture):
+        """Test that a throttled static fetch fails the page instead of hitting the site again with a browser."""
+        client = JobScraperClient()
+        mocker.patch.object(client.static_fetcher, "fetch_items", side_effect=RateLimitError("HTTP 429"))
+
+        with pytest.raises(RateLimitError):
+            await client.scrape_jobs(
+                url="https://djinni.co/jobs/",
+                platform="Djinni",
+                criteria=SearchFilters(),
+                extraction_config=DjinniAdapter().get_extraction_config(),
+                static_html=True,
+            )
+
+        assert browser.calls == 0
@@ -0,0 +1,115 @@
+"""Tests for the extraction strategy registry."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.job_search_ai_assistant.collectors.crawl4ai.extractors import JobExtractionStrategy, LxmlExtractionStrategy
+from src.job_search_ai_assistant.collectors.crawl4ai.strategies import StrategyRegistry
+from src.job_search_ai_assistant.collectors.platforms import DjinniAdapter, DOUAdapter, LinkedInAdapter, WorkUaAdapter
+
+ADAPTERS = (DjinniAdapter(), DOUAdapter(), LinkedInAdapter(), WorkUaAdapter())
+
+
+# One listing page per platform, matching the selectors of its adapter
+PAGES = {
+    "Djinni": '<div class="list-jobs__item"><div class="job-list-item__title"><a href="/jobs/1/">Djinni Job</a></div></div>',
+    "DOU": '<ul><li class="l-vacancy"><div class="title"><a href="/vacancies/1/">DOU Job</a></div></li></ul>',
+    "LinkedIn": (
+        '<div class="jobs-search__results-list"><ul><li class="jobs-search-results__list-item">'
+        '<h3 class="base-search-card__title">LinkedIn Job</h3></li></ul></div>'
+    ),
+    "Work.ua": '<div id="pjax-job-list"><div class="job-link"><h2><a href="/jobs/1/">Work.ua Job</a></h2></div></div>',
+}
+
+
+class TestStrategyRegistry:
+    """Tests for StrategyRegistry."""
+
+    def test_registered_configs_compiled_on_first_lookup(self):
+        """Test that registered configs are compiled together when the first strategy is needed."""
+        configs = [adapter.get_extraction_config() for adapter in ADAPTERS]
+        registry = StrategyRegistry(configs)
+        assert len(registry) == 0
+
+        strategy = registry.get(configs[0])
+
+        assert isinstance(strategy, LxmlExtractionStrategy)
+        assert len(registry) == len(ADAPTERS)
+        assert registry.get(DOUAdapter().get_extraction_config()) is registry.get(configs[1])
+
+    def test_beautifulsoup_strategies(self):
+        """Test that a non-native registry compiles crawl4ai's BeautifulSoup-based strategies."""
+        registry = StrategyRegistry(native=False)
+
+        assert isinstance(registry.get(DjinniAdapter().get_extraction_config()), JobExtractionStrategy)
+
+    def test_equal_configs_share_strategy(self):
+        """Test that a lookup with an equal config returns the compiled strategy."""
+        registry = StrategyRegistry()
+        config = DjinniAdapter().get_extraction_config()
+
+        strategy = registry.get(config)
+
+        assert registry.get(DjinniAdapter().get_extraction_config()) is strategy
+        assert registry.get({**config, "baseSelector": "li.other"}) is not strategy
+
+    def test_config_copied(self):
+        """Test that changing a config after registering it does not change its strategy."""
+        config = DjinniAdapter().get_extraction_config()
+        registry = StrategyRegistry([config])
+        base_selector = config["baseSelector"]
+
+        config["baseSelector"] = "li.other"
+
+        assert registry.get(DjinniAdapter().get_extraction_config()).schema["baseSelector"] == base_selector
+
+    def test_concurrent_lookups_compile_once(self):
+        """Test that threads looking up a new config at the same time get one strategy."""
+        registry = StrategyRegistry()
+        config = DOUAdapter().get_extraction_config()
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            strategies = set(map(id, executor.map(lambda _: registry.get(config), range(64))))
+
+        assert len(strategies) == 1
+        assert len(registry) == 1
+
+    def test_concurrent_cross_platform_extraction(self):
+        """Test that shared strategies extract pages of different platforms concurrently."""
+        configs = {adapter.config.name: adapter.get_extraction_config() for adapter in ADAPTERS}
+        registry = StrategyRegistry(configs.values())
+
+        def extract(platform: str) -> str:
+            items = registry.get(configs[platform]).run("https://example.com", [PAGES[platform]])
+            return items[0]["title"]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            titles = list(executor.map(extract, list(PAGES) * 25))
+
+        assert titles == [f"{platform} Job" for platform in PAGES] * 25
+
+
+class TestBenchmark:
+    """Benchmark of shared strategies against building one per scrape."""
+
+    @pytest.mark.benchmark
+    def test_lookup_faster_than_reconfiguring(self):
+        """Test that looking up a compiled strategy is cheaper than building a strategy per scrape."""
+        configs = [adapter.get_extraction_config() for adapter in ADAPTERS]
+        registry = StrategyRegistry(configs)
+        rounds = 500
+
+        started = time.perf_counter()
+        for i in range(rounds):
+            JobExtractionStrategy(configs[i % len(configs)])
+        build_us = (time.perf_counter() - started) / rounds * 1e6
+
+        registry.get(configs[0])
+        started = time.perf_counter()
+        for i in range(rounds):
+            registry.get(configs[i % len(configs)])
+        lookup_us = (time.perf_counter() - started) / rounds * 1e6
+
+        assert lookup_us < build_us
@@ -0,0 +1,203 @@
+"""Tests for streaming scrape results."""
+
+import asyncio
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.job_search_ai_assistant.api.schemas.search import SearchFilters
+from src.job_search_ai_assistant.collectors.crawl4ai.client import JobScraperClient
+from src.job_search_ai_assistant.collectors.crawl4ai.pagination import PaginationConfig
+from src.job_search_ai_assistant.collectors.crawl4ai.streaming import buffered
+
+
+async def count_up(limit: int, produced: list, error: Exception | None = None):
+    """Async iterator over 0..limit-1 that records every produced item."""
+    for i in range(limit):
+        produced.append(i)
+        yield i
+    if error is not None:
+        raise error
+
+
+class TestBuffered:
+    """Tests for buffered."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_order(self):
+        """Test that items arrive in production order."""
+        assert [item async for item in buffered(count_up(10, []), 3)] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_error_after_items(self):
+        """Test that a producer error is raised after the items produced before it."""
+        received = []
+
+        with pytest.raises(RuntimeError, match="boom"):
+            async for item in buffered(count_up(3, [], RuntimeError("boom")), 2):
+                received.append(item)
+
+        assert received == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self):
+        """Test that the producer pauses once the buffer is full."""
+        produced: list[int] = []
+        items = buffered(count_up(100, produced), 2)
+
+        assert await items.__anext__() == 0
+        await asyncio.sleep(0.01)
+
+        # One item handed out, two buffered and one waiting to be put
+        assert len(produced) <= 4
+        await items.aclose()
+
+    @pytest.mark.asyncio
+    async def test_early_stop_cancels_producer(self):
+        """Test that closing the consumer stops the producer."""
+        closed = asyncio.Event()
+
+        async def endless():
+            try:
+                while True:
+                    yield 1
+                    await asyncio.sleep(0)
+            finally:
+                closed.set()
+
+        items = buffered(endless(), 1)
+        await items.__anext__()
+        await items.aclose()
+
+        assert closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_early_stop_closes_source(self):
+        """Test that a source suspended at a yield while the buffer is full is closed."""
+        closed = asyncio.Event()
+
+        async def listings():
+            try:
+                for i in range(100):
+                    yield i
+            finally:
+                closed.set()
+
+        items = buffered(listings(), 1)
+        await items.__anext__()
+        await asyncio.sleep(0)
+        await items.aclose()
+
+        assert closed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_invalid_size(self):
+        """Test that an unbounded buffer is rejected."""
+        with pytest.raises(ValueError):
+            await buffered(count_up(1, []), 0).__anext__()
+
+
+class TestStreamJobs:
+    """Tests for JobScraperClient.stream_jobs."""
+
+    @pytest.fixture
+    def crawler(self, mocker: MockerFixture):
+        """Mock crawler whose pages after the first are slow."""
+
+        class MockCrawler:
+            def __init__(self):
+                self.urls = []
+                self.finished = []
+                self.cancelled = []
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+            async def arun(self, url, config):
+                self.urls.append(url)
+                number = int(parse_qs(urlparse(url).query)["page"][0])
+                if number > 1:
+                    try:
+                        await asyncio.sleep(0.3)
+                    except asyncio.CancelledError:
+                        self.cancelled.append(number)
+                        raise
+                self.finished.append(number)
+
+                async def gen():
+                    yield {
+                        "success": True,
+                        "content": [
+                            {
+                                "title": f"Python Developer {number}",
+                                "company": "Tech Corp",
+                                "location": "Kyiv",
+                                "description": "Python developer needed",
+                                "requirements": ["Python"],
+                                "url": f"https://example.com/job/{number}",
+                            }
+                        ]
+                        if number <= 3
+                        else [],
+                    }
+
+                return gen()
+
+        crawler = MockCrawler()
+        mocker.patch("crawl4ai.AsyncWebCrawler", return_value=crawler)
+        return crawler
+
+    @pytest.mark.asyncio
+    async def test_first_posting_before_crawl_completes(self, crawler):
+        """Test that postings of the first page are yielded before later pages finish."""
+        client = JobScraperClient()
+        arrivals = []
+
+        async for job in client.stream_jobs(
+            url="https://djinni.co/jobs/?page=1",
+            platform="Djinni",
+            criteria=SearchFilters(),
+            pagination=PaginationConfig(max_pages=4, concurrency=3),
+        ):
+            arrivals.append((job.title, list(crawler.finished)))
+
+        # The first posting is handed out while the later pages are still loading
+        assert arrivals[0] == ("Python Developer 1", [1])
+        assert [title for title, _ in arrivals] == [f"Python Developer {number}" for number in (1, 2, 3)]
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_skips_remaining_pages(self, crawler):
+        """Test that a consumer that stops after the first posting does not wait for the crawl."""
+        client = JobScraperClient()
+
+        jobs = client.stream_jobs(
+            url="https://djinni.co/jobs/?page=1",
+            platform="Djinni",
+            criteria=SearchFilters(),
+            pagination=PaginationConfig(max_pages=4, concurrency=3),
+        )
+        first = await jobs.__anext__()
+        await jobs.aclose()
+
+        assert first.title == "Python Developer 1"
+        # No later page was loaded, and none is left loading
+        assert crawler.finished == [1]
+        assert len(crawler.urls) == len(crawler.finished) + len(crawler.cancelled)
+
+    @pytest.mark.asyncio
+    async def test_filters_applied(self, crawler):
+        """Test that streamed postings are filtered by the criteria."""
+        client = JobScraperClient()
+
+        jobs = [
+            job
+            async for job in client.stream_jobs(
+                url="https://djinni.co/jobs/?page=1", platform="Djinni", criteria=SearchFilters(location="Lviv")
+            )
+        ]
+
+        assert jobs == []
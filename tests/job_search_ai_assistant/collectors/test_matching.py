@@ -0,0 +1,154 @@
+"""Tests for the compiled text filters of search criteria."""
+
+import random
+import time
+
+import pytest
+
+from src.job_search_ai_assistant.api.schemas.search import SearchFilters
+from src.job_search_ai_assistant.collectors.crawl4ai.models import JobPosting
+from src.job_search_ai_assistant.collectors.matching import (
+    REGEX_MIN_TERMS,
+    REMOTE_TERMS,
+    JobMatcher,
+    TermMatcher,
+    compile_terms,
+)
+
+
+def make_job(title: str, description: str, location: str = "Kyiv, Ukraine") -> JobPosting:
+    """Create a job posting without running validation."""
+    return JobPosting.model_construct(
+        title=title,
+        company="Tech Corp",
+        location=location,
+        description=description,
+        requirements=["Python"],
+        url="https://example.com/job",
+    )
+
+
+def test_compile_terms():
+    """Test that terms are matched in folded text and compiled once per set of terms."""
+    matcher = compile_terms(("Go", "GOLANG"))
+
+    assert matcher.search("senior golang developer")
+    assert not matcher.search("java developer")
+    assert compile_terms(("Go", "GOLANG")) is matcher
+
+
+def test_many_terms_use_regex():
+    """Test that large term sets are matched with one regex pass."""
+    terms = tuple(f"skill{i}" for i in range(REGEX_MIN_TERMS))
+    matcher = TermMatcher(terms)
+
+    assert matcher.pattern is not None
+    assert matcher.search("needs skill7 and more")
+    assert not TermMatcher(terms[:2]).search("needs skill7")
+
+
+class TestJobMatcher:
+    """Tests for JobMatcher."""
+
+    def test_keywords_in_title_or_description(self):
+        """Test that a keyword may appear in the title or the description."""
+        matcher = JobMatcher.from_criteria(SearchFilters(keywords=["FastAPI", "Django"]))
+
+        assert matcher.matches(make_job("Django Developer", "Backend work"))
+        assert matcher.matches(make_job("Backend Developer", "We use FASTAPI"))
+        assert not matcher.matches(make_job("Java Developer", "Spring Boot"))
+
+    def test_remote_terms(self):
+        """Test that Ukrainian remote terms match regardless of case."""
+        matcher = JobMatcher.from_criteria(SearchFilters(remote=True))
+
+        assert matcher.matches(make_job("Developer", "Робота Віддалено"))
+        assert matcher.matches(make_job("Developer", "Дистанційно чи в офісі"))
+        assert not matcher.matches(make_job("Remote Developer", "Office only"))
+
+    def test_location(self):
+        """Test that the location is matched as a case-insensitive substring."""
+        matcher = JobMatcher.from_criteria(SearchFilters(location="київ"))
+
+        assert matcher.matches(make_job("Developer", "Backend", location="Київ, Україна"))
+        assert not matcher.matches(make_job("Developer", "Backend", location="Lviv"))
+
+    def test_inactive(self):
+        """Test that criteria without text filters build an inactive matcher."""
+        assert not JobMatcher.from_criteria(SearchFilters(salary_min=3000)).active
+
+    def test_text_folded_once(self):
+        """Test that a posting's text is case-folded once and reused across matchers."""
+        job = make_job("Python Developer", "Remote Python work")
+
+        assert job.folded_description is job.folded_description
+        assert JobMatcher.from_criteria(SearchFilters(keywords=["python"])).matches(job)
+        assert JobMatcher.from_criteria(SearchFilters(remote=True)).matches(job)
+
+
+def naive_filter(jobs: list[JobPosting], criteria: SearchFilters) -> list[JobPosting]:
+    """Keyword and remote filtering as implemented before the compiled matcher."""
+    filtered = jobs
+    if criteria.keywords:
+        filtered = [
+            job
+            for job in filtered
+            if any(
+                keyword.lower() in job.title.lower() or keyword.lower() in job.description.lower()
+                for keyword in criteria.keywords
+            )
+        ]
+    if criteria.remote:
+        filtered = [job for job in filtered if any(term.lower() in job.description.lower() for term in REMOTE_TERMS)]
+    return filtered
+
+
+VOCABULARY = "Build scalable services with our team using modern tools Kubernetes AWS Робота офіс команда"
+
+
+@pytest.fixture(scope="module")
+def postings() -> list[JobPosting]:
+    """Ten thousand postings with descriptions of about 4000 characters."""
+    rng = random.Random(12)  # noqa: S311
+    words = VOCABULARY.split()
+    stacks = ["Python", "Java", "Go", "Rust", "TypeScript", "Kotlin"]
+    jobs = []
+    for i in range(10_000):
+        body = " ".join(rng.choices(words, k=600))
+        stack = rng.choice(stacks)
+        remote = rng.choice(["Remote friendly.", "Віддалено.", "Office only."])
+        jobs.append(make_job(f"{stack} Developer {i}", f"{body} {stack} {remote}"))
+    return jobs
+
+
+class TestBenchmark:
+    """Benchmarks of keyword and remote filtering on 10k postings."""
+
+    CRITERIA = SearchFilters(keywords=["python", "django", "fastapi", "flask", "rust"], remote=True)
+
+    def test_same_results_as_substring_filter(self, postings):
+        """Test that the matcher selects the same postings as the substring filter."""
+        matcher = JobMatcher.from_criteria(self.CRITERIA)
+
+        assert [job for job in postings if matcher.matches(job)] == naive_filter(postings, self.CRITERIA)
+
+    @pytest.mark.benchmark
+    def test_faster_than_substring_filter(self, postings):
+        """Test that compiled matching over text folded once beats lowering text per keyword."""
+        jobs = [job.model_copy() for job in postings]
+        started = time.perf_counter()
+        expected = naive_filter(jobs, self.CRITERIA)
+        naive = time.perf_counter() - started
+
+        started = time.perf_counter()
+        matcher = JobMatcher.from_criteria(self.CRITERIA)
+        cold = [job for job in jobs if matcher.matches(job)]
+        compiled_cold = time.perf_counter() - started
+
+        started = time.perf_counter()
+        warm = [job for job in jobs if matcher.matches(job)]
+        compiled_warm = time.perf_counter() - started
+
+        assert cold == warm == expected
+        assert compiled_cold < naive
+        assert compiled_warm * 2 < naive
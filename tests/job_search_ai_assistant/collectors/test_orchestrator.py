@@ -0,0 +1,404 @@
+"""Tests for the multi-platform search orchestrator."""
+
+import asyncio
+
+import pytest
+
+from src.job_search_ai_assistant.api.crud import SQLiteJobStore
+from src.job_search_ai_assistant.api.schemas.search import (
+    JobListing,
+    SearchFilters,
+    SearchRequest,
+    SearchResponse,
+    SearchSummary,
+)
+from src.job_search_ai_assistant.collectors.crawl4ai.breaker import CircuitBreakerRegistry
+from src.job_search_ai_assistant.collectors.crawl4ai.exceptions import NetworkError, ScrapingError
+from src.job_search_ai_assistant.collectors.crawl4ai.models import PostingRecord
+from src.job_search_ai_assistant.collectors.orchestrator import SearchOrchestrator, to_job_listing
+from src.job_search_ai_assistant.collectors.platforms import PaginationStyle
+
+
+def make_posting(platform: str, index: int = 1) -> PostingRecord:
+    """Create a job posting for the given platform."""
+    return PostingRecord(
+        title=f"Python Developer {index}",
+        company="Tech Corp",
+        location="Kyiv",
+        description="Python developer needed",
+        requirements=["Python"],
+        url=f"https://example.com/{platform}/{index}",
+        platform=platform,
+    )
+
+
+class FakeScraperClient:
+    """Scraper client stand-in with configurable per-platform latency."""
+
+    def __init__(self, delays: dict[str, float] | None = None, failing: set[str] | None = None, pages: int = 1):
+        self.delays = delays or {}
+        self.pages = pages
+        self.cancelled: set[str] = set()
+        self.failing = failing or set()
+        self.calls: list[dict] = []
+        self.running: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.total_running = 0
+        self.total_peak = 0
+        self.breakers = CircuitBreakerRegistry()
+
+    async def scrape_jobs(self, url, platform, criteria, **options):
+        self.calls.append({"url": url, "platform": platform, **options})
+        self.running[platform] = self.running.get(platform, 0) + 1
+        self.total_running += 1
+        self.peak[platform] = max(self.peak.get(platform, 0), self.running[platform])
+        self.total_peak = max(self.total_peak, self.total_running)
+        try:
+            await asyncio.sleep(self.delays.get(platform, 0.01))
+            if platform in self.failing:
+                raise ScrapingError(message=f"{platform} down", error_type="NETWORK_ERROR")
+            return [make_posting(platform)]
+        except asyncio.CancelledError:
+            self.cancelled.add(platform)
+            raise
+        finally:
+            self.running[platform] -= 1
+            self.total_running -= 1
+
+    async def stream_jobs(self, url, platform, criteria, **options):
+        self.calls.append({"url": url, "platform": platform, **options})
+        for page in range(1, self.pages + 1):
+            try:
+                await asyncio.sleep(self.delays.get(platform, 0.01))
+            except asyncio.CancelledError:
+                self.cancelled.add(platform)
+                raise
+            if platform in self.failing:
+                raise ScrapingError(message=f"{platform} down", error_type="NETWORK_ERROR")
+            yield make_posting(platform, page)
+
+
+class TestSearchOrchestrator:
+    """Tests for SearchOrchestrator."""
+
+    def test_resolve_all_platforms(self):
+        """Test that "all" expands to every adapter."""
+        orchestrator = SearchOrchestrator(FakeScraperClient())
+
+        assert orchestrator.resolve_platforms(["all"]) == ["linkedin", "djinni", "dou", "workua"]
+
+    def test_resolve_platforms_deduplicates(self):
+        """Test that platforms are case-insensitive and deduplicated."""
+        orchestrator = SearchOrchestrator(FakeScraperClient())
+
+        assert orchestrator.resolve_platforms(["DOU", "dou", "all"]) == ["dou", "linkedin", "djinni", "workua"]
+
+    def test_resolve_unknown_platform(self):
+        """Test that unknown platforms are rejected."""
+        orchestrator = SearchOrchestrator(FakeScraperClient())
+
+        with pytest.raises(ValueError, match="Unknown platform: indeed"):
+            orchestrator.resolve_platforms(["indeed"])
+
+    @pytest.mark.asyncio
+    async def test_search_merges_results(self):
+        """Test that results of all platforms are merged into one response."""
+        client = FakeScraperClient()
+        orchestrator = SearchOrchestrator(client)
+
+        response = await orchestrator.search(SearchRequest(query="python developer"))
+
+        assert isinstance(response, SearchResponse)
+        assert response.total_count == 4
+        assert response.platforms == ["linkedin", "djinni", "dou", "workua"]
+        assert {job.source for job in response.jobs} == set(response.platforms)
+        assert all(call["extraction_config"]["baseSelector"] for call in client.calls)
+
+    @pytest.mark.asyncio
+    async def test_search_builds_platform_urls(self):
+        """Test that each platform URL is built by its adapter."""
+        client = FakeScraperClient()
+        orchestrator = SearchOrchestrator(client)
+
+        await orchestrator.search(
+            SearchRequest(query="python", platforms=["djinni"], filters=SearchFilters(location="Київ"))
+        )
+
+        assert client.calls[0]["url"] == "https://djinni.co/jobs/?primary_keyword=python&page=1&location=kyiv"
+        assert client.calls[0]["wait_for"] == "div.list-jobs"
+        assert client.calls[0]["pagination"].style == PaginationStyle.NUMBERED
+        assert client.calls[0]["pagination"].max_pages == 10
+        assert client.calls[0]["cache_policy"].ttl == 120.0
+        assert client.calls[0]["static_html"] is True
+        assert client.calls[0]["rate_limit"].rate == 2.0
+
+    @pytest.mark.asyncio
+    async def test_latency_set_by_slowest_platform(self):
+        """Test that platforms are scraped concurrently rather than one after another."""
+        delays = {"LinkedIn": 0.2, "Djinni": 0.2, "DOU": 0.2, "Work.ua": 0.2}
+        client = FakeScraperClient(delays=delays)
+        orchestrator = SearchOrchestrator(client)
+
+        await orchestrator.search(SearchRequest(query="python"))
+
+        assert client.total_peak == len(delays)
+
+    @pytest.mark.asyncio
+    async def test_failed_platform_returns_partial_results(self):
+        """Test that a failing platform does not fail the whole search."""
+        orchestrator = SearchOrchestrator(FakeScraperClient(failing={"LinkedIn"}))
+
+        results = await orchestrator.search_platforms(SearchRequest(query="python"))
+
+        failed = [result for result in results if not result.ok]
+        assert [result.platform for result in failed] == ["linkedin"]
+        assert "linkedin down" in failed[0].error.lower()
+        assert sum(len(result.jobs) for result in results) == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_leaves_out_slow_platforms(self):
+        """Test that platforms still running at the deadline are reported as timed out."""
+        client = FakeScraperClient(delays={"LinkedIn": 5.0})
+        orchestrator = SearchOrchestrator(client)
+
+        results = await orchestrator.search_platforms(SearchRequest(query="python"), timeout=0.2)
+
+        assert client.cancelled == {"LinkedIn"}
+        assert results[0].error == "Timed out after 0.2s"
+        assert [result.ok for result in results[1:]] == [True, True, True]
+        assert sum(len(result.jobs) for result in results) == 3
+
+    @pytest.mark.asyncio
+    async def test_latency_histogram_logged(self, caplog):
+        """Test that every search records and logs the latency of each platform."""
+        orchestrator = SearchOrchestrator(FakeScraperClient())
+
+        with caplog.at_level("INFO", logger="job_search_ai"):
+            await orchestrator.search(SearchRequest(query="python", platforms=["dou"]))
+            await orchestrator.search(SearchRequest(query="python", platforms=["dou"]))
+
+        assert orchestrator.latency.labels("dou").count == 2
+        assert "Search on dou: 1 postings" in caplog.text
+        assert "<=0.5:2" in caplog.text
+
+    def test_platform_key(self):
+        """Test that platform names stored on postings map back to platform keys."""
+        orchestrator = SearchOrchestrator(FakeScraperClient())
+
+        assert orchestrator.platform_key("Work.ua") == "workua"
+        assert orchestrator.platform_key("Indeed") == "indeed"
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_platform(self):
+        """Test that a platform with an open circuit is skipped without scraping."""
+        client = FakeScraperClient(delays={"LinkedIn": 1.0})
+        for _ in range(client.breakers.config.failure_threshold):
+            client.breakers.get("LinkedIn").record_failure(NetworkError("timeout"))
+        orchestrator = SearchOrchestrator(client)
+
+        results = await orchestrator.search_platforms(SearchRequest(query="python"))
+
+        assert "LinkedIn" not in {call["platform"] for call in client.calls}
+        assert "unavailable" in results[0].error
+        assert sum(len(result.jobs) for result in results) == 3
+
+    @pytest.mark.asyncio
+    async def test_results_saved_to_store(self, tmp_path):
+        """Test that postings of successful platforms are persisted."""
+        async with SQLiteJobStore(tmp_path / "jobs.db") as store:
+            orchestrator = SearchOrchestrator(FakeScraperClient(failing={"LinkedIn"}), store=store)
+
+            await orchestrator.search(SearchRequest(query="python"))
+
+            assert await store.count() == 3
+            assert await store.get("https://example.com/DOU/1") is not None
+
+    @pytest.mark.asyncio
+    async def test_store_failure_keeps_results(self, tmp_path):
+        """Test that a storage failure does not fail the search."""
+        store = SQLiteJobStore(tmp_path / "jobs.db")  # Never opened
+        orchestrator = SearchOrchestrator(FakeScraperClient(), store=store)
+
+        response = await orchestrator.search(SearchRequest(query="python"))
+
+        assert response.total_count == 4
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_cap(self):
+        """Test that the global cap limits scrapes across platforms."""
+        client = FakeScraperClient()
+        orchestrator = SearchOrchestrator(client, max_concurrency=2)
+
+        await orchestrator.search(SearchRequest(query="python"))
+
+        assert client.total_peak == 2
+
+    @pytest.mark.asyncio
+    async def test_platform_concurrency_cap(self):
+        """Test that the per-platform cap limits concurrent scrapes of one platform."""
+        client = FakeScraperClient()
+        orchestrator = SearchOrchestrator(client, platform_concurrency={"dou": 1})
+        requests = [SearchRequest(query=query, platforms=["dou"]) for query in ("python", "go", "java", "rust")]
+
+        await asyncio.gather(*(orchestrator.search(request) for request in requests))
+
+        assert client.peak["DOU"] == 1
+        assert len(client.calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_identical_searches_share_crawl(self, tmp_path):
+        """Test that concurrent identical searches run one crawl and all get its postings."""
+        client = FakeScraperClient(delays={"DOU": 0.1})
+        async with SQLiteJobStore(tmp_path / "jobs.db") as store:
+            orchestrator = SearchOrchestrator(client, store=store)
+            request = SearchRequest(query="python", platforms=["dou"], filters=SearchFilters(location="Kyiv"))
+
+            responses = await asyncio.gather(*(orchestrator.search(request) for _ in range(5)))
+
+        assert len(client.calls) == 1
+        assert [response.total_count for response in responses] == [1] * 5
+
+    @pytest.mark.asyncio
+    async def test_different_criteria_not_shared(self):
+        """Test that searches of the same URL with different filters crawl separately."""
+        client = FakeScraperClient()
+        orchestrator = SearchOrchestrator(client)
+        requests = [
+            SearchRequest(query="python", platforms=["dou"], filters=SearchFilters(salary_min=salary))
+            for salary in (1000, 5000)
+        ]
+
+        await asyncio.gather(*(orchestrator.search(request) for request in requests))
+
+        assert len(client.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_search_url_parameters_not_dropped(self, monkeypatch):
+        """Test that search URLs differing only in a parameter that tracks job links crawl separately."""
+        client = FakeScraperClient()
+        orchestrator = SearchOrchestrator(client)
+        adapter = orchestrator.adapters["dou"]
+        monkeypatch.setattr(
+            adapter,
+            "build_search_url",
+            lambda keywords, location=None: f"https://jobs.dou.ua/vacancies/?from={keywords[0]}",
+        )
+        requests = [SearchRequest(query=query, platforms=["dou"]) for query in ("first", "second")]
+
+        await asyncio.gather(*(orchestrator.search(request) for request in requests))
+
+        assert sorted(call["url"] for call in client.calls) == [
+            "https://jobs.dou.ua/vacancies/?from=first",
+            "https://jobs.dou.ua/vacancies/?from=second",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_timed_out_search_keeps_shared_crawl(self):
+        """Test that one search timing out does not cancel the crawl another search waits on."""
+        client = FakeScraperClient(delays={"DOU": 0.3})
+        orchestrator = SearchOrchestrator(client)
+        request = SearchRequest(query="python", platforms=["dou"])
+
+        impatient, patient = await asyncio.gather(
+            orchestrator.search_platforms(request, timeout=0.1), orchestrator.search_platforms(request)
+        )
+
+        assert impatient[0].error == "Timed out after 0.1s"
+        assert len(patient[0].jobs) == 1
+        assert len(client.calls) == 1
+
+
+class TestStream:
+    """Tests for streamed searches of SearchOrchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_listings_before_slow_platforms(self):
+        """Test that listings of fast platforms arrive before slow platforms finish."""
+        client = FakeScraperClient(delays={"LinkedIn": 0.3}, pages=2)
+        orchestrator = SearchOrchestrator(client)
+
+        events = [event async for event in orchestrator.stream(SearchRequest(query="python"))]
+
+        assert {event.source for event in events[:6]} == {"djinni", "dou", "workua"}
+        assert all(isinstance(event, JobListing) for event in events[:-1])
+        assert events[-2].source == "linkedin"
+        summary = events[-1]
+        assert isinstance(summary, SearchSummary)
+        assert summary.total_count == len(events) - 1 == 8
+        assert [(status.platform, status.count) for status in summary.platforms] == [
+            ("linkedin", 2),
+            ("djinni", 2),
+            ("dou", 2),
+            ("workua", 2),
+        ]
+        assert summary.platforms[0].elapsed >= 0.6
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts_in_summary(self, tmp_path):
+        """Test that failed and timed out platforms are reported and others still stored."""
+        client = FakeScraperClient(delays={"LinkedIn": 5.0}, failing={"DOU"})
+        async with SQLiteJobStore(tmp_path / "jobs.db") as store:
+            orchestrator = SearchOrchestrator(client, store=store)
+
+            events = [event async for event in orchestrator.stream(SearchRequest(query="python"), timeout=0.2)]
+
+            assert await store.count() == 2
+
+        statuses = {status.platform: status for status in events[-1].platforms}
+        assert statuses["linkedin"].error == "Timed out after 0.2s"
+        assert "DOU down" in statuses["dou"].error
+        assert statuses["djinni"].error is None
+        assert events[-1].total_count == 2
+        assert orchestrator.latency.labels("linkedin").count == 1
+
+    @pytest.mark.asyncio
+    async def test_timed_out_platform_counts_streamed_listings(self):
+        """Test that listings sent before a platform timed out are counted in the summary."""
+        client = FakeScraperClient(delays={"LinkedIn": 0.15}, pages=3)
+        orchestrator = SearchOrchestrator(client)
+
+        events = [event async for event in orchestrator.stream(SearchRequest(query="python"), timeout=0.25)]
+
+        listings, summary = events[:-1], events[-1]
+        statuses = {status.platform: status for status in summary.platforms}
+        assert statuses["linkedin"].error == "Timed out after 0.25s"
+        assert statuses["linkedin"].count == sum(listing.source == "linkedin" for listing in listings) == 1
+        assert summary.total_count == len(listings) == 10
+
+    @pytest.mark.asyncio
+    async def test_reader_leaving_cancels_crawls(self):
+        """Test that closing the stream early cancels the platforms still crawling."""
+        client = FakeScraperClient(delays={"LinkedIn": 5.0})
+        orchestrator = SearchOrchestrator(client)
+        stream = orchestrator.stream(SearchRequest(query="python"))
+
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert client.cancelled == {"LinkedIn"}
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_in_summary(self):
+        """Test that a platform with an open circuit is reported without crawling."""
+        client = FakeScraperClient()
+        for _ in range(client.breakers.config.failure_threshold):
+            client.breakers.get("DOU").record_failure(NetworkError("timeout"))
+        orchestrator = SearchOrchestrator(client)
+
+        events = [event async for event in orchestrator.stream(SearchRequest(query="python", platforms=["dou"]))]
+
+        assert len(events) == 1
+        assert "unavailable" in events[0].platforms[0].error
+        assert client.calls == []
+
+
+def test_to_job_listing():
+    """Test mapping a scraped posting to the API schema."""
+    posting = make_posting("DOU")
+
+    listing = to_job_listing(posting, "dou")
+
+    assert listing.source == "dou"
+    assert listing.title == posting.title
+    assert listing.url is posting.url
+    assert listing.id == to_job_listing(posting, "dou").id
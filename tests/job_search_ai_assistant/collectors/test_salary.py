@@ -0,0 +1,95 @@
+"""Tests for salary parsing and filtering."""
+
+import pytest
+
+from src.job_search_ai_assistant.api.schemas.search import SalaryRange, SearchFilters
+from src.job_search_ai_assistant.collectors.salary import Salary, SalaryFilter, SalaryPeriod, parse_salary
+
+MONTH, YEAR, HOUR = SalaryPeriod.MONTH, SalaryPeriod.YEAR, SalaryPeriod.HOUR
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        # Djinni
+        ("$5000-7000", (5000, 7000, "USD", MONTH)),
+        ("до $4000", (None, 4000, "USD", MONTH)),
+        ("від $3000", (3000, None, "USD", MONTH)),
+        ("3000+ USD", (3000, None, "USD", MONTH)),
+        # DOU
+        ("до 4000 $", (None, 4000, "USD", MONTH)),
+        ("$2500\u20134000", (2500, 4000, "USD", MONTH)),
+        ("від 1500 до 2500 $", (1500, 2500, "USD", MONTH)),
+        # Work.ua
+        ("від 60 000 грн", (60000, None, "UAH", MONTH)),
+        ("25\u202f000 \u2013 35\u202f000 грн", (25000, 35000, "UAH", MONTH)),
+        ("від 30 тис. грн", (30000, None, "UAH", MONTH)),
+        # LinkedIn
+        ("$120,000/yr - $150,000/yr", (120000, 150000, "USD", YEAR)),
+        ("$80k-$120k", (80000, 120000, "USD", YEAR)),
+        ("$80-120K", (80000, 120000, "USD", YEAR)),
+        ("€4.5K/month", (4500, 4500, "EUR", MONTH)),
+        ("$50/hr", (50, 50, "USD", HOUR)),
+        ("$100,000 - $130,000", (100000, 130000, "USD", YEAR)),
+        ("1.500 EUR", (1500, 1500, "EUR", MONTH)),
+    ],
+)
+def test_parse_salary(text, expected):
+    """Test parsing of salary formats used by the supported platforms."""
+    salary = parse_salary(text)
+
+    assert salary is not None
+    assert (salary.min_amount, salary.max_amount, salary.currency, salary.period) == expected
+
+
+@pytest.mark.parametrize("text", [None, "", "Зарплата не вказана", "Competitive"])
+def test_parse_salary_without_amount(text):
+    """Test that texts without an amount are not parsed."""
+    assert parse_salary(text) is None
+
+
+def test_monthly():
+    """Test conversion of annual and hourly amounts to monthly ones."""
+    assert Salary(min_amount=120000, max_amount=150000, period=YEAR).monthly() == (10000, 12500)
+    assert Salary(min_amount=50, period=HOUR).monthly() == (8650, None)
+
+
+class TestSalaryFilter:
+    """Tests for SalaryFilter."""
+
+    def test_no_salary_criteria(self):
+        """Test that criteria without salary bounds build no filter."""
+        assert SalaryFilter.from_criteria(SearchFilters(location="Kyiv")) is None
+
+    def test_combines_monthly_and_annual_bounds(self):
+        """Test that the narrower of the monthly and annual bounds wins."""
+        salary_filter = SalaryFilter.from_criteria(
+            SearchFilters(
+                salary_min=3000,
+                salary_max=9000,
+                salary_range=SalaryRange(min_amount=60000, max_amount=120000, currency="usd"),
+            )
+        )
+
+        assert salary_filter == SalaryFilter(min_monthly=5000, max_monthly=9000, currency="USD")
+
+    @pytest.mark.parametrize(
+        "text,matches",
+        [
+            ("$5000-7000", True),
+            ("до 4000 $", False),
+            ("до 6000 $", True),
+            ("від $3000", False),
+            ("від $5500", True),
+            ("$120,000/yr - $150,000/yr", False),
+            ("$60,000/yr - $70,000/yr", True),
+            ("€6000", False),
+            ("6000", True),
+            (None, False),
+        ],
+    )
+    def test_matches(self, text, matches):
+        """Test that postings match when their salary range overlaps the bounds."""
+        salary_filter = SalaryFilter(min_monthly=5000, max_monthly=9000, currency="USD")
+
+        assert salary_filter.matches(parse_salary(text)) is matches
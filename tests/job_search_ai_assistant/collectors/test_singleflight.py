@@ -0,0 +1,106 @@
+"""Tests for coalescing of concurrent identical calls."""
+
+import asyncio
+
+import pytest
+
+from src.job_search_ai_assistant.collectors.singleflight import SingleFlight
+
+
+class Counter:
+    """Slow call counting how often it was started and cancelled."""
+
+    def __init__(self, delay: float = 0.05, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self):
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.started
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Test that concurrent callers with one key share a single call."""
+        flights = SingleFlight()
+        call = Counter()
+
+        results = await asyncio.gather(*(flights.do("key", call) for _ in range(10)))
+
+        assert results == [1] * 10
+        assert call.started == 1
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Test that callers with different keys each run their call."""
+        flights = SingleFlight()
+        call = Counter()
+
+        await asyncio.gather(flights.do("a", call), flights.do("b", call))
+
+        assert call.started == 2
+
+    @pytest.mark.asyncio
+    async def test_error_shared(self):
+        """Test that every concurrent caller receives the error of the shared call."""
+        flights = SingleFlight()
+        call = Counter(error=ValueError("boom"))
+
+        results = await asyncio.gather(*(flights.do("key", call) for _ in range(3)), return_exceptions=True)
+
+        assert [str(result) for result in results] == ["boom"] * 3
+        assert call.started == 1
+
+    @pytest.mark.asyncio
+    async def test_finished_call_not_reused(self):
+        """Test that a call started after the previous one finished runs again."""
+        flights = SingleFlight()
+        call = Counter(delay=0)
+
+        assert await flights.do("key", call) == 1
+        assert await flights.do("key", call) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_call_for_others(self):
+        """Test that cancelling one caller leaves the call running for the remaining callers."""
+        flights = SingleFlight()
+        call = Counter(delay=0.1)
+        leaving = asyncio.create_task(flights.do("key", call))
+        staying = asyncio.create_task(flights.do("key", call))
+        await asyncio.sleep(0.01)
+
+        leaving.cancel()
+
+        assert await staying == 1
+        assert leaving.cancelled()
+        assert call.cancelled == 0
+
+    @pytest.mark.asyncio
+    async def test_last_caller_cancelled_cancels_call(self):
+        """Test that the call is cancelled once every caller is gone."""
+        flights = SingleFlight()
+        call = Counter(delay=1.0)
+        callers = [asyncio.create_task(flights.do("key", call)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert call.cancelled == 1
+        assert len(flights) == 0
+        assert await flights.do("key", Counter(delay=0)) == 1